@@ -17,7 +17,7 @@ from typing import List, Optional
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import get_settings
-from src.db.sqlite import Database
+from src.db.sqlite import Database, _SELECT_TRADES
 from src.engine.resolution import calculate_early_exit_pnl
 from src.models import TradeRecord
 
@@ -58,8 +58,9 @@ async def main():
     db = await Database.init(settings.DB_PATH)
 
     # Pull all resolved trades since --since with their snapshots
+    # _row_to_trade maps by position, so select through its projection.
     cursor = await db._conn.execute(
-        """SELECT * FROM trade_records
+        _SELECT_TRADES + """
            WHERE action != 'SKIP' AND voided = FALSE
              AND timestamp >= ?
              AND (actual_outcome IS NOT NULL OR exit_type IS NOT NULL)
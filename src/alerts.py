@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import random
+from functools import lru_cache
 from typing import List
 
 import httpx
+import orjson
 import structlog
 
 from src.config import Settings
@@ -11,54 +15,219 @@ from src.models import Portfolio, TradeRecord
 log = structlog.get_logger()
 
 TELEGRAM_API = "https://api.telegram.org"
+_JSON_HEADERS = httpx.Headers({"content-type": "application/json"})
+
+# Shared client so consecutive alerts reuse the keep-alive TLS connection
+# to api.telegram.org instead of re-handshaking on every POST.
+_client: httpx.AsyncClient | None = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared Telegram HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared Telegram HTTP client (called on bot shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@lru_cache(maxsize=4)
+def _send_url(token: str) -> httpx.URL:
+    # Pre-parsed once per token; httpx skips re-parsing when handed a URL.
+    return httpx.URL(f"{TELEGRAM_API}/bot{token}/sendMessage")
+
+
+@lru_cache(maxsize=4)
+def _payload_base(chat_id: str) -> dict:
+    """Static part of the sendMessage body; callers copy it and add ``text``."""
+    return {"chat_id": chat_id, "parse_mode": "HTML"}
+
+
+ALERT_MAX_ATTEMPTS = 3
+_RETRY_BASE_SECONDS = 0.2
+_RETRY_MAX_SECONDS = 2.0
+_RETRY_AFTER_CAP_SECONDS = 10.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter: U(0, min(max, base * 2^attempt))."""
+    return random.uniform(0.0, min(_RETRY_MAX_SECONDS, _RETRY_BASE_SECONDS * (2 ** attempt)))
+
+
+def _retry_after(resp: httpx.Response) -> float | None:
+    """Seconds requested by a 429's Retry-After header, capped; None if absent."""
+    try:
+        return min(float(resp.headers["Retry-After"]), _RETRY_AFTER_CAP_SECONDS)
+    except (KeyError, ValueError):
+        return None
+
+
+async def _post_alert(message: str, settings: Settings) -> None:
+    """POST a single message to Telegram, retrying 429/5xx and transport errors.
+
+    Gives up after ALERT_MAX_ATTEMPTS and logs; never raises for transport
+    failures.
+    """
+    payload = _payload_base(settings.TELEGRAM_CHAT_ID).copy()
+    payload["text"] = message
+    body = orjson.dumps(payload)
+    url = _send_url(settings.TELEGRAM_BOT_TOKEN)
+    client = await get_client()
+
+    error: object = None
+    for attempt in range(ALERT_MAX_ATTEMPTS):
+        delay: float | None = None
+        try:
+            resp = await client.post(url, content=body, headers=_JSON_HEADERS)
+        except (httpx.HTTPError, asyncio.TimeoutError) as e:
+            # Pass the exception itself; the JSON renderer only stringifies it
+            # if the record is actually emitted.
+            error = e
+        else:
+            status = resp.status_code
+            if status != 429 and status < 500:
+                return
+            error = f"http_{status}"
+            if status == 429:
+                delay = _retry_after(resp)
+        if attempt + 1 < ALERT_MAX_ATTEMPTS:
+            await asyncio.sleep(delay if delay is not None else _backoff_delay(attempt))
+
+    log.warning("telegram_alert_failed", error=error, attempts=ALERT_MAX_ATTEMPTS)
+
+
+# ---------------------------------------------------------------------------
+# Coalescing queue: alerts fired within one window go out as one sendMessage
+# ---------------------------------------------------------------------------
+
+ALERT_COALESCE_WINDOW_SECONDS = 0.25
+ALERT_MAX_BATCH_CHARS = 4000  # Telegram caps sendMessage text at 4096 chars
+
+_queue: asyncio.Queue[str | None] | None = None
+_drain_task: asyncio.Task | None = None
+
+
+async def _drain_loop(settings: Settings) -> None:
+    """Pull queued alerts, merge those arriving within the window, and POST.
+
+    A ``None`` sentinel flushes whatever is buffered and ends the loop.
+    """
+    assert _queue is not None
+    carry: str | None = None
+    while True:
+        batch = carry if carry is not None else await _queue.get()
+        carry = None
+        if batch is None:
+            return
+        await asyncio.sleep(ALERT_COALESCE_WINDOW_SECONDS)
+        stop = False
+        while True:
+            try:
+                nxt = _queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if nxt is None:
+                stop = True
+                break
+            if len(batch) + 2 + len(nxt) > ALERT_MAX_BATCH_CHARS:
+                carry = nxt
+                break
+            batch = f"{batch}\n\n{nxt}"
+        try:
+            await _post_alert(batch, settings)
+        except Exception:
+            # Keep the drain alive: a bug here must not silently stall alerts.
+            log.exception("telegram_alert_drain_error")
+        if stop:
+            return
+
+
+def start_alert_drain(settings: Settings) -> None:
+    """Route send_alert through the coalescing queue (called on bot startup)."""
+    global _queue, _drain_task
+    if _drain_task is not None:
+        return
+    _queue = asyncio.Queue()
+    _drain_task = asyncio.create_task(_drain_loop(settings))
+
+
+async def stop_alert_drain() -> None:
+    """Flush queued alerts and stop the drain task (called on bot shutdown)."""
+    global _queue, _drain_task
+    if _drain_task is None or _queue is None:
+        return
+    _queue.put_nowait(None)
+    try:
+        await _drain_task
+    finally:
+        _queue = None
+        _drain_task = None
 
 
 async def send_alert(message: str, settings: Settings) -> None:
-    """POST to Telegram. No-op if TELEGRAM_BOT_TOKEN is empty."""
+    """Send a Telegram alert. No-op if TELEGRAM_BOT_TOKEN is empty.
+
+    While the drain task is running the message is queued and coalesced with
+    any others fired in the same window; otherwise it is POSTed directly.
+    """
     if not settings.TELEGRAM_BOT_TOKEN or not settings.TELEGRAM_CHAT_ID:
         return
-    try:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            await client.post(
-                f"{TELEGRAM_API}/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage",
-                json={
-                    "chat_id": settings.TELEGRAM_CHAT_ID,
-                    "text": message,
-                    "parse_mode": "HTML",
-                },
-            )
-    except Exception as e:
-        log.warning("telegram_alert_failed", error=str(e))
+    if _queue is not None:
+        _queue.put_nowait(message)
+        return
+    await _post_alert(message, settings)
 
 
 def format_trade_alert(record: TradeRecord) -> str:
     """Format a trade execution alert."""
-    emoji = "BUY" if record.action != "SKIP" else "SKIP"
-    return (
-        f"<b>{emoji}: {record.market_question[:80]}</b>\n"
-        f"Side: {record.action} | Edge: {record.calculated_edge:.3f}\n"
-        f"Size: ${record.position_size_usd:.2f} | Price: {record.market_price_at_decision:.4f}\n"
-        f"Prob: {record.final_adjusted_probability:.3f} (raw: {record.grok_raw_probability:.3f})\n"
-        f"Conf: {record.final_adjusted_confidence:.3f} | Score: {record.trade_score:.4f}\n"
-        f"Tier: {record.tier} | Type: {record.market_type}"
-    )
+    r = record
+    action = r.action
+    emoji = "BUY" if action != "SKIP" else "SKIP"
+    q = r.market_question[:80]
+    return "\n".join((
+        f"<b>{emoji}: {q}</b>",
+        f"Side: {action} | Edge: {r.calculated_edge:.3f}",
+        f"Size: ${r.position_size_usd:.2f} | Price: {r.market_price_at_decision:.4f}",
+        f"Prob: {r.final_adjusted_probability:.3f} (raw: {r.grok_raw_probability:.3f})",
+        f"Conf: {r.final_adjusted_confidence:.3f} | Score: {r.trade_score:.4f}",
+        f"Tier: {r.tier} | Type: {r.market_type}",
+    ))
 
 
 def format_daily_summary(trades: List[TradeRecord], portfolio: Portfolio) -> str:
     """Format daily summary alert."""
-    executed = [t for t in trades if t.action != "SKIP"]
-    skipped = [t for t in trades if t.action == "SKIP"]
-    outcome_resolved = [t for t in trades if t.actual_outcome is not None]
-    labeled = [t for t in trades if t.actual_outcome is not None or t.trade_profitable is not None]
-    total_pnl = sum(t.pnl or 0 for t in labeled)
+    n_exec = n_skip = n_labeled = n_resolved = 0
+    total_pnl = 0.0
+    for t in trades:
+        if t.action == "SKIP":
+            n_skip += 1
+        else:
+            n_exec += 1
+        if t.actual_outcome is not None:
+            n_resolved += 1
+        elif t.trade_profitable is None:
+            continue
+        n_labeled += 1
+        total_pnl += t.pnl or 0
 
-    return (
-        f"<b>Daily Summary</b>\n"
-        f"Executed: {len(executed)} | Skipped: {len(skipped)} | Labeled: {len(labeled)} | Outcome-resolved: {len(outcome_resolved)}\n"
-        f"Day PnL: ${total_pnl:+.2f}\n"
-        f"Portfolio: ${portfolio.total_equity:,.2f} (cash: ${portfolio.cash_balance:,.2f})\n"
-        f"Drawdown: {portfolio.max_drawdown:.1%} | Open: {len(portfolio.open_positions)}"
-    )
+    p = portfolio
+    return "\n".join((
+        "<b>Daily Summary</b>",
+        f"Executed: {n_exec} | Skipped: {n_skip} | Labeled: {n_labeled} | Outcome-resolved: {n_resolved}",
+        f"Day PnL: ${total_pnl:+.2f}",
+        f"Portfolio: ${p.total_equity:,.2f} (cash: ${p.cash_balance:,.2f})",
+        f"Drawdown: {p.max_drawdown:.1%} | Open: {len(p.open_positions)}",
+    ))
 
 
 def format_error_alert(error: str) -> str:
@@ -74,22 +243,26 @@ def format_observe_only_alert(executed: int, cap: int) -> str:
     )
 
 
+_MONK_LABELS = {
+    "daily_loss_limit": "Daily loss limit reached",
+    "weekly_loss_limit": "Weekly loss limit reached",
+    "max_total_exposure": "Max total exposure reached",
+    "api_budget_exceeded": "Daily API budget exceeded",
+}
+
+
 def format_monk_mode_alert(reason: str) -> str:
     """Format Monk Mode trigger alert."""
-    labels = {
-        "daily_loss_limit": "Daily loss limit reached",
-        "weekly_loss_limit": "Weekly loss limit reached",
-        "max_total_exposure": "Max total exposure reached",
-        "api_budget_exceeded": "Daily API budget exceeded",
-    }
-    if reason.startswith("consecutive_adverse"):
-        parts = reason.split("_")
-        count = parts[-1] if parts[-1].isdigit() else "?"
-        label = f"Consecutive adverse trades cooldown ({count} in a row)"
-    elif "daily_cap" in reason:
-        label = "Tier daily cap reached"
-    else:
-        label = labels.get(reason, reason)
+    label = _MONK_LABELS.get(reason)
+    if label is None:
+        if reason.startswith("consecutive_adverse"):
+            tail = reason.rpartition("_")[2]
+            count = tail if tail.isdigit() else "?"
+            label = f"Consecutive adverse trades cooldown ({count} in a row)"
+        elif "daily_cap" in reason:
+            label = "Tier daily cap reached"
+        else:
+            label = reason
     return (
         f"<b>MONK MODE</b>\n"
         f"{label}\n"
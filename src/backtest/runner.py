@@ -13,7 +13,7 @@ from src.db.sqlite import Database
 from src.db.migrations import run_migrations
 from src.engine.grok_client import LLMClient
 from src.engine.resolution import auto_resolve_trades
-from src.learning.adjustment import on_trade_resolved
+from src.learning.adjustment import on_trades_resolved
 from src.learning.calibration import CalibrationManager
 from src.learning.experiments import start_experiment
 from src.learning.market_type import MarketTypeManager
@@ -61,6 +61,9 @@ class BacktestRunner:
         signal_tracker_mgr = SignalTrackerManager()
         await signal_tracker_mgr.load(db)
 
+        # Suppress Telegram alerts (Settings is frozen, so swap in a copy)
+        self._settings = self._settings.model_copy(update={"TELEGRAM_BOT_TOKEN": ""})
+
         # Mocked dependencies
         polymarket = BacktestPolymarketClient(self._settings, self._backtest_data_db)
         rss = BacktestRSSPipeline(self._backtest_data_db)
@@ -70,9 +73,6 @@ class BacktestRunner:
         real_llm = LLMClient(self._settings, db)
         grok = BacktestLLMClient(real_llm, self._grok_cache_db)
 
-        # Suppress Telegram alerts
-        self._settings.TELEGRAM_BOT_TOKEN = ""
-
         # Build scheduler with mocked deps (never call .start() — we drive the loop manually)
         scheduler = Scheduler(
             settings=self._settings,
@@ -99,9 +99,9 @@ class BacktestRunner:
         while Clock.utcnow() <= self._end_dt:
             await scheduler.run_tier1_scan()
             newly_resolved = await auto_resolve_trades(db, polymarket)
-            for trade in newly_resolved:
-                await on_trade_resolved(
-                    record=trade,
+            if newly_resolved:
+                await on_trades_resolved(
+                    records=newly_resolved,
                     calibration_mgr=calibration_mgr,
                     market_type_mgr=market_type_mgr,
                     signal_tracker_mgr=signal_tracker_mgr,
@@ -121,71 +121,34 @@ class BacktestRunner:
 
         # --- Build summary ---
         summary = await self._build_summary(db, ticks, grok.cache_stats)
+        await real_llm.aclose()
         await db.close()
 
         self._print_summary(summary)
         return summary
 
     async def _build_summary(self, db: Database, ticks: int, cache_stats: dict) -> dict:
-        # Fetch all trade records via direct query (Database has no get_all_trades())
-        cursor = await db._conn.execute(
-            "SELECT * FROM trade_records ORDER BY timestamp"
-        )
-        rows = await cursor.fetchall()
-        all_trades = [db._row_to_trade(r) for r in rows]
-
-        executed = [t for t in all_trades if t.action != "SKIP"]
-        resolved = [t for t in executed if t.actual_outcome is not None]
-        wins = [
-            t for t in resolved
-            if (t.action == "BUY_YES" and t.actual_outcome) or (t.action == "BUY_NO" and not t.actual_outcome)
-        ]
-
-        total_pnl = sum(t.pnl or 0 for t in resolved)
-        win_rate = len(wins) / len(resolved) if resolved else 0.0
-        brier_raw = sum(t.brier_score_raw or 0 for t in resolved) / len(resolved) if resolved else None
-        brier_adj = sum(t.brier_score_adjusted or 0 for t in resolved) / len(resolved) if resolved else None
-
-        # PnL-based metrics (dual-label)
-        pnl_labeled = [t for t in executed if t.trade_profitable is not None]
-        pnl_wins = [t for t in pnl_labeled if t.trade_profitable == 1]
-        pnl_win_rate = len(pnl_wins) / len(pnl_labeled) if pnl_labeled else 0.0
-        avg_pnl_brier_raw = (
-            sum(t.pnl_brier_raw or 0 for t in pnl_labeled) / len(pnl_labeled)
-            if pnl_labeled else None
-        )
-        avg_pnl_brier_adjusted = (
-            sum(t.pnl_brier_adjusted or 0 for t in pnl_labeled) / len(pnl_labeled)
-            if pnl_labeled else None
-        )
-
-        # Per market type
-        by_type: dict = {}
-        for t in resolved:
-            mt = t.market_type
-            if mt not in by_type:
-                by_type[mt] = {"trades": 0, "pnl": 0.0, "brier_sum": 0.0, "wins": 0}
-            by_type[mt]["trades"] += 1
-            by_type[mt]["pnl"] += t.pnl or 0
-            by_type[mt]["brier_sum"] += t.brier_score_raw or 0
-            if t in wins:
-                by_type[mt]["wins"] += 1
+        # Aggregated in SQL; include_voided keeps every recorded trade in scope.
+        stats = await db.get_resolved_stats(include_voided=True)
+        by_type = await db.get_resolved_stats_by_market_type(include_voided=True)
+        resolved = stats["resolved_count"]
+        pnl_labeled = stats["pnl_labeled_count"]
 
         return {
             "start": self._start_dt.isoformat(),
             "end": self._end_dt.isoformat(),
             "ticks": ticks,
-            "trades_executed": len(executed),
-            "trades_skipped": len(all_trades) - len(executed),
-            "trades_resolved": len(resolved),
-            "win_rate": win_rate,
-            "total_pnl": total_pnl,
-            "brier_raw": brier_raw,
-            "brier_adjusted": brier_adj,
-            "pnl_labeled": len(pnl_labeled),
-            "pnl_win_rate": pnl_win_rate,
-            "avg_pnl_brier_raw": avg_pnl_brier_raw,
-            "avg_pnl_brier_adjusted": avg_pnl_brier_adjusted,
+            "trades_executed": stats["trade_count"],
+            "trades_skipped": stats["skip_count"],
+            "trades_resolved": resolved,
+            "win_rate": stats["wins"] / resolved if resolved else 0.0,
+            "total_pnl": stats["total_pnl"],
+            "brier_raw": stats["avg_brier_raw"],
+            "brier_adjusted": stats["avg_brier_adjusted"],
+            "pnl_labeled": pnl_labeled,
+            "pnl_win_rate": stats["pnl_wins"] / pnl_labeled if pnl_labeled else 0.0,
+            "avg_pnl_brier_raw": stats["avg_pnl_brier_raw"],
+            "avg_pnl_brier_adjusted": stats["avg_pnl_brier_adjusted"],
             "by_market_type": by_type,
             "grok_cache": cache_stats,
         }
@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 _SECRET_FIELDS = frozenset({
@@ -28,6 +30,7 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LLM_MODEL: str = "mimo-v2.5-pro"
     LLM_BASE_URL: str = "https://api.xiaomimimo.com/v1"
+    LLM_MAX_CONCURRENCY: int = 8  # In-flight LLM requests; also the HTTP pool size
 
     # RSS Polling
     RSS_POLL_INTERVAL_SECONDS: int = 30
@@ -115,10 +118,12 @@ class Settings(BaseSettings):
                 data[key] = "***REDACTED***"
         return data
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+    # Frozen: get_settings() hands the same cached instance to every caller,
+    # so it must not be mutated in place — use model_copy(update=...) instead.
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", frozen=True)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonkModeConfig:
     tier1_daily_trade_cap: int = 5
     tier2_daily_trade_cap: int = 3
@@ -133,7 +138,13 @@ class MonkModeConfig:
 
     @classmethod
     def from_settings(cls, s: Settings) -> "MonkModeConfig":
-        return cls(
+        # Settings is frozen, so a config derived from one instance never goes
+        # stale. The cache holds the Settings itself, which keeps its id() from
+        # being recycled while the entry lives.
+        hit = _MONK_CONFIG_CACHE.get(id(s))
+        if hit is not None and hit[0] is s:
+            return hit[1]
+        cfg = cls(
             tier1_daily_trade_cap=s.TIER1_DAILY_CAP,
             tier2_daily_trade_cap=s.TIER2_DAILY_CAP,
             daily_loss_limit_pct=s.DAILY_LOSS_LIMIT_PCT,
@@ -145,13 +156,15 @@ class MonkModeConfig:
             max_total_exposure_pct=s.MAX_TOTAL_EXPOSURE_PCT,
             kelly_fraction=s.KELLY_FRACTION,
         )
+        if len(_MONK_CONFIG_CACHE) >= 8:
+            _MONK_CONFIG_CACHE.clear()
+        _MONK_CONFIG_CACHE[id(s)] = (s, cfg)
+        return cfg
 
 
-_settings: Settings | None = None
+_MONK_CONFIG_CACHE: dict[int, tuple[Settings, MonkModeConfig]] = {}
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
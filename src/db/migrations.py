@@ -5,10 +5,10 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import aiosqlite
 
-SCHEMA_VERSION = 9
+SCHEMA_VERSION = 12
 
-MIGRATIONS: dict[int, list[str]] = {
-    1: [
+MIGRATIONS: tuple[tuple[int, tuple[str, ...]], ...] = (
+    (1, (
         # --- Schema version tracking ---
         """CREATE TABLE IF NOT EXISTS schema_version (
             version INTEGER PRIMARY KEY,
@@ -38,6 +38,11 @@ MIGRATIONS: dict[int, list[str]] = {
             experiment_run_started TEXT REFERENCES experiment_runs(run_id)
         )""",
         # --- Trade records ---
+        # BOOLEAN columns have NUMERIC affinity and are bound as Python bools,
+        # so they land as INTEGER 0/1, which SQLite encodes in the record header
+        # alone (serial types 8/9, zero payload bytes). Packing them into a
+        # flags int would not shrink rows, and actual_outcome is tri-state
+        # (NULL = unresolved), which a bit cannot represent.
         """CREATE TABLE IF NOT EXISTS trade_records (
             record_id TEXT PRIMARY KEY,
             experiment_run TEXT NOT NULL REFERENCES experiment_runs(run_id),
@@ -121,6 +126,9 @@ MIGRATIONS: dict[int, list[str]] = {
             PRIMARY KEY (source_tier, info_type, market_type)
         )""",
         # --- Portfolio ---
+        # Single-row table keyed by INTEGER PRIMARY KEY, which aliases the
+        # rowid: `WHERE id = 1` is already one B-tree seek, so WITHOUT ROWID
+        # (meant for non-integer/composite keys) would buy nothing here.
         """CREATE TABLE IF NOT EXISTS portfolio (
             id INTEGER PRIMARY KEY CHECK (id = 1),
             cash_balance REAL NOT NULL,
@@ -155,14 +163,14 @@ MIGRATIONS: dict[int, list[str]] = {
             timestamp TEXT NOT NULL DEFAULT (datetime('now')),
             date TEXT NOT NULL DEFAULT (date('now'))
         )""",
-    ],
-    2: [
+    )),
+    (2, (
         "ALTER TABLE trade_records ADD COLUMN resolution_datetime TEXT",
-    ],
-    3: [
+    )),
+    (3, (
         "CREATE INDEX IF NOT EXISTS idx_trades_market_id_action ON trade_records(market_id, action) WHERE action != 'SKIP'",
-    ],
-    4: [
+    )),
+    (4, (
         """CREATE TABLE IF NOT EXISTS daily_reviews (
             review_date TEXT PRIMARY KEY,
             timestamp TEXT NOT NULL,
@@ -185,18 +193,18 @@ MIGRATIONS: dict[int, list[str]] = {
             health_status TEXT,
             experiment_run TEXT REFERENCES experiment_runs(run_id)
         )""",
-    ],
-    5: [
+    )),
+    (5, (
         "ALTER TABLE trade_records ADD COLUMN spread_at_decision REAL DEFAULT 0.0",
         "ALTER TABLE trade_records ADD COLUMN vwap_price REAL DEFAULT 0.0",
         "ALTER TABLE trade_records ADD COLUMN exit_type TEXT",
         "ALTER TABLE trade_records ADD COLUMN exit_price REAL",
-    ],
-    6: [
+    )),
+    (6, (
         "ALTER TABLE trade_records ADD COLUMN clob_token_id_yes TEXT DEFAULT ''",
         "ALTER TABLE trade_records ADD COLUMN clob_token_id_no TEXT DEFAULT ''",
-    ],
-    7: [
+    )),
+    (7, (
         "ALTER TABLE trade_records ADD COLUMN trade_profitable INTEGER DEFAULT NULL",
         "ALTER TABLE trade_records ADD COLUMN pnl_brier_raw REAL DEFAULT NULL",
         "ALTER TABLE trade_records ADD COLUMN pnl_brier_adjusted REAL DEFAULT NULL",
@@ -209,8 +217,8 @@ MIGRATIONS: dict[int, list[str]] = {
         "ALTER TABLE daily_reviews ADD COLUMN avg_pnl_brier_raw REAL DEFAULT NULL",
         "ALTER TABLE daily_reviews ADD COLUMN avg_pnl_brier_adjusted REAL DEFAULT NULL",
         "ALTER TABLE daily_reviews ADD COLUMN pnl_resolved_count INTEGER DEFAULT 0",
-    ],
-    8: [
+    )),
+    (8, (
         """CREATE TABLE IF NOT EXISTS trade_price_snapshots (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             trade_record_id TEXT NOT NULL REFERENCES trade_records(record_id),
@@ -221,8 +229,8 @@ MIGRATIONS: dict[int, list[str]] = {
         )""",
         "CREATE INDEX IF NOT EXISTS idx_snapshots_trade ON trade_price_snapshots(trade_record_id)",
         "CREATE INDEX IF NOT EXISTS idx_snapshots_timestamp ON trade_price_snapshots(timestamp)",
-    ],
-    9: [
+    )),
+    (9, (
         """CREATE TABLE IF NOT EXISTS drift_history (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             timestamp TEXT NOT NULL DEFAULT (datetime('now')),
@@ -234,8 +242,31 @@ MIGRATIONS: dict[int, list[str]] = {
             locked_replay REAL NOT NULL
         )""",
         "CREATE INDEX IF NOT EXISTS idx_drift_history_ts ON drift_history(timestamp DESC)",
-    ],
-}
+    )),
+    (10, (
+        # Compound indexes for the (run, time) and (type, unresolved) read paths.
+        # The run index also covers pnl/trade_score so per-run PnL rollups are
+        # index-only; it supersedes the single-column experiment index.
+        "CREATE INDEX IF NOT EXISTS idx_trades_run_ts ON trade_records(experiment_run, timestamp, pnl, trade_score)",
+        "CREATE INDEX IF NOT EXISTS idx_trades_unresolved_mtype ON trade_records(market_type, timestamp) WHERE actual_outcome IS NULL",
+        "DROP INDEX IF EXISTS idx_trades_experiment",
+        "DROP INDEX IF EXISTS idx_trades_unresolved",
+    )),
+    (11, (
+        # Covering partial index for the open-position checks run every scan
+        # (count_open_trades, get_open_market_ids): the index holds exactly the
+        # open, not-exited rows and every column those queries read, so
+        # neither touches the table.
+        "CREATE INDEX IF NOT EXISTS idx_trades_open ON trade_records(voided, action, market_id) WHERE actual_outcome IS NULL AND exit_type IS NULL",
+    )),
+    (12, (
+        # Running exponentially weighted Brier sums, so brier_scores only has
+        # to hold the recent window. NULL on old rows: the loader rebuilds
+        # them from the stored list.
+        "ALTER TABLE market_type_performance ADD COLUMN brier_ew_sum REAL",
+        "ALTER TABLE market_type_performance ADD COLUMN brier_ew_weight REAL",
+    )),
+)
 
 
 async def get_current_version(conn: aiosqlite.Connection) -> int:
@@ -249,17 +280,48 @@ async def get_current_version(conn: aiosqlite.Connection) -> int:
         return 0
 
 
+def _build_migration_script(pending: list[tuple[int, tuple[str, ...]]]) -> str:
+    """Join every pending statement into one BEGIN/COMMIT script.
+
+    Each version's DDL is followed by its schema_version row so a failure
+    anywhere rolls back the whole batch rather than leaving a half-applied
+    version behind. The file header's user_version is stamped in the same
+    transaction for the warm-start check.
+    """
+    parts = ["BEGIN"]
+    for version, statements in pending:
+        parts.extend(statements)
+        parts.append(f"INSERT INTO schema_version (version) VALUES ({int(version)})")
+    parts.append(f"PRAGMA user_version = {int(pending[-1][0])}")
+    parts.append("COMMIT")
+    return ";\n".join(parts) + ";"
+
+
+async def _user_version(conn: aiosqlite.Connection) -> int:
+    cursor = await conn.execute("PRAGMA user_version")
+    row = await cursor.fetchone()
+    return row[0] if row else 0
+
+
 async def run_migrations(db) -> None:
-    """Apply pending migrations. `db` is a Database instance."""
+    """Apply pending migrations. `db` is a Database instance.
+
+    Warm starts short-circuit on ``PRAGMA user_version``, which the migration
+    script stamps in the same transaction as the schema_version rows; any
+    other value falls through to the schema_version table check.
+    """
     conn = db._conn
+    if await _user_version(conn) == SCHEMA_VERSION:
+        return
     current = await get_current_version(conn)
 
-    for version in sorted(MIGRATIONS.keys()):
-        if version <= current:
-            continue
-        for stmt in MIGRATIONS[version]:
-            await conn.execute(stmt)
-        await conn.execute(
-            "INSERT INTO schema_version (version) VALUES (?)", (version,)
-        )
-        await conn.commit()
+    pending = [m for m in MIGRATIONS if m[0] > current]
+    if pending:
+        try:
+            await conn.executescript(_build_migration_script(pending))
+        except Exception:
+            await conn.rollback()
+            raise
+    elif current == SCHEMA_VERSION:
+        # Up to date but migrated before user_version was stamped.
+        await conn.execute(f"PRAGMA user_version = {int(SCHEMA_VERSION)}")
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-import json
+import asyncio
+from collections import namedtuple
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 
 import aiosqlite
+import orjson
 import structlog
 
+from src.backtest.clock import Clock
 from src.models import (
     CalibrationBucket,
     ExperimentRun,
@@ -24,7 +29,6 @@ log = structlog.get_logger()
 
 
 def _utcnow() -> datetime:
-    from src.backtest.clock import Clock
     return Clock.utcnow()
 
 
@@ -32,6 +36,26 @@ def _iso(dt: datetime | None) -> str | None:
     return dt.isoformat() if dt else None
 
 
+def _dumps(obj) -> str:
+    # orjson is several times faster than stdlib json on the per-row JSON
+    # columns; OPT_NON_STR_KEYS keeps json.dumps' int-key coercion.
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_loads = orjson.loads
+
+
+def _day_bounds(day: str) -> Tuple[str, str]:
+    """[day, next day) as ISO strings, for index-friendly timestamp ranges.
+
+    Timestamps are stored as UTC ISO strings, so a lexicographic range on the
+    raw column selects the same rows as ``date(timestamp) = day`` without
+    wrapping the indexed column in a function.
+    """
+    nxt = (datetime.fromisoformat(day) + timedelta(days=1)).strftime("%Y-%m-%d")
+    return day, nxt
+
+
 def _parse_dt(s: str | None) -> datetime | None:
     if not s:
         return None
@@ -41,62 +65,300 @@ def _parse_dt(s: str | None) -> datetime | None:
         return None
 
 
+# Explicit projection for TradeRecord reads: every column _row_to_trade maps,
+# and nothing else, so SELECTs don't drag along columns no caller reads.
+_TRADE_COLUMNS = (
+    "record_id", "experiment_run", "timestamp", "model_used",
+    "market_id", "market_question", "market_type", "resolution_window_hours", "resolution_datetime", "tier",
+    "grok_raw_probability", "grok_raw_confidence", "grok_reasoning", "grok_signal_types",
+    "headline_only_signal",
+    "calibration_adjustment", "market_type_adjustment", "signal_weight_adjustment",
+    "final_adjusted_probability", "final_adjusted_confidence",
+    "market_price_at_decision", "orderbook_depth_usd", "fee_rate", "calculated_edge", "trade_score",
+    "action", "skip_reason", "position_size_usd", "kelly_fraction_used", "market_cluster_id",
+    "actual_outcome", "pnl", "brier_score_raw", "brier_score_adjusted", "resolved_at",
+    "unrealized_adverse_move", "voided", "void_reason",
+    "spread_at_decision", "vwap_price", "exit_type", "exit_price",
+    "clob_token_id_yes", "clob_token_id_no",
+    "trade_profitable", "pnl_brier_raw", "pnl_brier_adjusted",
+)
+# NULL-able columns whose TradeRecord field has a non-NULL default; COALESCE in
+# the SELECT so _row_to_trade takes the values as-is.
+_TRADE_COLUMN_DEFAULTS = {
+    "resolution_window_hours": "0.0",
+    "grok_reasoning": "''",
+    "grok_signal_types": "'[]'",
+    "calibration_adjustment": "0.0",
+    "market_type_adjustment": "0.0",
+    "signal_weight_adjustment": "0.0",
+    "orderbook_depth_usd": "0.0",
+    "trade_score": "0.0",
+    "position_size_usd": "0.0",
+    "kelly_fraction_used": "0.0",
+}
+_SELECT_TRADES = "SELECT {} FROM trade_records".format(", ".join(
+    f"COALESCE({c}, {_TRADE_COLUMN_DEFAULTS[c]})" if c in _TRADE_COLUMN_DEFAULTS else c
+    for c in _TRADE_COLUMNS
+))
+
+# Built once from _TRADE_COLUMNS so the column list and placeholder count
+# can't drift apart; the same text also keeps sqlite's statement cache hot.
+_SQL_INSERT_TRADE = "INSERT INTO trade_records ({}) VALUES ({})".format(
+    ", ".join(_TRADE_COLUMNS), ", ".join("?" * len(_TRADE_COLUMNS)),
+)
+
+
+# Estimated API pricing: (USD per input token, per output token, per call).
+# Unlisted services (e.g. mimo) are tracked for call/token counts at $0.
+_PRICING: Dict[str, Tuple[float, float, float]] = {
+    "minimax": (0.000001, 0.000005, 0.0),  # approx, MiniMax M2
+    "twitter": (0.0, 0.0, 0.0075),  # per search
+}
+_NO_PRICING = (0.0, 0.0, 0.0)
+
+# Predicates shared by the SQL-side stats aggregates.
+_RESOLVED = "action != 'SKIP' AND actual_outcome IS NOT NULL"
+_WIN = "((action = 'BUY_YES' AND actual_outcome) OR (action = 'BUY_NO' AND NOT actual_outcome))"
+_PNL_LABELED = "action != 'SKIP' AND trade_profitable IS NOT NULL"
+
+
+def _trade_params(r: TradeRecord) -> tuple:
+    """Bind parameters for _SQL_INSERT_TRADE, in _TRADE_COLUMNS order."""
+    return (
+        r.record_id, r.experiment_run, _iso(r.timestamp), r.model_used,
+        r.market_id, r.market_question, r.market_type, r.resolution_window_hours,
+        _iso(r.resolution_datetime), r.tier,
+        r.grok_raw_probability, r.grok_raw_confidence, r.grok_reasoning,
+        _dumps(r.grok_signal_types), r.headline_only_signal,
+        r.calibration_adjustment, r.market_type_adjustment, r.signal_weight_adjustment,
+        r.final_adjusted_probability, r.final_adjusted_confidence,
+        r.market_price_at_decision, r.orderbook_depth_usd, r.fee_rate,
+        r.calculated_edge, r.trade_score,
+        r.action, r.skip_reason, r.position_size_usd, r.kelly_fraction_used,
+        r.market_cluster_id,
+        r.actual_outcome, r.pnl, r.brier_score_raw, r.brier_score_adjusted,
+        _iso(r.resolved_at), r.unrealized_adverse_move, r.voided, r.void_reason,
+        r.spread_at_decision, r.vwap_price, r.exit_type, r.exit_price,
+        r.clob_token_id_yes, r.clob_token_id_no,
+        r.trade_profitable, r.pnl_brier_raw, r.pnl_brier_adjusted,
+    )
+
+
+# Resolution-time columns rewritten by update_trade / update_trades_bulk.
+_SQL_UPDATE_TRADE = """UPDATE trade_records SET
+    actual_outcome=?, pnl=?, brier_score_raw=?, brier_score_adjusted=?,
+    resolved_at=?, unrealized_adverse_move=?, voided=?, void_reason=?,
+    exit_type=?, exit_price=?,
+    trade_profitable=?, pnl_brier_raw=?, pnl_brier_adjusted=?
+WHERE record_id=?"""
+
+
+def _trade_update_params(r: TradeRecord) -> tuple:
+    """Bind parameters for _SQL_UPDATE_TRADE."""
+    return (
+        r.actual_outcome, r.pnl, r.brier_score_raw, r.brier_score_adjusted,
+        _iso(r.resolved_at), r.unrealized_adverse_move, r.voided, r.void_reason,
+        r.exit_type, r.exit_price,
+        r.trade_profitable, r.pnl_brier_raw, r.pnl_brier_adjusted,
+        r.record_id,
+    )
+
+
+@lru_cache(maxsize=16)
+def _trade_fields_type(fields: Tuple[str, ...]):
+    """namedtuple type for a column subset; raw column values, no parsing."""
+    unknown = [f for f in fields if f not in _TRADE_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown trade_records columns: {unknown}")
+    return namedtuple("TradeFields", fields)
+
+
+# Connection tuning, issued in one executescript round-trip at init.
+# journal_mode=WAL persists in the DB file; the rest are per-connection.
+_PRAGMAS = (
+    "journal_mode=WAL",
+    "foreign_keys=ON",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+    "mmap_size=268435456",
+    "busy_timeout=30000",
+    "wal_autocheckpoint=1000",
+)
+# In-memory DBs have no file to map or journal.
+_PRAGMAS_MEMORY = tuple(p for p in _PRAGMAS if not p.startswith(("mmap_size", "journal_mode")))
+
+# sqlite3 keeps an LRU of prepared statements keyed by SQL text, so repeated
+# execute() calls with the same literal skip parse/plan. Size it above the
+# number of distinct statements this module issues (plus the few
+# field-projection variants) so hot queries are never evicted.
+_STATEMENT_CACHE_SIZE = 256
+
+
+# Write-behind for the per-API-call bookkeeping rows: buffered in memory and
+# flushed in one transaction after a short delay, once the buffer is large,
+# before api_costs is read, and on close.
+BUFFER_FLUSH_SECONDS = 0.5
+BUFFER_FLUSH_MAX_ITEMS = 128
+
+
 class Database:
-    def __init__(self, conn: aiosqlite.Connection):
+    def __init__(self, conn: aiosqlite.Connection, path: str = ":memory:"):
         self._conn = conn
+        self._path = path
+        self._txn_lock = asyncio.Lock()
+        self._txn_owner: Optional[asyncio.Task] = None
+        # (date, service) -> [calls, tokens_in, tokens_out, cost_usd]
+        self._api_cost_buf: Dict[Tuple[str, str], list] = {}
+        self._parse_fail_buf: List[Tuple[str]] = []
+        self._buffered = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        # Timer tasks past their sleep and writing; close() waits for these.
+        self._inflight_flushes: Set[asyncio.Task] = set()
 
     @classmethod
     async def init(cls, db_path: str) -> "Database":
-        conn = await aiosqlite.connect(db_path, check_same_thread=False)
+        """Open a connection to ``db_path``.
+
+        Each call starts its own aiosqlite worker thread. SQLite gains nothing
+        from a pool, so a process opens one Database at startup and passes it
+        to every task; that keeps the page and statement caches warm.
+        """
+        conn = await aiosqlite.connect(
+            db_path, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE,
+        )
         conn.row_factory = aiosqlite.Row
-        await conn.execute("PRAGMA journal_mode=WAL")
-        await conn.execute("PRAGMA foreign_keys=ON")
-        return cls(conn)
+        pragmas = _PRAGMAS if db_path != ":memory:" else _PRAGMAS_MEMORY
+        await conn.executescript("".join(f"PRAGMA {p};" for p in pragmas))
+        return cls(conn, db_path)
 
     async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        # A timer flush already writing holds rows swapped out of the buffers;
+        # let it finish on the open connection (it logs its own failures).
+        if self._inflight_flushes:
+            await asyncio.gather(*self._inflight_flushes)
+        await self.flush_buffers()
         await self._conn.close()
 
+    @asynccontextmanager
+    async def transaction(self):
+        """Group several writes into one BEGIN IMMEDIATE ... COMMIT.
+
+        Pass ``commit=False`` to the mutating methods called inside the block.
+        Nested use in the same task joins the outer transaction; other tasks
+        wait for it to finish rather than writing into it. Mutators called
+        with the default ``commit=True`` go through here too.
+        """
+        task = asyncio.current_task()
+        if self._txn_owner is task:
+            yield
+            return
+        async with self._txn_lock:
+            self._txn_owner = task
+            try:
+                await self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield
+                except BaseException:
+                    await self._conn.rollback()
+                    raise
+                await self._conn.commit()
+            finally:
+                self._txn_owner = None
+
+    @asynccontextmanager
+    async def _autocommit(self, commit: bool):
+        """Body of a mutator taking ``commit``.
+
+        ``commit=True`` runs it as its own transaction(), so it waits for
+        another task's open transaction instead of committing that task's
+        half-finished writes. ``commit=False`` leaves it to the caller's
+        transaction().
+        """
+        if commit:
+            async with self.transaction():
+                yield
+        else:
+            yield
+
+    def _note_buffered(self) -> bool:
+        """Count a buffered write; True once the buffer should flush now."""
+        self._buffered += 1
+        if self._buffered >= BUFFER_FLUSH_MAX_ITEMS:
+            return True
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+        return False
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(BUFFER_FLUSH_SECONDS)
+        # Writes from here on arm a fresh timer; close() awaits this one.
+        self._flush_task = None
+        task = asyncio.current_task()
+        self._inflight_flushes.add(task)
+        try:
+            await self.flush_buffers()
+        except Exception:
+            log.exception("db_buffer_flush_failed")
+        finally:
+            self._inflight_flushes.discard(task)
+
+    async def flush_buffers(self) -> None:
+        """Write buffered api_costs/parse_failures rows in one transaction.
+
+        On failure the rows are put back so the next flush retries them.
+        """
+        if not self._buffered:
+            return
+        costs, self._api_cost_buf = self._api_cost_buf, {}
+        fails, self._parse_fail_buf = self._parse_fail_buf, []
+        self._buffered = 0
+        try:
+            async with self.transaction():
+                if costs:
+                    await self._conn.executemany(
+                        """INSERT INTO api_costs (date, service, calls, tokens_in, tokens_out, cost_usd)
+                           VALUES (?, ?, ?, ?, ?, ?)
+                           ON CONFLICT(date, service) DO UPDATE SET
+                           calls = calls + excluded.calls, tokens_in = tokens_in + excluded.tokens_in,
+                           tokens_out = tokens_out + excluded.tokens_out,
+                           cost_usd = cost_usd + excluded.cost_usd""",
+                        [(*key, *acc) for key, acc in costs.items()],
+                    )
+                if fails:
+                    await self._conn.executemany(
+                        "INSERT INTO parse_failures (market_id) VALUES (?)", fails
+                    )
+        except BaseException:
+            for key, acc in costs.items():
+                cur = self._api_cost_buf.setdefault(key, [0, 0, 0, 0.0])
+                for i, v in enumerate(acc):
+                    cur[i] += v
+            self._parse_fail_buf[:0] = fails
+            self._buffered += len(costs) + len(fails)
+            raise
+
+    async def _upsert_many(self, sql: str, rows: List[tuple]) -> None:
+        """Run one prepared statement over all rows inside a single transaction."""
+        if not rows:
+            return
+        async with self.transaction():
+            await self._conn.executemany(sql, rows)
+
     # ------------------------------------------------------------------
     # Trade Records
     # ------------------------------------------------------------------
 
-    async def save_trade(self, r: TradeRecord) -> None:
-        await self._conn.execute(
-            """INSERT INTO trade_records (
-                record_id, experiment_run, timestamp, model_used,
-                market_id, market_question, market_type, resolution_window_hours, resolution_datetime, tier,
-                grok_raw_probability, grok_raw_confidence, grok_reasoning, grok_signal_types,
-                headline_only_signal,
-                calibration_adjustment, market_type_adjustment, signal_weight_adjustment,
-                final_adjusted_probability, final_adjusted_confidence,
-                market_price_at_decision, orderbook_depth_usd, fee_rate, calculated_edge, trade_score,
-                action, skip_reason, position_size_usd, kelly_fraction_used, market_cluster_id,
-                actual_outcome, pnl, brier_score_raw, brier_score_adjusted, resolved_at,
-                unrealized_adverse_move, voided, void_reason,
-                spread_at_decision, vwap_price, exit_type, exit_price,
-                clob_token_id_yes, clob_token_id_no,
-                trade_profitable, pnl_brier_raw, pnl_brier_adjusted
-            ) VALUES (?,?,?,?, ?,?,?,?,?,?, ?,?,?,?,?, ?,?,?, ?,?, ?,?,?,?,?, ?,?,?,?,?, ?,?,?,?,?, ?,?,?, ?,?,?,?, ?,?, ?,?,?)""",
-            (
-                r.record_id, r.experiment_run, _iso(r.timestamp), r.model_used,
-                r.market_id, r.market_question, r.market_type, r.resolution_window_hours,
-                _iso(r.resolution_datetime), r.tier,
-                r.grok_raw_probability, r.grok_raw_confidence, r.grok_reasoning,
-                json.dumps(r.grok_signal_types), r.headline_only_signal,
-                r.calibration_adjustment, r.market_type_adjustment, r.signal_weight_adjustment,
-                r.final_adjusted_probability, r.final_adjusted_confidence,
-                r.market_price_at_decision, r.orderbook_depth_usd, r.fee_rate,
-                r.calculated_edge, r.trade_score,
-                r.action, r.skip_reason, r.position_size_usd, r.kelly_fraction_used,
-                r.market_cluster_id,
-                r.actual_outcome, r.pnl, r.brier_score_raw, r.brier_score_adjusted,
-                _iso(r.resolved_at), r.unrealized_adverse_move, r.voided, r.void_reason,
-                r.spread_at_decision, r.vwap_price, r.exit_type, r.exit_price,
-                r.clob_token_id_yes, r.clob_token_id_no,
-                r.trade_profitable, r.pnl_brier_raw, r.pnl_brier_adjusted,
-            ),
-        )
-        await self._conn.commit()
+    async def save_trade(self, r: TradeRecord, commit: bool = True) -> None:
+        async with self._autocommit(commit):
+            await self._conn.execute(_SQL_INSERT_TRADE, _trade_params(r))
+
+    async def save_trades(self, records: List[TradeRecord]) -> None:
+        """Insert several trade records with one executemany in one transaction."""
+        await self._upsert_many(_SQL_INSERT_TRADE, [_trade_params(r) for r in records])
 
     async def save_trade_with_portfolio(self, r: TradeRecord, p: Portfolio) -> None:
         """Atomically save a trade record and updated portfolio in one transaction.
@@ -105,61 +367,14 @@ class Database:
         (SIGTERM, CancelledError, or exceptions between two separate awaits).
         Either both writes land, or neither does.
         """
-        now = _utcnow().isoformat()
+        # The pre-write balance feeds the audit log below. It has to be read
+        # separately: RETURNING on the upsert only yields post-update values.
         async with self._conn.execute("SELECT cash_balance FROM portfolio WHERE id=1") as cur:
             prev = await cur.fetchone()
         cash_before = float(prev[0]) if prev else 0.0
-        try:
-            await self._conn.execute("BEGIN IMMEDIATE")
-            await self._conn.execute(
-                """INSERT INTO trade_records (
-                    record_id, experiment_run, timestamp, model_used,
-                    market_id, market_question, market_type, resolution_window_hours, resolution_datetime, tier,
-                    grok_raw_probability, grok_raw_confidence, grok_reasoning, grok_signal_types,
-                    headline_only_signal,
-                    calibration_adjustment, market_type_adjustment, signal_weight_adjustment,
-                    final_adjusted_probability, final_adjusted_confidence,
-                    market_price_at_decision, orderbook_depth_usd, fee_rate, calculated_edge, trade_score,
-                    action, skip_reason, position_size_usd, kelly_fraction_used, market_cluster_id,
-                    actual_outcome, pnl, brier_score_raw, brier_score_adjusted, resolved_at,
-                    unrealized_adverse_move, voided, void_reason,
-                    spread_at_decision, vwap_price, exit_type, exit_price,
-                    clob_token_id_yes, clob_token_id_no,
-                    trade_profitable, pnl_brier_raw, pnl_brier_adjusted
-                ) VALUES (?,?,?,?, ?,?,?,?,?,?, ?,?,?,?,?, ?,?,?, ?,?, ?,?,?,?,?, ?,?,?,?,?, ?,?,?,?,?, ?,?,?, ?,?,?,?, ?,?, ?,?,?)""",
-                (
-                    r.record_id, r.experiment_run, _iso(r.timestamp), r.model_used,
-                    r.market_id, r.market_question, r.market_type, r.resolution_window_hours,
-                    _iso(r.resolution_datetime), r.tier,
-                    r.grok_raw_probability, r.grok_raw_confidence, r.grok_reasoning,
-                    json.dumps(r.grok_signal_types), r.headline_only_signal,
-                    r.calibration_adjustment, r.market_type_adjustment, r.signal_weight_adjustment,
-                    r.final_adjusted_probability, r.final_adjusted_confidence,
-                    r.market_price_at_decision, r.orderbook_depth_usd, r.fee_rate,
-                    r.calculated_edge, r.trade_score,
-                    r.action, r.skip_reason, r.position_size_usd, r.kelly_fraction_used,
-                    r.market_cluster_id,
-                    r.actual_outcome, r.pnl, r.brier_score_raw, r.brier_score_adjusted,
-                    _iso(r.resolved_at), r.unrealized_adverse_move, r.voided, r.void_reason,
-                    r.spread_at_decision, r.vwap_price, r.exit_type, r.exit_price,
-                    r.clob_token_id_yes, r.clob_token_id_no,
-                    r.trade_profitable, r.pnl_brier_raw, r.pnl_brier_adjusted,
-                ),
-            )
-            await self._conn.execute(
-                """INSERT INTO portfolio (id, cash_balance, total_equity, total_pnl, peak_equity, max_drawdown, updated_at)
-                   VALUES (1, ?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(id) DO UPDATE SET
-                   cash_balance=?, total_equity=?, total_pnl=?, peak_equity=?, max_drawdown=?, updated_at=?""",
-                (
-                    p.cash_balance, p.total_equity, p.total_pnl, p.peak_equity, p.max_drawdown, now,
-                    p.cash_balance, p.total_equity, p.total_pnl, p.peak_equity, p.max_drawdown, now,
-                ),
-            )
-            await self._conn.commit()
-        except Exception:
-            await self._conn.rollback()
-            raise
+        async with self.transaction():
+            await self.save_trade(r, commit=False)
+            await self.save_portfolio(p, commit=False)
 
         cash_after = p.cash_balance
         log.info(
@@ -175,111 +390,78 @@ class Database:
         )
 
     def _row_to_trade(self, row) -> TradeRecord:
-        return TradeRecord(
-            record_id=row["record_id"],
-            experiment_run=row["experiment_run"],
-            timestamp=_parse_dt(row["timestamp"]) or _utcnow(),
-            model_used=row["model_used"],
-            market_id=row["market_id"],
-            market_question=row["market_question"],
-            market_type=row["market_type"],
-            resolution_window_hours=row["resolution_window_hours"] or 0.0,
-            tier=row["tier"],
-            grok_raw_probability=row["grok_raw_probability"],
-            grok_raw_confidence=row["grok_raw_confidence"],
-            grok_reasoning=row["grok_reasoning"] or "",
-            grok_signal_types=json.loads(row["grok_signal_types"] or "[]"),
-            headline_only_signal=bool(row["headline_only_signal"]),
-            calibration_adjustment=row["calibration_adjustment"] or 0.0,
-            market_type_adjustment=row["market_type_adjustment"] or 0.0,
-            signal_weight_adjustment=row["signal_weight_adjustment"] or 0.0,
-            final_adjusted_probability=row["final_adjusted_probability"],
-            final_adjusted_confidence=row["final_adjusted_confidence"],
-            market_price_at_decision=row["market_price_at_decision"],
-            orderbook_depth_usd=row["orderbook_depth_usd"] or 0.0,
-            fee_rate=row["fee_rate"],
-            calculated_edge=row["calculated_edge"],
-            trade_score=row["trade_score"] or 0.0,
-            action=row["action"],
-            skip_reason=row["skip_reason"],
-            position_size_usd=row["position_size_usd"] or 0.0,
-            kelly_fraction_used=row["kelly_fraction_used"] or 0.0,
-            market_cluster_id=row["market_cluster_id"],
-            actual_outcome=row["actual_outcome"] if row["actual_outcome"] is not None else None,
-            pnl=row["pnl"],
-            brier_score_raw=row["brier_score_raw"],
-            brier_score_adjusted=row["brier_score_adjusted"],
-            resolved_at=_parse_dt(row["resolved_at"]),
-            resolution_datetime=_parse_dt(row["resolution_datetime"]),
-            unrealized_adverse_move=row["unrealized_adverse_move"],
-            voided=bool(row["voided"]),
-            void_reason=row["void_reason"],
-            spread_at_decision=row["spread_at_decision"] if "spread_at_decision" in row.keys() else 0.0,
-            vwap_price=row["vwap_price"] if "vwap_price" in row.keys() else 0.0,
-            exit_type=row["exit_type"] if "exit_type" in row.keys() else None,
-            exit_price=row["exit_price"] if "exit_price" in row.keys() else None,
-            clob_token_id_yes=row["clob_token_id_yes"] if "clob_token_id_yes" in row.keys() else "",
-            clob_token_id_no=row["clob_token_id_no"] if "clob_token_id_no" in row.keys() else "",
-            trade_profitable=row["trade_profitable"] if "trade_profitable" in row.keys() else None,
-            pnl_brier_raw=row["pnl_brier_raw"] if "pnl_brier_raw" in row.keys() else None,
-            pnl_brier_adjusted=row["pnl_brier_adjusted"] if "pnl_brier_adjusted" in row.keys() else None,
-        )
+        """Build a TradeRecord from a ``_SELECT_TRADES`` row.
+
+        Columns are matched by position (sqlite3.Row name lookups scan the
+        description), and NULL defaults were already applied in SQL.
+        """
+        f = dict(zip(_TRADE_COLUMNS, row))
+        f["timestamp"] = _parse_dt(f["timestamp"]) or _utcnow()
+        f["resolution_datetime"] = _parse_dt(f["resolution_datetime"])
+        f["resolved_at"] = _parse_dt(f["resolved_at"])
+        f["grok_signal_types"] = _loads(f["grok_signal_types"])
+        f["headline_only_signal"] = bool(f["headline_only_signal"])
+        f["voided"] = bool(f["voided"])
+        return TradeRecord(**f)
 
     async def get_trade(self, record_id: str) -> Optional[TradeRecord]:
         cursor = await self._conn.execute(
-            "SELECT * FROM trade_records WHERE record_id = ?", (record_id,)
+            _SELECT_TRADES + " WHERE record_id = ?", (record_id,)
         )
         row = await cursor.fetchone()
         return self._row_to_trade(row) if row else None
 
     async def get_open_trades(self) -> List[TradeRecord]:
         cursor = await self._conn.execute(
-            "SELECT * FROM trade_records WHERE actual_outcome IS NULL AND voided = FALSE AND action != 'SKIP'"
+            _SELECT_TRADES + " WHERE actual_outcome IS NULL AND voided = FALSE AND action != 'SKIP'"
         )
         rows = await cursor.fetchall()
         return [self._row_to_trade(r) for r in rows]
 
     async def get_today_trades(self) -> List[TradeRecord]:
-        today = _utcnow().strftime("%Y-%m-%d")
         cursor = await self._conn.execute(
-            "SELECT * FROM trade_records WHERE date(timestamp) = ? ORDER BY timestamp",
-            (today,),
+            _SELECT_TRADES + " WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp",
+            _day_bounds(_utcnow().strftime("%Y-%m-%d")),
         )
         rows = await cursor.fetchall()
         return [self._row_to_trade(r) for r in rows]
 
-    async def get_week_trades(self) -> List[TradeRecord]:
+    async def get_week_trades(self, fields: Optional[Tuple[str, ...]] = None) -> list:
+        """Trades from the last 7 days, oldest first.
+
+        With ``fields``, only those columns are selected and each row comes
+        back as a namedtuple of raw values (no JSON/datetime decoding) —
+        for callers that only aggregate a column or two.
+        """
         week_ago = (_utcnow() - timedelta(days=7)).isoformat()
+        if fields:
+            row_type = _trade_fields_type(tuple(fields))
+            cursor = await self._conn.execute(
+                f"SELECT {', '.join(row_type._fields)} FROM trade_records "
+                "WHERE timestamp >= ? ORDER BY timestamp",
+                (week_ago,),
+            )
+            rows = await cursor.fetchall()
+            return [row_type._make(r) for r in rows]
         cursor = await self._conn.execute(
-            "SELECT * FROM trade_records WHERE timestamp >= ? ORDER BY timestamp",
+            _SELECT_TRADES + " WHERE timestamp >= ? ORDER BY timestamp",
             (week_ago,),
         )
         rows = await cursor.fetchall()
         return [self._row_to_trade(r) for r in rows]
 
-    async def update_trade(self, r: TradeRecord) -> None:
-        await self._conn.execute(
-            """UPDATE trade_records SET
-                actual_outcome=?, pnl=?, brier_score_raw=?, brier_score_adjusted=?,
-                resolved_at=?, unrealized_adverse_move=?, voided=?, void_reason=?,
-                exit_type=?, exit_price=?,
-                trade_profitable=?, pnl_brier_raw=?, pnl_brier_adjusted=?
-            WHERE record_id=?""",
-            (
-                r.actual_outcome, r.pnl, r.brier_score_raw, r.brier_score_adjusted,
-                _iso(r.resolved_at), r.unrealized_adverse_move, r.voided, r.void_reason,
-                r.exit_type, r.exit_price,
-                r.trade_profitable, r.pnl_brier_raw, r.pnl_brier_adjusted,
-                r.record_id,
-            ),
-        )
-        await self._conn.commit()
+    async def update_trade(self, r: TradeRecord, commit: bool = True) -> None:
+        async with self._autocommit(commit):
+            await self._conn.execute(_SQL_UPDATE_TRADE, _trade_update_params(r))
+
+    async def update_trades_bulk(self, records: List[TradeRecord]) -> None:
+        """update_trade for several records with one executemany in one transaction."""
+        await self._upsert_many(_SQL_UPDATE_TRADE, [_trade_update_params(r) for r in records])
 
     async def count_today_trades(self) -> int:
-        today = _utcnow().strftime("%Y-%m-%d")
         cursor = await self._conn.execute(
-            "SELECT COUNT(*) FROM trade_records WHERE date(timestamp) = ? AND action != 'SKIP'",
-            (today,),
+            "SELECT COUNT(*) FROM trade_records WHERE timestamp >= ? AND timestamp < ? AND action != 'SKIP'",
+            _day_bounds(_utcnow().strftime("%Y-%m-%d")),
         )
         row = await cursor.fetchone()
         return row[0] if row else 0
@@ -302,8 +484,7 @@ class Database:
 
     async def get_recently_traded_market_ids(self, cooldown_hours: float) -> set:
         """Return market_ids traded (executed, not SKIP) within the cooldown window."""
-        from src.backtest.clock import Clock
-        cutoff = (Clock.utcnow() - timedelta(hours=cooldown_hours)).isoformat()
+        cutoff = (_utcnow() - timedelta(hours=cooldown_hours)).isoformat()
         cursor = await self._conn.execute(
             "SELECT DISTINCT market_id FROM trade_records "
             "WHERE action != 'SKIP' AND timestamp >= ?",
@@ -314,8 +495,7 @@ class Database:
 
     async def get_recently_evaluated_market_ids(self, hours: float) -> set:
         """Return market_ids that had a Grok evaluation (including low_edge SKIPs) within the window."""
-        from src.backtest.clock import Clock
-        cutoff = (Clock.utcnow() - timedelta(hours=hours)).isoformat()
+        cutoff = (_utcnow() - timedelta(hours=hours)).isoformat()
         cursor = await self._conn.execute(
             "SELECT DISTINCT market_id FROM trade_records "
             "WHERE timestamp >= ? AND grok_raw_probability IS NOT NULL",
@@ -326,8 +506,7 @@ class Database:
 
     async def get_recent_market_questions(self, hours: float) -> list:
         """Return (market_id, question, market_type) for recently traded markets."""
-        from src.backtest.clock import Clock
-        cutoff = (Clock.utcnow() - timedelta(hours=hours)).isoformat()
+        cutoff = (_utcnow() - timedelta(hours=hours)).isoformat()
         cursor = await self._conn.execute(
             "SELECT DISTINCT market_id, market_question, market_type FROM trade_records "
             "WHERE action != 'SKIP' AND timestamp >= ? AND market_question IS NOT NULL",
@@ -336,45 +515,117 @@ class Database:
         rows = await cursor.fetchall()
         return [(r[0], r[1], r[2]) for r in rows]
 
-    async def get_all_resolved_trades(self, include_voided: bool = False) -> List[TradeRecord]:
-        sql = "SELECT * FROM trade_records WHERE actual_outcome IS NOT NULL"
+    async def iter_resolved_trades(
+        self, include_voided: bool = False, chunk: int = 512,
+    ) -> AsyncIterator[TradeRecord]:
+        """Stream resolved trades oldest-first, ``chunk`` rows per fetch.
+
+        Peak memory stays at one chunk of rows, and the consumer starts
+        work before the whole result set has been read.
+        """
+        sql = _SELECT_TRADES + " WHERE actual_outcome IS NOT NULL"
         if not include_voided:
             sql += " AND voided = FALSE"
         sql += " ORDER BY timestamp"
+        async with self._conn.execute(sql) as cursor:
+            while rows := await cursor.fetchmany(chunk):
+                for r in rows:
+                    yield self._row_to_trade(r)
+
+    async def get_all_resolved_trades(self, include_voided: bool = False) -> List[TradeRecord]:
+        return [t async for t in self.iter_resolved_trades(include_voided)]
+
+    async def count_resolved_trades(self, include_voided: bool = False) -> int:
+        sql = "SELECT COUNT(*) FROM trade_records WHERE actual_outcome IS NOT NULL"
+        if not include_voided:
+            sql += " AND voided = FALSE"
+        cursor = await self._conn.execute(sql)
+        row = await cursor.fetchone()
+        return row[0] if row else 0
+
+    async def get_resolved_stats(self, include_voided: bool = False) -> dict:
+        """Outcome and PnL-label aggregates over all trades, computed in SQL.
+
+        Brier averages divide by the resolved (or pnl-labeled) count with
+        missing scores counted as 0, matching the backtest summary.
+        """
+        sql = f"""SELECT
+                COUNT(*),
+                SUM(CASE WHEN action != 'SKIP' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN {_RESOLVED} THEN 1 ELSE 0 END),
+                SUM(CASE WHEN {_RESOLVED} AND {_WIN} THEN 1 ELSE 0 END),
+                TOTAL(CASE WHEN {_RESOLVED} THEN pnl END),
+                TOTAL(CASE WHEN {_RESOLVED} THEN brier_score_raw END),
+                TOTAL(CASE WHEN {_RESOLVED} THEN brier_score_adjusted END),
+                SUM(CASE WHEN {_PNL_LABELED} THEN 1 ELSE 0 END),
+                SUM(CASE WHEN {_PNL_LABELED} AND trade_profitable = 1 THEN 1 ELSE 0 END),
+                TOTAL(CASE WHEN {_PNL_LABELED} THEN pnl_brier_raw END),
+                TOTAL(CASE WHEN {_PNL_LABELED} THEN pnl_brier_adjusted END)
+            FROM trade_records"""
+        if not include_voided:
+            sql += " WHERE voided = FALSE"
+        cursor = await self._conn.execute(sql)
+        row = await cursor.fetchone()
+        total, executed, resolved, wins = (row[k] or 0 for k in range(4))
+        labeled, pnl_wins = row[7] or 0, row[8] or 0
+        return {
+            "trade_count": executed,
+            "skip_count": total - executed,
+            "resolved_count": resolved,
+            "wins": wins,
+            "total_pnl": row[4],
+            "avg_brier_raw": row[5] / resolved if resolved else None,
+            "avg_brier_adjusted": row[6] / resolved if resolved else None,
+            "pnl_labeled_count": labeled,
+            "pnl_wins": pnl_wins,
+            "avg_pnl_brier_raw": row[9] / labeled if labeled else None,
+            "avg_pnl_brier_adjusted": row[10] / labeled if labeled else None,
+        }
+
+    async def get_resolved_stats_by_market_type(self, include_voided: bool = False) -> Dict[str, dict]:
+        """Per-market-type trades/pnl/raw-Brier-sum/wins over resolved executed trades."""
+        sql = f"""SELECT market_type, COUNT(*), TOTAL(pnl), TOTAL(brier_score_raw),
+                SUM(CASE WHEN {_WIN} THEN 1 ELSE 0 END)
+            FROM trade_records WHERE {_RESOLVED}"""
+        if not include_voided:
+            sql += " AND voided = FALSE"
+        sql += " GROUP BY market_type"
         cursor = await self._conn.execute(sql)
         rows = await cursor.fetchall()
-        return [self._row_to_trade(r) for r in rows]
+        return {
+            r[0]: {"trades": r[1], "pnl": r[2], "brier_sum": r[3], "wins": r[4]}
+            for r in rows
+        }
 
     # ------------------------------------------------------------------
     # Calibration
     # ------------------------------------------------------------------
 
     async def load_calibration(self) -> List[CalibrationBucket]:
+        cursor = await self._conn.execute("SELECT bucket_range, alpha, beta FROM calibration_state")
+        stored = {r[0]: (r[1], r[2]) for r in await cursor.fetchall()}
         buckets = []
         for br in CALIBRATION_BUCKET_RANGES:
-            key = f"{br[0]}-{br[1]}"
-            cursor = await self._conn.execute(
-                "SELECT alpha, beta FROM calibration_state WHERE bucket_range = ?",
-                (key,),
-            )
-            row = await cursor.fetchone()
+            row = stored.get(f"{br[0]}-{br[1]}")
             if row:
-                buckets.append(CalibrationBucket(br, alpha=row["alpha"], beta=row["beta"]))
+                buckets.append(CalibrationBucket(br, alpha=row[0], beta=row[1]))
             else:
                 buckets.append(CalibrationBucket(br))
         return buckets
 
     async def save_calibration(self, buckets: List[CalibrationBucket]) -> None:
         now = _utcnow().isoformat()
+        rows = []
         for b in buckets:
             key = f"{b.bucket_range[0]}-{b.bucket_range[1]}"
-            await self._conn.execute(
-                """INSERT INTO calibration_state (bucket_range, alpha, beta, updated_at)
-                   VALUES (?, ?, ?, ?)
-                   ON CONFLICT(bucket_range) DO UPDATE SET alpha=?, beta=?, updated_at=?""",
-                (key, b.alpha, b.beta, now, b.alpha, b.beta, now),
-            )
-        await self._conn.commit()
+            rows.append((key, b.alpha, b.beta, now))
+        await self._upsert_many(
+            """INSERT INTO calibration_state (bucket_range, alpha, beta, updated_at)
+               VALUES (?, ?, ?, ?)
+               ON CONFLICT(bucket_range) DO UPDATE SET
+               alpha=excluded.alpha, beta=excluded.beta, updated_at=excluded.updated_at""",
+            rows,
+        )
 
     # ------------------------------------------------------------------
     # Market Type Performance
@@ -385,7 +636,7 @@ class Database:
         rows = await cursor.fetchall()
         result = {}
         for row in rows:
-            scores = json.loads(row["brier_scores"] or "[]")
+            scores = _loads(row["brier_scores"] or "[]")
             result[row["market_type"]] = MarketTypePerformance(
                 market_type=row["market_type"],
                 total_trades=row["total_trades"],
@@ -393,6 +644,8 @@ class Database:
                 brier_scores=scores,
                 total_observed=row["total_observed"],
                 counterfactual_pnl=row["counterfactual_pnl"],
+                brier_ew_sum=row["brier_ew_sum"],
+                brier_ew_weight=row["brier_ew_weight"],
             )
         return result
 
@@ -400,83 +653,83 @@ class Database:
         self, perfs: Dict[str, MarketTypePerformance]
     ) -> None:
         now = _utcnow().isoformat()
+        rows = []
         for mtype, p in perfs.items():
-            await self._conn.execute(
-                """INSERT INTO market_type_performance
-                   (market_type, total_trades, total_pnl, brier_scores, total_observed, counterfactual_pnl, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(market_type) DO UPDATE SET
-                   total_trades=?, total_pnl=?, brier_scores=?, total_observed=?, counterfactual_pnl=?, updated_at=?""",
-                (
-                    mtype, p.total_trades, p.total_pnl, json.dumps(p.brier_scores),
-                    p.total_observed, p.counterfactual_pnl, now,
-                    p.total_trades, p.total_pnl, json.dumps(p.brier_scores),
-                    p.total_observed, p.counterfactual_pnl, now,
-                ),
-            )
-        await self._conn.commit()
+            scores = _dumps(p.brier_scores)
+            rows.append((
+                mtype, p.total_trades, p.total_pnl, scores,
+                p.total_observed, p.counterfactual_pnl,
+                p.brier_ew_sum, p.brier_ew_weight, now,
+            ))
+        await self._upsert_many(
+            """INSERT INTO market_type_performance
+               (market_type, total_trades, total_pnl, brier_scores, total_observed, counterfactual_pnl,
+                brier_ew_sum, brier_ew_weight, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(market_type) DO UPDATE SET
+               total_trades=excluded.total_trades, total_pnl=excluded.total_pnl,
+               brier_scores=excluded.brier_scores, total_observed=excluded.total_observed,
+               counterfactual_pnl=excluded.counterfactual_pnl,
+               brier_ew_sum=excluded.brier_ew_sum, brier_ew_weight=excluded.brier_ew_weight,
+               updated_at=excluded.updated_at""",
+            rows,
+        )
 
     # ------------------------------------------------------------------
     # Signal Trackers
     # ------------------------------------------------------------------
 
     async def load_signal_trackers(self) -> Dict[Tuple[str, str, str], SignalTracker]:
-        cursor = await self._conn.execute("SELECT * FROM signal_trackers")
-        rows = await cursor.fetchall()
-        result = {}
-        for row in rows:
-            key = (row["source_tier"], row["info_type"], row["market_type"])
-            result[key] = SignalTracker(
-                source_tier=row["source_tier"],
-                info_type=row["info_type"],
-                market_type=row["market_type"],
-                present_in_winning_trades=row["present_winning"],
-                present_in_losing_trades=row["present_losing"],
-                absent_in_winning_trades=row["absent_winning"],
-                absent_in_losing_trades=row["absent_losing"],
-            )
-        return result
+        # Columns in SignalTracker field order, so each row unpacks positionally.
+        cursor = await self._conn.execute(
+            """SELECT source_tier, info_type, market_type, present_winning, present_losing,
+                      absent_winning, absent_losing
+               FROM signal_trackers"""
+        )
+        return {(r[0], r[1], r[2]): SignalTracker(*r) for r in await cursor.fetchall()}
 
     async def save_signal_trackers(
         self, trackers: Dict[Tuple[str, str, str], SignalTracker]
     ) -> None:
         now = _utcnow().isoformat()
-        for _key, t in trackers.items():
-            await self._conn.execute(
-                """INSERT INTO signal_trackers
-                   (source_tier, info_type, market_type, present_winning, present_losing,
-                    absent_winning, absent_losing, last_updated)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(source_tier, info_type, market_type) DO UPDATE SET
-                   present_winning=?, present_losing=?, absent_winning=?, absent_losing=?, last_updated=?""",
-                (
-                    t.source_tier, t.info_type, t.market_type,
-                    t.present_in_winning_trades, t.present_in_losing_trades,
-                    t.absent_in_winning_trades, t.absent_in_losing_trades, now,
-                    t.present_in_winning_trades, t.present_in_losing_trades,
-                    t.absent_in_winning_trades, t.absent_in_losing_trades, now,
-                ),
+        rows = [
+            (
+                t.source_tier, t.info_type, t.market_type,
+                t.present_in_winning_trades, t.present_in_losing_trades,
+                t.absent_in_winning_trades, t.absent_in_losing_trades, now,
             )
-        await self._conn.commit()
+            for t in trackers.values()
+        ]
+        await self._upsert_many(
+            """INSERT INTO signal_trackers
+               (source_tier, info_type, market_type, present_winning, present_losing,
+                absent_winning, absent_losing, last_updated)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(source_tier, info_type, market_type) DO UPDATE SET
+               present_winning=excluded.present_winning, present_losing=excluded.present_losing,
+               absent_winning=excluded.absent_winning, absent_losing=excluded.absent_losing,
+               last_updated=excluded.last_updated""",
+            rows,
+        )
 
     # ------------------------------------------------------------------
     # Experiment Runs
     # ------------------------------------------------------------------
 
-    async def save_experiment(self, run: ExperimentRun) -> None:
-        await self._conn.execute(
-            """INSERT INTO experiment_runs
-               (run_id, started_at, ended_at, config_snapshot, description, model_used,
-                include_in_learning, total_trades, total_pnl, avg_brier, sharpe_ratio)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                run.run_id, _iso(run.started_at), _iso(run.ended_at),
-                json.dumps(run.config_snapshot), run.description, run.model_used,
-                run.include_in_learning, run.total_trades, run.total_pnl,
-                run.avg_brier, run.sharpe_ratio,
-            ),
-        )
-        await self._conn.commit()
+    async def save_experiment(self, run: ExperimentRun, commit: bool = True) -> None:
+        async with self._autocommit(commit):
+            await self._conn.execute(
+                """INSERT INTO experiment_runs
+                   (run_id, started_at, ended_at, config_snapshot, description, model_used,
+                    include_in_learning, total_trades, total_pnl, avg_brier, sharpe_ratio)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    run.run_id, _iso(run.started_at), _iso(run.ended_at),
+                    _dumps(run.config_snapshot), run.description, run.model_used,
+                    run.include_in_learning, run.total_trades, run.total_pnl,
+                    run.avg_brier, run.sharpe_ratio,
+                ),
+            )
 
     async def get_current_experiment(self) -> Optional[ExperimentRun]:
         cursor = await self._conn.execute(
@@ -489,7 +742,7 @@ class Database:
             run_id=row["run_id"],
             started_at=_parse_dt(row["started_at"]) or _utcnow(),
             ended_at=_parse_dt(row["ended_at"]),
-            config_snapshot=json.loads(row["config_snapshot"] or "{}"),
+            config_snapshot=_loads(row["config_snapshot"] or "{}"),
             description=row["description"] or "",
             model_used=row["model_used"],
             include_in_learning=bool(row["include_in_learning"]),
@@ -499,17 +752,17 @@ class Database:
             sharpe_ratio=row["sharpe_ratio"],
         )
 
-    async def end_experiment(self, run_id: str, stats: dict) -> None:
+    async def end_experiment(self, run_id: str, stats: dict, commit: bool = True) -> None:
         now = _utcnow().isoformat()
-        await self._conn.execute(
-            """UPDATE experiment_runs SET ended_at=?, total_trades=?, total_pnl=?,
-               avg_brier=?, sharpe_ratio=? WHERE run_id=?""",
-            (
-                now, stats.get("total_trades", 0), stats.get("total_pnl", 0.0),
-                stats.get("avg_brier", 0.0), stats.get("sharpe_ratio", 0.0), run_id,
-            ),
-        )
-        await self._conn.commit()
+        async with self._autocommit(commit):
+            await self._conn.execute(
+                """UPDATE experiment_runs SET ended_at=?, total_trades=?, total_pnl=?,
+                   avg_brier=?, sharpe_ratio=? WHERE run_id=?""",
+                (
+                    now, stats.get("total_trades", 0), stats.get("total_pnl", 0.0),
+                    stats.get("avg_brier", 0.0), stats.get("sharpe_ratio", 0.0), run_id,
+                ),
+            )
 
     # ------------------------------------------------------------------
     # Portfolio
@@ -530,27 +783,26 @@ class Database:
 
     async def init_portfolio_if_missing(self, initial_bankroll: float) -> None:
         now = _utcnow().isoformat()
-        await self._conn.execute(
-            """INSERT OR IGNORE INTO portfolio
-               (id, cash_balance, total_equity, total_pnl, peak_equity, max_drawdown, updated_at)
-               VALUES (1, ?, ?, 0.0, ?, 0.0, ?)""",
-            (initial_bankroll, initial_bankroll, initial_bankroll, now),
-        )
-        await self._conn.commit()
+        async with self.transaction():
+            await self._conn.execute(
+                """INSERT OR IGNORE INTO portfolio
+                   (id, cash_balance, total_equity, total_pnl, peak_equity, max_drawdown, updated_at)
+                   VALUES (1, ?, ?, 0.0, ?, 0.0, ?)""",
+                (initial_bankroll, initial_bankroll, initial_bankroll, now),
+            )
 
-    async def save_portfolio(self, p: Portfolio) -> None:
+    async def save_portfolio(self, p: Portfolio, commit: bool = True) -> None:
         now = _utcnow().isoformat()
-        await self._conn.execute(
-            """INSERT INTO portfolio (id, cash_balance, total_equity, total_pnl, peak_equity, max_drawdown, updated_at)
-               VALUES (1, ?, ?, ?, ?, ?, ?)
-               ON CONFLICT(id) DO UPDATE SET
-               cash_balance=?, total_equity=?, total_pnl=?, peak_equity=?, max_drawdown=?, updated_at=?""",
-            (
-                p.cash_balance, p.total_equity, p.total_pnl, p.peak_equity, p.max_drawdown, now,
-                p.cash_balance, p.total_equity, p.total_pnl, p.peak_equity, p.max_drawdown, now,
-            ),
-        )
-        await self._conn.commit()
+        async with self._autocommit(commit):
+            await self._conn.execute(
+                """INSERT INTO portfolio (id, cash_balance, total_equity, total_pnl, peak_equity, max_drawdown, updated_at)
+                   VALUES (1, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(id) DO UPDATE SET
+                   cash_balance=excluded.cash_balance, total_equity=excluded.total_equity,
+                   total_pnl=excluded.total_pnl, peak_equity=excluded.peak_equity,
+                   max_drawdown=excluded.max_drawdown, updated_at=excluded.updated_at""",
+                (p.cash_balance, p.total_equity, p.total_pnl, p.peak_equity, p.max_drawdown, now),
+            )
 
     # ------------------------------------------------------------------
     # API Costs
@@ -559,24 +811,21 @@ class Database:
     async def increment_api_cost(
         self, service: str, tokens_in: int = 0, tokens_out: int = 0
     ) -> None:
+        """Record one API call's usage; buffered, see flush_buffers()."""
         today = _utcnow().strftime("%Y-%m-%d")
-        # Estimate cost (rough pricing for MiniMax M2)
-        cost = 0.0
-        if service == "minimax":
-            cost = tokens_in * 0.000001 + tokens_out * 0.000005  # approx
-        elif service == "twitter":
-            cost = 0.0075  # per search
-        await self._conn.execute(
-            """INSERT INTO api_costs (date, service, calls, tokens_in, tokens_out, cost_usd)
-               VALUES (?, ?, 1, ?, ?, ?)
-               ON CONFLICT(date, service) DO UPDATE SET
-               calls = calls + 1, tokens_in = tokens_in + ?, tokens_out = tokens_out + ?,
-               cost_usd = cost_usd + ?""",
-            (today, service, tokens_in, tokens_out, cost, tokens_in, tokens_out, cost),
-        )
-        await self._conn.commit()
+        per_in, per_out, per_call = _PRICING.get(service, _NO_PRICING)
+        acc = self._api_cost_buf.get((today, service))
+        if acc is None:
+            acc = self._api_cost_buf[(today, service)] = [0, 0, 0, 0.0]
+        acc[0] += 1
+        acc[1] += tokens_in
+        acc[2] += tokens_out
+        acc[3] += tokens_in * per_in + tokens_out * per_out + per_call
+        if self._note_buffered():
+            await self.flush_buffers()
 
     async def get_today_api_spend(self) -> float:
+        await self.flush_buffers()
         today = _utcnow().strftime("%Y-%m-%d")
         cursor = await self._conn.execute(
             "SELECT COALESCE(SUM(cost_usd), 0) FROM api_costs WHERE date = ?",
@@ -590,33 +839,33 @@ class Database:
     # ------------------------------------------------------------------
 
     async def record_parse_failure(self, market_id: str) -> None:
-        await self._conn.execute(
-            "INSERT INTO parse_failures (market_id) VALUES (?)", (market_id,)
-        )
-        await self._conn.commit()
+        """Record an exhausted-retries parse failure; buffered, see flush_buffers()."""
+        self._parse_fail_buf.append((market_id,))
+        if self._note_buffered():
+            await self.flush_buffers()
 
     async def record_price_snapshot(self, trade_record_id: str, best_bid: float, roi: float, source: str) -> None:
         """Insert a price snapshot for the given trade. Used for retrospective SL analysis."""
-        await self._conn.execute(
-            "INSERT INTO trade_price_snapshots (trade_record_id, best_bid, roi, source) VALUES (?, ?, ?, ?)",
-            (trade_record_id, best_bid, roi, source),
-        )
-        await self._conn.commit()
+        async with self.transaction():
+            await self._conn.execute(
+                "INSERT INTO trade_price_snapshots (trade_record_id, best_bid, roi, source) VALUES (?, ?, ?, ?)",
+                (trade_record_id, best_bid, roi, source),
+            )
 
     # ------------------------------------------------------------------
     # Model Swaps
     # ------------------------------------------------------------------
 
-    async def save_model_swap(self, event: ModelSwapEvent) -> None:
-        await self._conn.execute(
-            """INSERT INTO model_swaps (timestamp, old_model, new_model, reason, experiment_run_started)
-               VALUES (?, ?, ?, ?, ?)""",
-            (
-                _iso(event.timestamp), event.old_model, event.new_model,
-                event.reason, event.experiment_run_started,
-            ),
-        )
-        await self._conn.commit()
+    async def save_model_swap(self, event: ModelSwapEvent, commit: bool = True) -> None:
+        async with self._autocommit(commit):
+            await self._conn.execute(
+                """INSERT INTO model_swaps (timestamp, old_model, new_model, reason, experiment_run_started)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (
+                    _iso(event.timestamp), event.old_model, event.new_model,
+                    event.reason, event.experiment_run_started,
+                ),
+            )
 
     # ------------------------------------------------------------------
     # Daily Reviews
@@ -624,30 +873,30 @@ class Database:
 
     async def save_daily_review(self, review) -> None:
         """Save a daily review record."""
-        await self._conn.execute(
-            """INSERT OR REPLACE INTO daily_reviews
-            (review_date, timestamp, trade_count, skip_count, resolved_count,
-             win_rate, roi_pct, total_pnl, avg_brier_raw, avg_brier_adjusted,
-             brier_by_market_type, calibration_drift, signal_effectiveness,
-             skip_reason_distribution, top_performing_types, worst_performing_types,
-             llm_insights, llm_recommendations, health_status, experiment_run,
-             win_rate_pnl, avg_pnl_brier_raw, avg_pnl_brier_adjusted, pnl_resolved_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                review.review_date, review.timestamp.isoformat(),
-                review.trade_count, review.skip_count, review.resolved_count,
-                review.win_rate, review.roi_pct, review.total_pnl,
-                review.avg_brier_raw, review.avg_brier_adjusted,
-                json.dumps(review.brier_by_market_type), json.dumps(review.calibration_drift),
-                json.dumps(review.signal_effectiveness), json.dumps(review.skip_reason_distribution),
-                json.dumps(review.top_performing_types), json.dumps(review.worst_performing_types),
-                review.llm_insights, json.dumps(review.llm_recommendations),
-                review.health_status, review.experiment_run,
-                review.win_rate_pnl, review.avg_pnl_brier_raw, review.avg_pnl_brier_adjusted,
-                review.pnl_resolved_count,
-            ),
-        )
-        await self._conn.commit()
+        async with self.transaction():
+            await self._conn.execute(
+                """INSERT OR REPLACE INTO daily_reviews
+                (review_date, timestamp, trade_count, skip_count, resolved_count,
+                 win_rate, roi_pct, total_pnl, avg_brier_raw, avg_brier_adjusted,
+                 brier_by_market_type, calibration_drift, signal_effectiveness,
+                 skip_reason_distribution, top_performing_types, worst_performing_types,
+                 llm_insights, llm_recommendations, health_status, experiment_run,
+                 win_rate_pnl, avg_pnl_brier_raw, avg_pnl_brier_adjusted, pnl_resolved_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    review.review_date, review.timestamp.isoformat(),
+                    review.trade_count, review.skip_count, review.resolved_count,
+                    review.win_rate, review.roi_pct, review.total_pnl,
+                    review.avg_brier_raw, review.avg_brier_adjusted,
+                    _dumps(review.brier_by_market_type), _dumps(review.calibration_drift),
+                    _dumps(review.signal_effectiveness), _dumps(review.skip_reason_distribution),
+                    _dumps(review.top_performing_types), _dumps(review.worst_performing_types),
+                    review.llm_insights, _dumps(review.llm_recommendations),
+                    review.health_status, review.experiment_run,
+                    review.win_rate_pnl, review.avg_pnl_brier_raw, review.avg_pnl_brier_adjusted,
+                    review.pnl_resolved_count,
+                ),
+            )
 
     async def get_daily_review(self, date: str):
         """Get a specific daily review by date."""
@@ -685,14 +934,14 @@ class Database:
             total_pnl=row["total_pnl"] or 0.0,
             avg_brier_raw=row["avg_brier_raw"],
             avg_brier_adjusted=row["avg_brier_adjusted"],
-            brier_by_market_type=json.loads(row["brier_by_market_type"]) if row["brier_by_market_type"] else {},
-            calibration_drift=json.loads(row["calibration_drift"]) if row["calibration_drift"] else {},
-            signal_effectiveness=json.loads(row["signal_effectiveness"]) if row["signal_effectiveness"] else {},
-            skip_reason_distribution=json.loads(row["skip_reason_distribution"]) if row["skip_reason_distribution"] else {},
-            top_performing_types=json.loads(row["top_performing_types"]) if row["top_performing_types"] else [],
-            worst_performing_types=json.loads(row["worst_performing_types"]) if row["worst_performing_types"] else [],
+            brier_by_market_type=_loads(row["brier_by_market_type"]) if row["brier_by_market_type"] else {},
+            calibration_drift=_loads(row["calibration_drift"]) if row["calibration_drift"] else {},
+            signal_effectiveness=_loads(row["signal_effectiveness"]) if row["signal_effectiveness"] else {},
+            skip_reason_distribution=_loads(row["skip_reason_distribution"]) if row["skip_reason_distribution"] else {},
+            top_performing_types=_loads(row["top_performing_types"]) if row["top_performing_types"] else [],
+            worst_performing_types=_loads(row["worst_performing_types"]) if row["worst_performing_types"] else [],
             llm_insights=row["llm_insights"] or "",
-            llm_recommendations=json.loads(row["llm_recommendations"]) if row["llm_recommendations"] else [],
+            llm_recommendations=_loads(row["llm_recommendations"]) if row["llm_recommendations"] else [],
             health_status=row["health_status"] or "UNKNOWN",
             experiment_run=row["experiment_run"] or "",
             win_rate_pnl=row["win_rate_pnl"] if "win_rate_pnl" in row.keys() else None,
@@ -714,9 +963,9 @@ class Database:
                 AVG(CASE WHEN action != 'SKIP' AND brier_score_raw IS NOT NULL THEN brier_score_raw ELSE NULL END) as avg_brier_raw,
                 AVG(CASE WHEN action != 'SKIP' AND brier_score_adjusted IS NOT NULL THEN brier_score_adjusted ELSE NULL END) as avg_brier_adjusted
             FROM trade_records
-            WHERE date(timestamp) BETWEEN ? AND ?
+            WHERE timestamp >= ? AND timestamp < ?
               AND voided = FALSE""",
-            (start_date, end_date),
+            (start_date, _day_bounds(end_date)[1]),
         )
         row = await cursor.fetchone()
         return {
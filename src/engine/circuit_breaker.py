@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import structlog
+
+log = structlog.get_logger()
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class OpenCircuitError(Exception):
+    """Raised instead of making the call while the breaker is open."""
+
+
+class AsyncCircuitBreaker:
+    """CLOSED -> OPEN -> HALF_OPEN breaker for one upstream provider.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    every call fails fast with OpenCircuitError. Once ``recovery_timeout``
+    seconds have passed, up to ``half_open_max_calls`` probe calls go through:
+    a success closes the breaker, a failure re-opens it for another timeout.
+
+    ``is_failure`` decides which exceptions count against the provider; those
+    it rejects (e.g. a 400 for one bad request) still propagate but count as
+    the provider having answered.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Optional[Callable[[Exception], bool]] = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._is_failure = is_failure
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return HALF_OPEN
+        return self._state
+
+    async def call(self, coro_factory: Callable[[], Awaitable[T]]) -> T:
+        """Await ``coro_factory()`` through the breaker.
+
+        Raises OpenCircuitError without calling the factory when open, or
+        when half-open and the probe slots are taken.
+        """
+        state = self.state
+        if state == OPEN or (state == HALF_OPEN and self._half_open_calls >= self.half_open_max_calls):
+            raise OpenCircuitError(self.name)
+        if state == HALF_OPEN:
+            self._state = HALF_OPEN
+            self._half_open_calls += 1
+
+        try:
+            result = await coro_factory()
+        except Exception as e:
+            if self._is_failure is None or self._is_failure(e):
+                self._on_failure()
+            else:
+                self._on_success()
+            raise
+        except BaseException:
+            # Cancelled probe: free its slot so the breaker can't wedge half-open.
+            if self._state == HALF_OPEN:
+                self._half_open_calls -= 1
+            raise
+        self._on_success()
+        return result
+
+    def _on_success(self) -> None:
+        if self._state != CLOSED:
+            log.info("circuit_closed", name=self.name)
+        self._state = CLOSED
+        self._failures = 0
+        self._half_open_calls = 0
+
+    def _on_failure(self) -> None:
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            log.warning("circuit_opened", name=self.name, failures=self._failures)
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+            self._failures = 0
+            self._half_open_calls = 0
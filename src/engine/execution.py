@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import random
-import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -14,10 +13,14 @@ from src.models import (
     Position,
     TradeCandidate,
     TradeRecord,
+    new_record_id,
 )
 
 log = structlog.get_logger()
 
+# TradeCandidate.side is canonical upper-case ("BUY_YES" / "BUY_NO").
+_YES_SIDES = frozenset({"BUY_YES", "YES"})
+
 
 def simulate_execution(
     side: str,
@@ -35,6 +38,9 @@ def simulate_execution(
     """
     if execution_type == "maker":
         fill_probability = 0.4 + 0.4 * (1 - abs(price - 0.5))
+        # A single stdlib draw per fill: this runs once per executed candidate,
+        # and random.random() is cheaper than indexing a NumPy scalar out of a
+        # pre-drawn buffer. It is also the hook the fill tests patch.
         filled = random.random() < fill_probability
         return ExecutionResult(
             executed_price=price,
@@ -44,12 +50,9 @@ def simulate_execution(
         )
     else:  # taker
         slippage = 0.005 + 0.01 * min(size_usd / max(orderbook_depth, 1), 1.0)
-        if "YES" in side.upper():
-            executed_price = price + slippage
-        else:
-            executed_price = price - slippage
-        # Clamp to [0.01, 0.99]
-        executed_price = max(0.01, min(0.99, executed_price))
+        # YES buys pay up, NO buys receive a lower price; clamp to [0.01, 0.99]
+        sign = 1.0 if side in _YES_SIDES else -1.0
+        executed_price = min(0.99, max(0.01, price + sign * slippage))
         return ExecutionResult(
             executed_price=executed_price,
             slippage=slippage,
@@ -69,6 +72,7 @@ async def execute_trade(
 ) -> Optional[TradeRecord]:
     """Execute a trade (paper or live) and create trade record.
 
+    ``db`` must be the process's shared Database, not a fresh connection.
     Returns None if order is not filled (maker orders).
     """
     market = candidate.market
@@ -122,7 +126,7 @@ async def execute_trade(
     from src.backtest.clock import Clock
     now = Clock.utcnow()
     record = TradeRecord(
-        record_id=str(uuid.uuid4()),
+        record_id=new_record_id(),
         experiment_run=experiment_run,
         timestamp=now,
         model_used=model_used,
@@ -168,10 +172,12 @@ async def execute_trade(
         market_cluster_id=candidate.market_cluster_id,
     ))
     await db.save_trade_with_portfolio(record, portfolio)
-    log.info("trade_executed",
-             market_id=market.market_id,
-             side=candidate.side,
-             size=candidate.position_size,
-             price=result.executed_price,
-             slippage=result.slippage)
+    # DEBUG: every paper fill is already persisted and alerted; the structured
+    # record is only worth building when someone has asked for it.
+    log.debug("trade_executed",
+              market_id=market.market_id,
+              side=candidate.side,
+              size=candidate.position_size,
+              price=result.executed_price,
+              slippage=result.slippage)
     return record
@@ -1,22 +1,59 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import random
 import re
 from typing import Optional
 
 import httpx
+import orjson
 import structlog
 from pydantic import BaseModel, Field, ValidationError
 
 from src.config import Settings
 from src.db.sqlite import Database
+from src.engine.circuit_breaker import AsyncCircuitBreaker, OpenCircuitError
+
+# HTTP/2 needs the optional ``h2`` package (httpx[http2]); fall back to
+# HTTP/1.1 keep-alive when it isn't installed.
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:  # pragma: no cover
+    _HTTP2 = False
 
 log = structlog.get_logger()
 
 MAX_RETRIES = 2
 REQUIRED_FIELDS = {"estimated_probability", "confidence", "reasoning"}
 
+# Transport/5xx/429 retries: exponential backoff with full jitter so clients
+# hitting the same outage don't retry in lockstep.
+BASE_BACKOFF = 0.5
+MAX_BACKOFF = 8.0
+_RETRY_AFTER_CAP_SECONDS = 30.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter delay: U(0, min(MAX_BACKOFF, BASE_BACKOFF * 2^attempt))."""
+    return random.uniform(0.0, min(MAX_BACKOFF, BASE_BACKOFF * (2 ** attempt)))
+
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    """Seconds requested by a 429's Retry-After header, capped; None if absent."""
+    try:
+        return min(float(resp.headers["Retry-After"]), _RETRY_AFTER_CAP_SECONDS)
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+def _is_provider_failure(e: Exception) -> bool:
+    """Transport errors, 429 and 5xx count against the provider; other 4xx don't."""
+    if isinstance(e, httpx.HTTPStatusError):
+        status = e.response.status_code
+        return status >= 500 or status == 429
+    return True
+
 
 class PrescreenResult(BaseModel):
     estimated_probability: float = Field(ge=0.0, le=1.0)
@@ -61,33 +98,42 @@ CONFIDENCE SCALE:
 OUTPUT: Return ONLY valid JSON, no markdown or extra text."""
 
 
+_THINK_BLOCK = re.compile(r'<think>.*?</think>', re.DOTALL)
+_FENCE_OPEN = re.compile(r'^```(?:json)?\s*\n?', re.MULTILINE)
+_FENCE_CLOSE = re.compile(r'\n?```\s*$', re.MULTILINE)
+_FLAT_OBJECT = re.compile(r'\{[^{}]*\}', re.DOTALL)
+
+
 def parse_json_safe(raw: str) -> Optional[dict]:
     """Parse JSON with multiple fallback strategies."""
     text = raw.strip()
     # Strip <think>...</think> blocks (reasoning models like MiMo)
-    text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL).strip()
-    # Direct parse
+    if "<think>" in text:
+        text = _THINK_BLOCK.sub('', text).strip()
+    # Direct parse: the common case returns here without running any regex.
     try:
-        return json.loads(text)
-    except (json.JSONDecodeError, ValueError):
+        return orjson.loads(text)
+    except (orjson.JSONDecodeError, ValueError):
         pass
     # Strip markdown fences
-    fenced = re.sub(r'^```(?:json)?\s*\n?', '', text, flags=re.MULTILINE)
-    fenced = re.sub(r'\n?```\s*$', '', fenced, flags=re.MULTILINE)
-    try:
-        return json.loads(fenced.strip())
-    except (json.JSONDecodeError, ValueError):
-        pass
+    if "```" in text:
+        fenced = _FENCE_CLOSE.sub('', _FENCE_OPEN.sub('', text))
+        try:
+            return orjson.loads(fenced.strip())
+        except (orjson.JSONDecodeError, ValueError):
+            pass
     # Find last {...} block (reasoning models may have JSON at end)
-    matches = list(re.finditer(r'\{[^{}]*\}', text, re.DOTALL))
-    for m in reversed(matches):
+    for m in reversed(_FLAT_OBJECT.findall(text)):
         try:
-            return json.loads(m.group())
-        except (json.JSONDecodeError, ValueError):
+            return orjson.loads(m)
+        except (orjson.JSONDecodeError, ValueError):
             pass
     return None
 
 
+_MISSING = object()
+
+
 def _validate_llm_response(data: dict) -> Optional[dict]:
     """Validate and coerce LLM response fields.
 
@@ -95,34 +141,44 @@ def _validate_llm_response(data: dict) -> Optional[dict]:
     confidence: optional, defaults to 0.50 if missing; must be in [0, 1] if present.
     reasoning: optional, defaults to "" if missing.
     """
-    # --- estimated_probability: strict ---
-    if "estimated_probability" not in data:
+    # One lookup per field; float() only when orjson didn't already give a float.
+    if not isinstance(data, dict):
         log.warning("llm_missing_fields", missing=["estimated_probability"])
         return None
-    try:
-        prob = float(data["estimated_probability"])
-    except (ValueError, TypeError):
-        log.warning("llm_invalid_types", field="estimated_probability")
+    get = data.get
+
+    # --- estimated_probability: strict ---
+    prob = get("estimated_probability", _MISSING)
+    if prob is _MISSING:
+        log.warning("llm_missing_fields", missing=["estimated_probability"])
         return None
-    if not (0 <= prob <= 1):
+    if type(prob) is not float:
+        try:
+            prob = float(prob)
+        except (ValueError, TypeError):
+            log.warning("llm_invalid_types", field="estimated_probability")
+            return None
+    if not (0.0 <= prob <= 1.0):
         log.warning("llm_out_of_range", field="estimated_probability", value=prob)
         return None
     data["estimated_probability"] = prob
 
     # --- confidence: optional, default 0.50 ---
-    if "confidence" not in data:
+    conf = get("confidence", _MISSING)
+    if conf is _MISSING:
         log.info("llm_default_confidence", market="unknown")
-        data["confidence"] = 0.50
+        conf = 0.50
     else:
-        try:
-            conf = float(data["confidence"])
-        except (ValueError, TypeError):
-            log.warning("llm_invalid_types", field="confidence")
-            return None
-        if not (0 <= conf <= 1):
+        if type(conf) is not float:
+            try:
+                conf = float(conf)
+            except (ValueError, TypeError):
+                log.warning("llm_invalid_types", field="confidence")
+                return None
+        if not (0.0 <= conf <= 1.0):
             log.warning("llm_out_of_range", field="confidence", value=conf)
             return None
-        data["confidence"] = conf
+    data["confidence"] = conf
 
     # --- reasoning: optional, default "" ---
     if "reasoning" not in data:
@@ -140,6 +196,50 @@ class LLMClient:
         self._model = settings.LLM_MODEL
         self._settings = settings
         self._timeout = httpx.Timeout(30.0, connect=10.0)
+        self._client: httpx.AsyncClient | None = None
+        self._provider = "mimo" if "xiaomimimo" in self._base_url else "minimax"
+        # Trips after repeated provider failures so an outage costs one fast
+        # error per market instead of a full retry cycle.
+        self._breaker = AsyncCircuitBreaker(self._provider, is_failure=_is_provider_failure)
+        # Bulkhead: surplus callers queue here rather than oversubscribing the
+        # provider. Sized to the connection pool so neither limit hides the other.
+        self._max_concurrency = settings.LLM_MAX_CONCURRENCY
+        self._sem = asyncio.Semaphore(self._max_concurrency)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return this client's pooled HTTP client, creating it on first use.
+
+        Reusing one AsyncClient keeps the TLS connection to the provider warm
+        across calls instead of handshaking per request.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                http2=_HTTP2,
+                limits=httpx.Limits(
+                    max_connections=self._max_concurrency,
+                    max_keepalive_connections=self._max_concurrency,
+                ),
+                headers={
+                    "Authorization": f"Bearer {self._api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (called on bot shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _do_post(self, payload: dict) -> dict:
+        async with self._sem:
+            resp = await self._get_client().post(
+                f"{self._base_url}/chat/completions", json=payload,
+            )
+        resp.raise_for_status()
+        return resp.json()
 
     async def complete(
         self,
@@ -163,27 +263,16 @@ class LLMClient:
         if response_format is not None:
             payload["response_format"] = response_format
 
-        provider = "mimo" if "xiaomimimo" in self._base_url else "minimax"
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.post(
-                f"{self._base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self._api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            content = data["choices"][0]["message"]["content"]
-            # Track API cost
-            usage = data.get("usage", {})
-            await self._db.increment_api_cost(
-                provider,
-                tokens_in=usage.get("prompt_tokens", 0),
-                tokens_out=usage.get("completion_tokens", 0),
-            )
-            return content
+        data = await self._breaker.call(lambda: self._do_post(payload))
+        content = data["choices"][0]["message"]["content"]
+        # Track API cost
+        usage = data.get("usage", {})
+        await self._db.increment_api_cost(
+            self._provider,
+            tokens_in=usage.get("prompt_tokens", 0),
+            tokens_out=usage.get("completion_tokens", 0),
+        )
+        return content
 
     async def call_grok_with_retry(self, context: str, market_id: str) -> Optional[dict]:
         """Call LLM with retry pipeline. MAX_RETRIES=2 (total 3 attempts)."""
@@ -206,14 +295,22 @@ class LLMClient:
 
                 return validated
 
+            except OpenCircuitError:
+                log.warning("grok_circuit_open", market_id=market_id)
+                return None
             except httpx.HTTPStatusError as e:
-                log.warning("llm_http_error", status=e.response.status_code, attempt=attempt)
+                status = e.response.status_code
+                log.warning("llm_http_error", status=status, attempt=attempt)
+                if status < 500 and status != 429:
+                    # Bad request / auth: every retry would fail the same way.
+                    break
                 if attempt < MAX_RETRIES:
-                    await asyncio.sleep(1.0 * (attempt + 1))
+                    delay = _retry_after(e.response) if status == 429 else None
+                    await asyncio.sleep(delay if delay is not None else _backoff_delay(attempt))
             except Exception as e:
                 log.error("llm_error", error=str(e), attempt=attempt)
                 if attempt < MAX_RETRIES:
-                    await asyncio.sleep(1.0 * (attempt + 1))
+                    await asyncio.sleep(_backoff_delay(attempt))
 
         # All retries exhausted
         log.error("llm_all_retries_failed", market_id=market_id)
@@ -258,6 +355,9 @@ class LLMClient:
                     if attempt == 0:
                         await asyncio.sleep(1.0)
                     continue
+            except OpenCircuitError:
+                log.warning("prescreen_circuit_open", market_id=market_id)
+                return None
             except Exception as e:
                 log.warning("prescreen_error", error=str(e), attempt=attempt, market_id=market_id)
                 if attempt == 0:
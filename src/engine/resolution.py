@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import List, Optional
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
 
 import structlog
 
@@ -11,6 +12,28 @@ from src.models import Portfolio, TradeRecord
 
 log = structlog.get_logger()
 
+# Concurrent get_market calls per cycle. Only the fetches overlap; the
+# per-trade processing after them stays sequential since it mutates shared
+# portfolio state.
+MARKET_FETCH_CONCURRENCY = 8
+
+
+async def _fetch_markets(polymarket_client, trades: List[TradeRecord]) -> Dict[str, object]:
+    """get_market once per distinct market_id, bounded-concurrently.
+
+    Maps market_id to the Market (or None); a failed fetch maps to its
+    exception so the caller can log it against the trade.
+    """
+    market_ids = list(dict.fromkeys(t.market_id for t in trades))
+    sem = asyncio.Semaphore(MARKET_FETCH_CONCURRENCY)
+
+    async def fetch(market_id: str):
+        async with sem:
+            return await polymarket_client.get_market(market_id)
+
+    results = await asyncio.gather(*(fetch(m) for m in market_ids), return_exceptions=True)
+    return dict(zip(market_ids, results))
+
 
 def calculate_pnl(record: TradeRecord, outcome: bool) -> float:
     """Calculate PnL for a resolved trade (cost-based; matches calculate_early_exit_pnl).
@@ -62,18 +85,30 @@ async def auto_resolve_trades(db: Database, polymarket_client) -> List[TradeReco
     resolved_count = 0
     newly_resolved: List[TradeRecord] = []
 
+    # Equity is maintained incrementally: each resolution subtracts its
+    # position's value instead of re-summing every remaining position.
+    value_by_market: Dict[str, float] = {}
+    for p in portfolio.open_positions:
+        value_by_market[p.market_id] = value_by_market.get(p.market_id, 0.0) + p.current_value
+    positions_value = sum(value_by_market.values())
+    closed_market_ids: Set[str] = set()
+
+    markets = await _fetch_markets(polymarket_client, open_trades)
+    # One cycle time for the "is it past resolution yet" checks below.
+    now = Clock.utcnow()
     for trade in open_trades:
         try:
-            market = await polymarket_client.get_market(trade.market_id)
+            market = markets[trade.market_id]
+            if isinstance(market, BaseException):
+                raise market
             if market is None:
                 continue
 
             if not market.resolved:
                 # For crypto_15m: check if past expected resolution time
                 if trade.market_type == "crypto_15m":
-                    now = Clock.utcnow()
                     expected_resolution = trade.timestamp.replace(tzinfo=timezone.utc) if trade.timestamp.tzinfo is None else trade.timestamp
-                    expected_resolution = expected_resolution + __import__('datetime').timedelta(hours=trade.resolution_window_hours)
+                    expected_resolution = expected_resolution + timedelta(hours=trade.resolution_window_hours)
                     if now < expected_resolution:
                         continue
                     # Past resolution time but market not resolved - check current price
@@ -89,9 +124,8 @@ async def auto_resolve_trades(db: Database, polymarket_client) -> List[TradeReco
                 else:
                     _res_dt = trade.resolution_datetime
                     if _res_dt is not None:
-                        _now = Clock.utcnow()
                         _res_dt_aware = _res_dt.replace(tzinfo=timezone.utc) if _res_dt.tzinfo is None else _res_dt
-                        hours_past = (_now - _res_dt_aware).total_seconds() / 3600
+                        hours_past = (now - _res_dt_aware).total_seconds() / 3600
                     else:
                         hours_past = 0.0
                     log.info(
@@ -139,13 +173,9 @@ async def auto_resolve_trades(db: Database, polymarket_client) -> List[TradeReco
                 cash_before_exit = portfolio.cash_balance
                 portfolio.total_pnl += pnl
                 portfolio.cash_balance += trade.position_size_usd + pnl
-                portfolio.total_equity = portfolio.cash_balance + sum(
-                    p.current_value for p in portfolio.open_positions
-                    if p.market_id != trade.market_id
-                )
-                portfolio.open_positions = [
-                    p for p in portfolio.open_positions if p.market_id != trade.market_id
-                ]
+                positions_value -= value_by_market.pop(trade.market_id, 0.0)
+                closed_market_ids.add(trade.market_id)
+                portfolio.total_equity = portfolio.cash_balance + positions_value
                 if portfolio.total_equity > portfolio.peak_equity:
                     portfolio.peak_equity = portfolio.total_equity
                 drawdown = (portfolio.peak_equity - portfolio.total_equity) / portfolio.peak_equity if portfolio.peak_equity > 0 else 0
@@ -180,6 +210,10 @@ async def auto_resolve_trades(db: Database, polymarket_client) -> List[TradeReco
             log.error("resolution_error", market_id=trade.market_id, error=str(e))
             continue
 
+    if closed_market_ids:
+        portfolio.open_positions = [
+            p for p in portfolio.open_positions if p.market_id not in closed_market_ids
+        ]
     if resolved_count:
         log.info("resolution_cycle_complete", resolved=resolved_count)
 
@@ -239,13 +273,19 @@ async def check_early_exits(
     if not open_trades:
         return
 
+    # Already-exited trades are left to auto_resolve_trades for natural resolution.
+    open_trades = [t for t in open_trades if t.exit_type is None]
+    if not open_trades:
+        return
+
     portfolio = await db.load_portfolio()
 
+    markets = await _fetch_markets(polymarket_client, open_trades)
     for trade in open_trades:
-        if trade.exit_type is not None:
-            continue  # Already exited — auto_resolve_trades handles natural resolution
         try:
-            market = await polymarket_client.get_market(trade.market_id)
+            market = markets[trade.market_id]
+            if isinstance(market, BaseException):
+                raise market
             if market is None or market.resolved:
                 continue  # Let normal resolution handle resolved markets
 
@@ -329,9 +369,12 @@ async def update_unrealized_adverse_moves(db: Database, polymarket_client) -> No
     """Track unrealized adverse moves for Monk Mode cooldown."""
     open_trades = await db.get_open_trades()
 
+    markets = await _fetch_markets(polymarket_client, open_trades)
     for trade in open_trades:
         try:
-            market = await polymarket_client.get_market(trade.market_id)
+            market = markets[trade.market_id]
+            if isinstance(market, BaseException):
+                raise market
             if market is None:
                 continue
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import structlog
 
@@ -185,41 +186,87 @@ def kelly_size(
     return position
 
 
+@dataclass
+class MonkModeCache:
+    """Per-scan aggregates over today's and this week's trades for check_monk_mode.
+
+    Built once per ranking pass so each candidate's check is O(1) in the trade
+    count; call add_trade() for every trade executed during the pass.
+    """
+    tier_counts: Dict[int, int] = field(default_factory=dict)
+    today_pnl: float = 0.0
+    week_pnl: float = 0.0
+    executed_today: List[TradeRecord] = field(default_factory=list)
+    _recent: Optional[List[TradeRecord]] = field(default=None, repr=False)
+
+    @classmethod
+    def build(cls, today_trades: List[TradeRecord], week_trades: list) -> MonkModeCache:
+        cache = cls(week_pnl=sum(t.pnl for t in week_trades if t.pnl is not None))
+        for t in today_trades:
+            cache.add_trade(t)
+        return cache
+
+    def add_trade(self, t: TradeRecord) -> None:
+        if t.pnl is not None:
+            self.today_pnl += t.pnl
+        if t.action != "SKIP":
+            self.tier_counts[t.tier] = self.tier_counts.get(t.tier, 0) + 1
+            self.executed_today.append(t)
+            self._recent = None
+
+    @property
+    def recent_executed(self) -> List[TradeRecord]:
+        """Today's executed trades, newest first."""
+        if self._recent is None:
+            self._recent = sorted(self.executed_today, key=lambda t: t.timestamp, reverse=True)
+        return self._recent
+
+
 def check_monk_mode(
     config: MonkModeConfig,
     trade_signal: TradeCandidate,
     portfolio: Portfolio,
     today_trades: List[TradeRecord],
-    week_trades: List[TradeRecord],
+    week_trades: list,  # only .pnl is read; accepts get_week_trades(fields=("pnl",)) rows
     api_spend: float,
+    cache: Optional[MonkModeCache] = None,
 ) -> Tuple[bool, Optional[str]]:
-    """Check Monk Mode constraints. Returns (allowed, reason_if_blocked)."""
+    """Check Monk Mode constraints. Returns (allowed, reason_if_blocked).
+
+    Pass ``cache`` when checking several candidates against the same trades;
+    without it the aggregates are rebuilt from today_trades/week_trades.
+    """
+    # Cheapest checks first: when the day's budget or exposure is exhausted,
+    # candidates are rejected before any trade aggregates are built.
+    # 1. API budget ($8/day)
+    if api_spend >= config.daily_api_budget_usd:
+        return False, "api_budget_exceeded"
+
+    # 2. Max total exposure (30%)
+    total_exposure = sum(p.size_usd for p in portfolio.open_positions)
+    if portfolio.total_equity > 0 and (total_exposure + trade_signal.position_size) / portfolio.total_equity > config.max_total_exposure_pct:
+        return False, "max_total_exposure"
+
+    if cache is None:
+        cache = MonkModeCache.build(today_trades, week_trades)
 
-    # 1. Tier daily cap
+    # 3. Tier daily cap
     tier = trade_signal.tier
-    tier_trades_today = [t for t in today_trades if t.tier == tier and t.action != "SKIP"]
     cap = config.tier1_daily_trade_cap if tier == 1 else config.tier2_daily_trade_cap
-    if len(tier_trades_today) >= cap:
+    if cache.tier_counts.get(tier, 0) >= cap:
         return False, f"tier{tier}_daily_cap_reached"
 
-    # 2. Daily loss limit (-5%)
-    today_pnl = sum(t.pnl or 0 for t in today_trades if t.pnl is not None)
-    if portfolio.total_equity > 0 and today_pnl / portfolio.total_equity < -config.daily_loss_limit_pct:
+    # 4. Daily loss limit (-5%)
+    if portfolio.total_equity > 0 and cache.today_pnl / portfolio.total_equity < -config.daily_loss_limit_pct:
         return False, "daily_loss_limit"
 
-    # 3. Weekly loss limit (-10%)
-    week_pnl = sum(t.pnl or 0 for t in week_trades if t.pnl is not None)
-    if portfolio.total_equity > 0 and week_pnl / portfolio.total_equity < -config.weekly_loss_limit_pct:
+    # 5. Weekly loss limit (-10%)
+    if portfolio.total_equity > 0 and cache.week_pnl / portfolio.total_equity < -config.weekly_loss_limit_pct:
         return False, "weekly_loss_limit"
 
-    # 4. Consecutive adverse (3 losses including unrealized adverse moves >10%)
-    recent_trades = sorted(
-        [t for t in today_trades if t.action != "SKIP"],
-        key=lambda t: t.timestamp,
-        reverse=True,
-    )
+    # 6. Consecutive adverse (3 losses including unrealized adverse moves >10%)
     consecutive_adverse = 0
-    for t in recent_trades[:config.consecutive_loss_cooldown + 2]:
+    for t in cache.recent_executed[:config.consecutive_loss_cooldown + 2]:
         is_adverse = (t.pnl is not None and t.pnl < 0) or (
             t.unrealized_adverse_move is not None and t.unrealized_adverse_move > 0.10
         )
@@ -230,15 +277,6 @@ def check_monk_mode(
     if consecutive_adverse >= config.consecutive_loss_cooldown:
         return False, f"consecutive_adverse_{consecutive_adverse}"
 
-    # 5. Max total exposure (30%)
-    total_exposure = sum(p.size_usd for p in portfolio.open_positions)
-    if portfolio.total_equity > 0 and (total_exposure + trade_signal.position_size) / portfolio.total_equity > config.max_total_exposure_pct:
-        return False, "max_total_exposure"
-
-    # 6. API budget ($8/day)
-    if api_spend >= config.daily_api_budget_usd:
-        return False, "api_budget_exceeded"
-
     return True, None
 
 
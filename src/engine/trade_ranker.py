@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Dict, List, Tuple
 
 import structlog
@@ -9,6 +10,8 @@ from src.models import TradeCandidate, Position
 
 log = structlog.get_logger()
 
+_SCORE = attrgetter("score")
+
 
 def _keyword_overlap(kw1: List[str], kw2: List[str]) -> float:
     """Jaccard similarity of lowered keyword sets."""
@@ -24,6 +27,21 @@ def keyword_overlap(keywords_a: List[str], keywords_b: List[str]) -> float:
     return _keyword_overlap(keywords_a, keywords_b)
 
 
+def _jaccard_ge(a: frozenset, b: frozenset, threshold: float) -> bool:
+    """True when Jaccard(a, b) >= threshold, without dividing.
+
+    Jaccard can't exceed min(|a|, |b|) / max(|a|, |b|), so pairs of very
+    different sizes are rejected before the intersection is built.
+    """
+    la, lb = len(a), len(b)
+    if not la or not lb:
+        return False
+    if (la if la < lb else lb) < threshold * (la if la > lb else lb):
+        return False
+    inter = len(a & b)
+    return inter >= threshold * (la + lb - inter)
+
+
 def detect_market_clusters(candidates: List[TradeCandidate]) -> Dict[str, str]:
     """Detect correlated market clusters.
     Group by market_type, then within same category: sort by resolution_time.
@@ -43,28 +61,34 @@ def detect_market_clusters(candidates: List[TradeCandidate]) -> Dict[str, str]:
     cluster_counter = 0
 
     for mtype, group in by_type.items():
-        # Sort by resolution time
+        # Sort by resolution time, so each seed only needs to scan forward
+        # until the 1h window closes.
         group.sort(key=lambda c: c.resolution_hours)
+        hours = [c.resolution_hours for c in group]
+        kw_sets = [frozenset(w.lower() for w in c.market.keywords) for c in group]
+        n = len(group)
 
-        assigned: Dict[int, str] = {}  # index -> cluster_id
-        for i, c1 in enumerate(group):
-            if i in assigned:
+        assigned = [False] * n
+        for i in range(n):
+            if assigned[i]:
                 continue
             cluster_counter += 1
             cid = f"cluster_{cluster_counter}"
-            clusters[c1.market.market_id] = cid
-            assigned[i] = cid
+            clusters[group[i].market.market_id] = cid
+            assigned[i] = True
+            kw1 = kw_sets[i]
+            h1 = hours[i]
 
-            for j in range(i + 1, len(group)):
-                if j in assigned:
-                    continue
-                c2 = group[j]
+            for j in range(i + 1, n):
                 # Within 1h resolution window
-                if abs(c1.resolution_hours - c2.resolution_hours) <= 1.0:
-                    # 50% keyword overlap
-                    if _keyword_overlap(c1.market.keywords, c2.market.keywords) >= 0.50:
-                        clusters[c2.market.market_id] = cid
-                        assigned[j] = cid
+                if hours[j] - h1 > 1.0:
+                    break
+                if assigned[j]:
+                    continue
+                # 50% keyword Jaccard overlap
+                if _jaccard_ge(kw1, kw_sets[j], 0.50):
+                    clusters[group[j].market.market_id] = cid
+                    assigned[j] = True
 
     return clusters
 
@@ -113,12 +137,14 @@ def select_best_trades(
     if not candidates:
         return [], []
 
-    # Score each candidate
+    # Score each candidate. Batches are tens of candidates, so a plain loop
+    # beats the fixed per-call overhead of building NumPy arrays.
     for c in candidates:
-        c.score = c.calculated_edge * c.adjusted_confidence * (1.0 / max(c.resolution_hours, 0.5))
+        h = c.resolution_hours
+        c.score = c.calculated_edge * c.adjusted_confidence * (1.0 / (h if h > 0.5 else 0.5))
 
-    # Sort by score descending
-    ranked = sorted(candidates, key=lambda c: c.score, reverse=True)
+    # Sort by score descending (stable, so ties keep input order)
+    ranked = sorted(candidates, key=_SCORE, reverse=True)
 
     # Detect clusters
     clusters = detect_market_clusters(candidates)
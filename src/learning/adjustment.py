@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 # Temporal confidence decay parameters per market type.
 # rate: decay coefficient applied per time unit (per minute if per_min=True, else per hour)
@@ -23,6 +24,7 @@ _DECAY_PARAMS: dict = {
 
 import structlog
 
+from src.backtest.clock import Clock
 from src.db.sqlite import Database
 from src.learning.calibration import CalibrationManager
 from src.learning.market_type import MarketTypeManager
@@ -32,6 +34,17 @@ from src.models import TradeRecord
 log = structlog.get_logger()
 
 
+def _clip(x: float, lo: float, hi: float) -> float:
+    """Clamp x to [lo, hi] with plain comparisons instead of nested min/max calls."""
+    return lo if x < lo else hi if x > hi else x
+
+
+@lru_cache(maxsize=1024)
+def _parse_ts(s: str) -> datetime:
+    """Signal timestamp parse; the same signals recur across a scan's candidates."""
+    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+
+
 def adjust_prediction(
     grok_probability: float,
     grok_confidence: float,
@@ -40,16 +53,20 @@ def adjust_prediction(
     calibration_mgr: CalibrationManager,
     market_type_mgr: MarketTypeManager,
     signal_tracker_mgr: SignalTrackerManager,
+    weight_cache: Optional[Dict[Tuple[str, str, str], float]] = None,
 ) -> Tuple[float, float, float]:
     """5-step adjustment pipeline.
     Returns (adjusted_probability, adjusted_confidence, extra_edge_penalty).
+
+    ``weight_cache`` memoizes signal weights across one scan's candidates;
+    the caller owns it and drops it when the scan ends.
     """
     adjusted_confidence = grok_confidence
     adjusted_probability = grok_probability
 
     # Step 1: Bayesian calibration (confidence)
     cal_correction = calibration_mgr.get_correction(grok_confidence)
-    adjusted_confidence = max(0.50, min(0.99, adjusted_confidence + cal_correction))
+    adjusted_confidence = _clip(adjusted_confidence + cal_correction, 0.50, 0.99)
 
     # Step 2: Signal-type weighting (confidence)
     if signal_tags:
@@ -57,12 +74,18 @@ def adjust_prediction(
         for tag in signal_tags:
             st = tag.get("source_tier", "S6")
             it = tag.get("info_type", "I5")
-            w = signal_tracker_mgr.get_signal_weight(st, it, market_type)
+            if weight_cache is None:
+                w = signal_tracker_mgr.get_signal_weight(st, it, market_type)
+            else:
+                key = (st, it, market_type)
+                w = weight_cache.get(key)
+                if w is None:
+                    w = weight_cache[key] = signal_tracker_mgr.get_signal_weight(st, it, market_type)
             weights.append(w)
         if weights:
             avg_weight = sum(weights) / len(weights)
             adjusted_confidence += (avg_weight - 1.0) * 0.1
-            adjusted_confidence = max(0.50, min(0.99, adjusted_confidence))
+            adjusted_confidence = _clip(adjusted_confidence, 0.50, 0.99)
 
     # Step 3: Probability shrinkage
     bucket = calibration_mgr.find_bucket(grok_confidence)
@@ -71,7 +94,7 @@ def adjust_prediction(
         if bucket_midpoint > 0:
             shrinkage_factor = bucket.expected_accuracy / bucket_midpoint
             adjusted_probability = 0.5 + (grok_probability - 0.5) * shrinkage_factor
-            adjusted_probability = max(0.01, min(0.99, adjusted_probability))
+            adjusted_probability = _clip(adjusted_probability, 0.01, 0.99)
 
     # Step 4: Market-type edge penalty
     extra_edge = market_type_mgr.get_edge_adjustment(market_type)
@@ -80,7 +103,6 @@ def adjust_prediction(
     # signal_tags now include real timestamps from signal objects, so decay actually fires.
     # Previously tags came from Grok's signal_info_types (no timestamps) — decay was dead code.
     params = _DECAY_PARAMS.get(market_type, _DECAY_PARAMS["_default"])
-    from src.backtest.clock import Clock
     now = Clock.utcnow()
     has_recent_i1 = False
     max_age_min = 0.0
@@ -88,7 +110,7 @@ def adjust_prediction(
         ts_str = tag.get("timestamp")
         if ts_str:
             try:
-                ts = datetime.fromisoformat(str(ts_str).replace("Z", "+00:00"))
+                ts = _parse_ts(str(ts_str))
                 age_min = (now - ts).total_seconds() / 60.0
                 max_age_min = max(max_age_min, age_min)
                 if tag.get("info_type") == "I1" and age_min < 30.0:
@@ -117,37 +139,57 @@ async def on_trade_resolved(
     db: Database,
 ) -> None:
     """Handle a resolved trade: update all learning layers and persist."""
-    if record.voided:
-        return
+    await on_trades_resolved(
+        [record], calibration_mgr, market_type_mgr, signal_tracker_mgr, db,
+    )
 
-    if record.actual_outcome is None:
-        return
 
-    # Calculate Brier scores if not already set
-    actual_val = 1.0 if record.actual_outcome else 0.0
-    if record.brier_score_raw is None:
-        record.brier_score_raw = (record.grok_raw_probability - actual_val) ** 2
-    if record.brier_score_adjusted is None:
-        record.brier_score_adjusted = (record.final_adjusted_probability - actual_val) ** 2
+async def on_trades_resolved(
+    records: List[TradeRecord],
+    calibration_mgr: CalibrationManager,
+    market_type_mgr: MarketTypeManager,
+    signal_tracker_mgr: SignalTrackerManager,
+    db: Database,
+) -> None:
+    """Handle a batch of resolved trades: update all learning layers in
+    memory, then persist the layers and the records in one transaction."""
+    from src.engine.resolution import calculate_hypothetical_pnl
+
+    learned = []
+    for record in records:
+        if record.voided or record.actual_outcome is None:
+            continue
 
-    # Layer 1: Calibration (uses RAW probability/confidence)
-    calibration_mgr.update_calibration(record)
+        # Calculate Brier scores if not already set
+        actual_val = 1.0 if record.actual_outcome else 0.0
+        if record.brier_score_raw is None:
+            record.brier_score_raw = (record.grok_raw_probability - actual_val) ** 2
+        if record.brier_score_adjusted is None:
+            record.brier_score_adjusted = (record.final_adjusted_probability - actual_val) ** 2
 
-    # Layer 2: Market-type performance (uses ADJUSTED Brier score)
-    from src.engine.resolution import calculate_hypothetical_pnl
-    counterfactual = calculate_hypothetical_pnl(record) if record.action == "SKIP" else 0.0
-    market_type_mgr.update_market_type(record, counterfactual_pnl=counterfactual)
+        # Layer 1: Calibration (uses RAW probability/confidence)
+        calibration_mgr.update_calibration(record)
+
+        # Layer 2: Market-type performance (uses ADJUSTED Brier score)
+        counterfactual = calculate_hypothetical_pnl(record) if record.action == "SKIP" else 0.0
+        market_type_mgr.update_market_type(record, counterfactual_pnl=counterfactual)
 
-    # Layer 3: Signal tracker (uses ADJUSTED correctness)
-    signal_tracker_mgr.update_signal_trackers(record)
+        # Layer 3: Signal tracker (uses ADJUSTED correctness)
+        signal_tracker_mgr.update_signal_trackers(record)
+        learned.append(record)
+
+    if not learned:
+        return
 
     # Persist all
-    await calibration_mgr.save(db)
-    await market_type_mgr.save(db)
-    await signal_tracker_mgr.save(db)
-    await db.update_trade(record)
-
-    log.info("learning_updated",
-             market_id=record.market_id,
-             brier_raw=record.brier_score_raw,
-             brier_adjusted=record.brier_score_adjusted)
+    async with db.transaction():
+        await calibration_mgr.save(db)
+        await market_type_mgr.save(db)
+        await signal_tracker_mgr.save(db)
+        await db.update_trades_bulk(learned)
+
+    for record in learned:
+        log.info("learning_updated",
+                 market_id=record.market_id,
+                 brier_raw=record.brier_score_raw,
+                 brier_adjusted=record.brier_score_adjusted)
@@ -1,5 +1,9 @@
+from bisect import bisect_right
 from typing import List, Optional
 from datetime import datetime, timezone
+
+import numpy as np
+
 from src.models import CalibrationBucket, TradeRecord, CALIBRATION_BUCKET_RANGES
 from src.db.sqlite import Database
 
@@ -9,15 +13,17 @@ class CalibrationManager:
         self.buckets: List[CalibrationBucket] = [
             CalibrationBucket(br) for br in CALIBRATION_BUCKET_RANGES
         ]
-    
+        self._index_buckets()
+
+    def _index_buckets(self) -> None:
+        # Buckets are contiguous and sorted, so their upper edges bisect.
+        self._upper_edges = [b.bucket_range[1] for b in self.buckets]
+        self._last = len(self.buckets) - 1
+
     def find_bucket(self, confidence: float) -> Optional[CalibrationBucket]:
-        for b in self.buckets:
-            if b.bucket_range[0] <= confidence < b.bucket_range[1]:
-                return b
-        # Handle edge: confidence == 1.0 goes to last bucket
-        if confidence >= self.buckets[-1].bucket_range[0]:
-            return self.buckets[-1]
-        return self.buckets[0]  # Below 0.50 -> first bucket
+        # Below 0.50 lands in the first bucket; confidence == 1.0 in the last.
+        idx = bisect_right(self._upper_edges, confidence)
+        return self.buckets[idx if idx <= self._last else self._last]
     
     def get_correction(self, confidence: float) -> float:
         bucket = self.find_bucket(confidence)
@@ -51,6 +57,33 @@ class CalibrationManager:
         recency = 0.95 ** max(0, days_since)
         
         bucket.update(was_correct, recency_weight=recency)
+
+    def update_calibration_batch(self, records: List[TradeRecord]) -> None:
+        """update_calibration over many records at once.
+
+        Bucket updates are plain sums, so order doesn't matter: bucket index,
+        raw correctness and recency weight are computed as arrays and summed
+        per bucket with bincount. Only the final alpha/beta writes are Python.
+        """
+        rows = [r for r in records if r.actual_outcome is not None and not r.voided]
+        if not rows:
+            return
+        n = len(rows)
+
+        from src.backtest.clock import Clock
+        now = _epoch(Clock.utcnow())
+        conf = np.fromiter((r.grok_raw_confidence for r in rows), float, n)
+        correct = np.fromiter(((r.grok_raw_probability > 0.5) == r.actual_outcome for r in rows), bool, n)
+        ts = np.fromiter((_epoch(r.timestamp) for r in rows), float, n)
+
+        recency = 0.95 ** np.maximum(0.0, (now - ts) / 86400)
+        idx = np.minimum(np.searchsorted(self._upper_edges, conf, side="right"), self._last)
+        nb = len(self.buckets)
+        alpha_inc = np.bincount(idx, weights=np.where(correct, recency, 0.0), minlength=nb)
+        beta_inc = np.bincount(idx, weights=np.where(correct, 0.0, recency), minlength=nb)
+        for b, da, dbeta in zip(self.buckets, alpha_inc.tolist(), beta_inc.tolist()):
+            b.alpha += da
+            b.beta += dbeta
     
     def reset_to_priors(self) -> None:
         for b in self.buckets:
@@ -62,6 +95,12 @@ class CalibrationManager:
         for i, b in enumerate(loaded):
             if i < len(self.buckets):
                 self.buckets[i] = b
+        self._index_buckets()
     
     async def save(self, db: Database) -> None:
         await db.save_calibration(self.buckets)
+
+
+def _epoch(dt: datetime) -> float:
+    # Naive timestamps are UTC, as in update_calibration.
+    return (dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)).timestamp()
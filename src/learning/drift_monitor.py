@@ -76,14 +76,14 @@ async def check_cash_drift_periodic(db: Database, settings: Settings) -> None:
         prev_row = await cur.fetchone()
 
     # Persist
-    await db._conn.execute(
-        """INSERT INTO drift_history
-           (actual_cash, expected_cash, drift, n_entries, n_exits, locked_replay)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (snap["actual_cash"], snap["expected_cash"], snap["drift"],
-         snap["n_entries"], snap["n_exits"], snap["locked_replay"]),
-    )
-    await db._conn.commit()
+    async with db.transaction():
+        await db._conn.execute(
+            """INSERT INTO drift_history
+               (actual_cash, expected_cash, drift, n_entries, n_exits, locked_replay)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (snap["actual_cash"], snap["expected_cash"], snap["drift"],
+             snap["n_entries"], snap["n_exits"], snap["locked_replay"]),
+        )
 
     # Log at level
     drift = snap["drift"]
@@ -13,8 +13,12 @@ async def start_experiment(
     config: dict,
     model: str,
     db: Database,
+    commit: bool = True,
 ) -> None:
-    """Start a new experiment run."""
+    """Start a new experiment run.
+
+    Pass ``commit=False`` inside ``db.transaction()``.
+    """
     run = ExperimentRun(
         run_id=run_id,
         started_at=datetime.now(timezone.utc),
@@ -23,7 +27,7 @@ async def start_experiment(
         model_used=model,
         include_in_learning=True,
     )
-    await db.save_experiment(run)
+    await db.save_experiment(run, commit=commit)
 
 
 async def end_experiment(run_id: str, stats: dict, db: Database) -> None:
@@ -1,5 +1,5 @@
 from typing import Dict, Optional
-from src.models import MarketTypePerformance, TradeRecord
+from src.models import BRIER_WINDOW, MarketTypePerformance, TradeRecord
 from src.db.sqlite import Database
 
 
@@ -8,9 +8,10 @@ class MarketTypeManager:
         self.performances: Dict[str, MarketTypePerformance] = {}
     
     def _ensure(self, market_type: str) -> MarketTypePerformance:
-        if market_type not in self.performances:
-            self.performances[market_type] = MarketTypePerformance(market_type=market_type)
-        return self.performances[market_type]
+        perf = self.performances.get(market_type)
+        if perf is None:
+            perf = self.performances[market_type] = MarketTypePerformance(market_type=market_type)
+        return perf
     
     def update_market_type(self, record: TradeRecord, counterfactual_pnl: float = 0.0) -> None:
         """Update market-type stats with resolved trade. Uses ADJUSTED Brier score."""
@@ -21,7 +22,7 @@ class MarketTypeManager:
         mtype.total_trades += 1
         
         if record.brier_score_adjusted is not None:
-            mtype.brier_scores.append(record.brier_score_adjusted)
+            mtype.add_brier(record.brier_score_adjusted)
         
         if record.action != "SKIP":
             mtype.total_pnl += record.pnl or 0.0
@@ -40,7 +41,7 @@ class MarketTypeManager:
     def dampen_on_swap(self) -> None:
         """On model swap: keep only last 15 Brier scores per market type."""
         for perf in self.performances.values():
-            perf.brier_scores = perf.brier_scores[-15:]
+            perf.reset_brier(perf.brier_scores[-BRIER_WINDOW:])
     
     async def load(self, db: Database) -> None:
         self.performances = await db.load_market_type_performance()
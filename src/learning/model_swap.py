@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
 import structlog
 
@@ -11,10 +11,13 @@ from src.learning.calibration import CalibrationManager
 from src.learning.experiments import start_experiment
 from src.learning.market_type import MarketTypeManager
 from src.learning.signal_tracker import SignalTrackerManager
-from src.models import ModelSwapEvent
+from src.models import ModelSwapEvent, TradeRecord
 
 log = structlog.get_logger()
 
+# Trades buffered per vectorized calibration update during a replay.
+REPLAY_BATCH_SIZE = 1000
+
 
 async def handle_model_swap(
     old_model: str,
@@ -34,16 +37,6 @@ async def handle_model_swap(
     now = datetime.now(timezone.utc)
     run_id = f"exp_{new_model}_{now.strftime('%Y%m%d_%H%M%S')}"
 
-    # 1. Start new experiment (must exist before model_swaps FK reference)
-    await start_experiment(
-        run_id=run_id,
-        description=f"Model swap: {old_model} -> {new_model}. Reason: {reason}",
-        config={"old_model": old_model, "new_model": new_model},
-        model=new_model,
-        db=db,
-    )
-
-    # 2. Save event (experiment_run_started FK now satisfied)
     event = ModelSwapEvent(
         timestamp=now,
         old_model=old_model,
@@ -51,15 +44,29 @@ async def handle_model_swap(
         reason=reason,
         experiment_run_started=run_id,
     )
-    await db.save_model_swap(event)
 
-    # 3. RESET calibration
-    calibration_mgr.reset_to_priors()
-    await calibration_mgr.save(db)
-
-    # 4. DAMPEN market-type
-    market_type_mgr.dampen_on_swap()
-    await market_type_mgr.save(db)
+    # Steps 1-4 land together or not at all.
+    async with db.transaction():
+        # 1. Start new experiment (must exist before model_swaps FK reference)
+        await start_experiment(
+            run_id=run_id,
+            description=f"Model swap: {old_model} -> {new_model}. Reason: {reason}",
+            config={"old_model": old_model, "new_model": new_model},
+            model=new_model,
+            db=db,
+            commit=False,
+        )
+
+        # 2. Save event (experiment_run_started FK now satisfied)
+        await db.save_model_swap(event, commit=False)
+
+        # 3. RESET calibration
+        calibration_mgr.reset_to_priors()
+        await calibration_mgr.save(db)
+
+        # 4. DAMPEN market-type
+        market_type_mgr.dampen_on_swap()
+        await market_type_mgr.save(db)
 
     # 5. Signal trackers are PRESERVED (no action needed)
 
@@ -77,11 +84,19 @@ async def void_trade(
     market_type_mgr: MarketTypeManager,
     signal_tracker_mgr: SignalTrackerManager,
 ) -> None:
-    """Void a trade and recalculate all learning from scratch."""
+    """Void a trade and recalculate all learning from scratch.
+
+    A replay, not a reversal of this trade's increments: calibration weights
+    depend on when they were applied and signal-tracker absent counts on the
+    combos seen at the time, so only a rebuild gives the replayed state.
+    """
     record = await db.get_trade(trade_id)
     if record is None:
         log.error("void_trade_not_found", trade_id=trade_id)
         return
+    if record.voided:
+        log.warning("void_trade_already_voided", trade_id=trade_id)
+        return
 
     record.voided = True
     record.void_reason = reason
@@ -103,21 +118,31 @@ async def recalculate_learning_from_scratch(
     # Reset all
     calibration_mgr.reset_to_priors()
     market_type_mgr.performances.clear()
-    signal_tracker_mgr.trackers.clear()
-
-    # Reload all resolved, non-voided trades
-    trades = await db.get_all_resolved_trades(include_voided=False)
-
-    for trade in trades:
+    signal_tracker_mgr.reset()
+
+    # Stream all resolved, non-voided trades. Market-type and signal-tracker
+    # updates depend on trade order; calibration is a per-bucket sum, so it is
+    # applied in vectorized batches.
+    processed = 0
+    cal_batch: List[TradeRecord] = []
+    update_market_type = market_type_mgr.update_market_type
+    update_signal_trackers = signal_tracker_mgr.update_signal_trackers
+    async for trade in db.iter_resolved_trades(include_voided=False):
+        processed += 1
         if trade.actual_outcome is None:
             continue
-        calibration_mgr.update_calibration(trade)
-        market_type_mgr.update_market_type(trade)
-        signal_tracker_mgr.update_signal_trackers(trade)
-
-    # Persist
-    await calibration_mgr.save(db)
-    await market_type_mgr.save(db)
-    await signal_tracker_mgr.save(db)
-
-    log.info("learning_recalculated", trades_processed=len(trades))
+        cal_batch.append(trade)
+        if len(cal_batch) >= REPLAY_BATCH_SIZE:
+            calibration_mgr.update_calibration_batch(cal_batch)
+            cal_batch.clear()
+        update_market_type(trade)
+        update_signal_trackers(trade)
+    calibration_mgr.update_calibration_batch(cal_batch)
+
+    # Persist all three layers in one transaction
+    async with db.transaction():
+        await calibration_mgr.save(db)
+        await market_type_mgr.save(db)
+        await signal_tracker_mgr.save(db)
+
+    log.info("learning_recalculated", trades_processed=processed)
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import Dict, Set, Tuple
 from src.models import SignalTracker, TradeRecord
 from src.db.sqlite import Database
@@ -6,48 +7,65 @@ from src.db.sqlite import Database
 class SignalTrackerManager:
     def __init__(self):
         self.trackers: Dict[Tuple[str, str, str], SignalTracker] = {}
+        # market_type -> {(source_tier, info_type)}, kept in step with trackers
+        self._by_market: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
     
     def _ensure(self, source_tier: str, info_type: str, market_type: str) -> SignalTracker:
         key = (source_tier, info_type, market_type)
-        if key not in self.trackers:
-            self.trackers[key] = SignalTracker(source_tier=source_tier, info_type=info_type, market_type=market_type)
-        return self.trackers[key]
+        tracker = self.trackers.get(key)
+        if tracker is None:
+            tracker = self.trackers[key] = SignalTracker(source_tier=source_tier, info_type=info_type, market_type=market_type)
+            self._by_market[market_type].add((source_tier, info_type))
+        return tracker
+    
+    def _reindex(self) -> None:
+        self._by_market = defaultdict(set)
+        for st, it, mt in self.trackers:
+            self._by_market[mt].add((st, it))
+    
+    def reset(self) -> None:
+        """Drop all trackers (used before a rebuild from trade history)."""
+        self.trackers.clear()
+        self._by_market.clear()
     
     def get_all_observed_combos(self, market_type: str) -> Set[Tuple[str, str]]:
-        """Get all (source_tier, info_type) combos ever observed for this market type."""
-        return {(k[0], k[1]) for k in self.trackers if k[2] == market_type}
+        """Get all (source_tier, info_type) combos ever observed for this market type.
+
+        Returns the live index set; callers must not mutate it.
+        """
+        return self._by_market.get(market_type, frozenset())
     
     def update_signal_trackers(self, record: TradeRecord) -> None:
         """Update signal trackers with resolved trade. Uses ADJUSTED correctness."""
         if record.actual_outcome is None or record.voided:
             return
         
+        # Get signal combos present in this trade. An untagged trade in a market
+        # type with no trackers yet has nothing to count.
+        present_combos = record.signal_combos
+        market_type = record.market_type
+        if not present_combos and not self._by_market.get(market_type):
+            return
+        
         # Determine correctness using ADJUSTED probability (system-level accuracy)
         adjusted_predicted_yes = record.final_adjusted_probability > 0.5
         was_correct = adjusted_predicted_yes == record.actual_outcome
         
-        # Get signal combos present in this trade
-        present_combos: Set[Tuple[str, str]] = set()
-        for tag in (record.grok_signal_types or []):
-            st = tag.get("source_tier")
-            it = tag.get("info_type")
-            if st and it:
-                present_combos.add((st, it))
-        
-        # Update all observed combos for this market type
-        all_combos = self.get_all_observed_combos(record.market_type) | present_combos
-        
-        for combo in all_combos:
-            tracker = self._ensure(combo[0], combo[1], record.market_type)
-            present = combo in present_combos
-            if present and was_correct:
-                tracker.present_in_winning_trades += 1
-            elif present and not was_correct:
-                tracker.present_in_losing_trades += 1
-            elif not present and was_correct:
-                tracker.absent_in_winning_trades += 1
-            else:
-                tracker.absent_in_losing_trades += 1
+        # Update all observed combos for this market type. Correctness is fixed
+        # for the trade, so the win/loss side is chosen once; each combo then
+        # only needs the present/absent test.
+        if was_correct:
+            for st, it in present_combos:
+                self._ensure(st, it, market_type).present_in_winning_trades += 1
+            for st, it in self.get_all_observed_combos(market_type):
+                if (st, it) not in present_combos:
+                    self.trackers[(st, it, market_type)].absent_in_winning_trades += 1
+        else:
+            for st, it in present_combos:
+                self._ensure(st, it, market_type).present_in_losing_trades += 1
+            for st, it in self.get_all_observed_combos(market_type):
+                if (st, it) not in present_combos:
+                    self.trackers[(st, it, market_type)].absent_in_losing_trades += 1
     
     def get_signal_weight(self, source_tier: str, info_type: str, market_type: str) -> float:
         key = (source_tier, info_type, market_type)
@@ -56,6 +74,7 @@ class SignalTrackerManager:
     
     async def load(self, db: Database) -> None:
         self.trackers = await db.load_signal_trackers()
+        self._reindex()
     
     async def save(self, db: Database) -> None:
         await db.save_signal_trackers(self.trackers)
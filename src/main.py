@@ -1,20 +1,29 @@
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import queue
 import sys
 import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
 import logging
+import logging.handlers
 
 import structlog
 import uvicorn
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
-from src.alerts import format_lifecycle_alert, send_alert
+from src.alerts import (
+    close_client,
+    format_lifecycle_alert,
+    send_alert,
+    start_alert_drain,
+    stop_alert_drain,
+)
 from src.config import Settings, get_settings
 from src.db.migrations import run_migrations
 from src.db.sqlite import Database
@@ -42,13 +51,32 @@ _LOG_LEVELS = {
     "CRITICAL": logging.CRITICAL,
 }
 
+# Logging is configured once at import, from one Settings read.
+_boot_settings = get_settings()
+
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+
+def _render_exc_and_stack(logger, method_name, event_dict):
+    """StackInfoRenderer + format_exc_info, only for events that carry either.
+
+    Both must run on the calling thread, where the exception and stack live,
+    but the usual info/debug event has neither key and can skip both calls.
+    """
+    if "exc_info" in event_dict or "stack_info" in event_dict:
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
 # Structlog → stdlib logging bridge
 _shared_processors = [
+    # Drop below-level events before any processor does work on them.
+    structlog.stdlib.filter_by_level,
     structlog.contextvars.merge_contextvars,
     structlog.processors.add_log_level,
     structlog.processors.TimeStamper(fmt="iso"),
-    structlog.processors.StackInfoRenderer(),
-    structlog.processors.format_exc_info,
+    _render_exc_and_stack,
     structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
 ]
 
@@ -66,7 +94,7 @@ _formatter = structlog.stdlib.ProcessorFormatter(
 )
 
 # File handler
-_log_dir = os.path.dirname(get_settings().DB_PATH) or "data"
+_log_dir = os.path.dirname(_boot_settings.DB_PATH) or "data"
 os.makedirs(_log_dir, exist_ok=True)
 _file_handler = logging.FileHandler(os.path.join(_log_dir, "bot.log"))
 _file_handler.setFormatter(_formatter)
@@ -75,13 +103,67 @@ _file_handler.setFormatter(_formatter)
 _stream_handler = logging.StreamHandler(sys.stdout)
 _stream_handler.setFormatter(_formatter)
 
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues the record as-is.
+
+    The stock prepare() pre-renders the message to a string, which would hide
+    structlog's event dict from ProcessorFormatter. The queue never leaves
+    this process, so the record needs no flattening.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Callers only enqueue; JSON rendering and the file/stdout writes happen on
+# the listener thread, off the event loop. Exception and stack info are still
+# rendered on the calling thread by _render_exc_and_stack.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _file_handler, _stream_handler, respect_handler_level=True,
+)
+
+
+_log_queue_handler = _LocalQueueHandler(_log_queue)
+_log_listener_running = False
+
+
+def _start_log_listener() -> None:
+    """Route the root logger through the queue; safe to call twice."""
+    global _log_listener_running
+    if _log_listener_running:
+        return
+    for handler in (_file_handler, _stream_handler):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(_log_queue_handler)
+    _log_listener.start()
+    _log_listener_running = True
+
+
+def _stop_log_listener() -> None:
+    """Drain queued records and join the listener thread; safe to call twice.
+
+    The root logger falls back to writing to the handlers directly, so
+    records logged after shutdown are not left on an undrained queue.
+    """
+    global _log_listener_running
+    if not _log_listener_running:
+        return
+    root_logger.removeHandler(_log_queue_handler)
+    _log_listener.stop()
+    for handler in (_file_handler, _stream_handler):
+        root_logger.addHandler(handler)
+    _log_listener_running = False
+
+
 # Configure root logger
 root_logger = logging.getLogger()
 root_logger.handlers.clear()
-root_logger.addHandler(_file_handler)
-root_logger.addHandler(_stream_handler)
+_start_log_listener()
+atexit.register(_stop_log_listener)
 root_logger.setLevel(
-    _LOG_LEVELS.get(get_settings().LOG_LEVEL.upper(), logging.INFO)
+    _LOG_LEVELS.get(_boot_settings.LOG_LEVEL.upper(), logging.INFO)
 )
 
 log = structlog.get_logger()
@@ -96,6 +178,7 @@ _app_state: dict = {}
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup / shutdown logic."""
+    _start_log_listener()
     settings = get_settings()
     log.info("starting_up", environment=settings.ENVIRONMENT)
 
@@ -135,11 +218,11 @@ async def lifespan(app: FastAPI):
     # replay all resolved trades through the learning pipeline (fixes cases where the bot
     # was running before the on_trade_resolved() bug was fixed).
     if not any(b.sample_count > 0 for b in calibration_mgr.buckets):
-        resolved = await db.get_all_resolved_trades()
-        if resolved:
+        resolved_count = await db.count_resolved_trades()
+        if resolved_count:
             from src.learning.model_swap import recalculate_learning_from_scratch
             await recalculate_learning_from_scratch(db, calibration_mgr, market_type_mgr, signal_tracker_mgr)
-            log.info("cold_start_learning_rebuild", resolved_trades=len(resolved))
+            log.info("cold_start_learning_rebuild", resolved_trades=resolved_count)
 
     # Clients
     polymarket = PolymarketClient(settings)
@@ -183,6 +266,7 @@ async def lifespan(app: FastAPI):
     )
 
     log.info("startup_complete")
+    start_alert_drain(settings)
     await send_alert(format_lifecycle_alert("STARTED", settings.ENVIRONMENT), settings)
     yield
 
@@ -191,8 +275,14 @@ async def lifespan(app: FastAPI):
     await send_alert(format_lifecycle_alert("STOPPING", settings.ENVIRONMENT), settings)
     await ws_exit_mgr.stop()
     scheduler.stop()
+    await grok.aclose()
+    await polymarket.aclose()
+    await rss.aclose()
     await db.close()
+    await stop_alert_drain()
+    await close_client()
     log.info("shutdown_complete")
+    _stop_log_listener()
 
 
 # ---------------------------------------------------------------------------
@@ -11,8 +11,12 @@ import structlog
 log = structlog.get_logger()
 
 
-async def _init_deps():
-    """Initialize database and learning managers."""
+async def _init_deps(load_learning: bool = True):
+    """Initialize database and learning managers.
+
+    ``load_learning=False`` returns empty managers, for commands that never
+    read learned state (experiments) or rebuild it from trades anyway.
+    """
     from src.config import get_settings
     from src.db.sqlite import Database
     from src.db.migrations import run_migrations
@@ -25,11 +29,11 @@ async def _init_deps():
     await run_migrations(db)
 
     cal = CalibrationManager()
-    await cal.load(db)
     mt = MarketTypeManager()
-    await mt.load(db)
     st = SignalTrackerManager()
-    await st.load(db)
+    if load_learning:
+        # One shared connection; queue all three reads back to back.
+        await asyncio.gather(cal.load(db), mt.load(db), st.load(db))
 
     return db, cal, mt, st
 
@@ -55,7 +59,7 @@ async def cmd_void_trade(args):
 
 
 async def cmd_start_experiment(args):
-    db, cal, mt, st = await _init_deps()
+    db, cal, mt, st = await _init_deps(load_learning=False)
     try:
         from src.learning.experiments import start_experiment
         run_id = f"exp_{args.model}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
@@ -66,7 +70,7 @@ async def cmd_start_experiment(args):
 
 
 async def cmd_end_experiment(args):
-    db, cal, mt, st = await _init_deps()
+    db, cal, mt, st = await _init_deps(load_learning=False)
     try:
         from src.learning.experiments import end_experiment
         await end_experiment(args.run_id, {}, db)
@@ -76,7 +80,7 @@ async def cmd_end_experiment(args):
 
 
 async def cmd_recalculate_learning(args):
-    db, cal, mt, st = await _init_deps()
+    db, cal, mt, st = await _init_deps(load_learning=False)
     try:
         from src.learning.model_swap import recalculate_learning_from_scratch
         await recalculate_learning_from_scratch(db, cal, mt, st)
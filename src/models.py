@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import math
+import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -31,7 +34,7 @@ CALIBRATION_BUCKET_RANGES: List[Tuple[float, float]] = [
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     source: str  # "twitter", "rss", "market_data"
     source_tier: str  # S1-S6
@@ -45,7 +48,7 @@ class Signal:
     headline_only: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Market:
     market_id: str
     question: str
@@ -96,7 +99,7 @@ class OrderBook:
         return sum(l.size for l in self.bids) + sum(l.size for l in self.asks)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeCandidate:
     market: Market
     adjusted_probability: float = 0.0
@@ -136,7 +139,7 @@ class ExecutionResult:
     filled: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     market_id: str
     side: str  # BUY_YES or BUY_NO
@@ -151,7 +154,27 @@ class Position:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+def new_record_id() -> str:
+    """Time-ordered UUIDv7 string (RFC 9562) for TradeRecord.record_id.
+
+    The 48-bit Unix-ms prefix makes new keys sort after existing ones, so
+    inserts append to the right edge of the trade_records primary-key index
+    instead of landing on random pages the way uuid4 keys do.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                       # version 7
+        | (rand >> 62 & 0xFFF) << 64      # rand_a
+        | 0b10 << 62                      # RFC 4122 variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF    # rand_b
+    )
+    h = f"{value:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@dataclass(slots=True)
 class TradeRecord:
     record_id: str
     experiment_run: str
@@ -211,13 +234,21 @@ class TradeRecord:
     voided: bool = False
     void_reason: Optional[str] = None
 
+    @property
+    def signal_combos(self) -> FrozenSet[Tuple[str, str]]:
+        """(source_tier, info_type) pairs tagged on this trade; incomplete tags dropped."""
+        return frozenset(
+            (st, it) for tag in self.grok_signal_types or ()
+            if (st := tag.get("source_tier")) and (it := tag.get("info_type"))
+        )
+
 
 # ---------------------------------------------------------------------------
 # Learning models
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class CalibrationBucket:
     bucket_range: Tuple[float, float]
     alpha: float = 1.0
@@ -233,10 +264,11 @@ class CalibrationBucket:
 
     @property
     def uncertainty(self) -> float:
-        from scipy.stats import beta as beta_dist
-
-        low, high = beta_dist.ppf([0.025, 0.975], self.alpha, self.beta)
-        return high - low
+        """Width of the ~95% interval on accuracy, via the normal approximation
+        to Beta(alpha, beta). Within a few percent of the exact ppf interval
+        (slightly wider) once get_correction's 10-sample floor is met."""
+        n = self.alpha + self.beta
+        return 3.92 * math.sqrt(self.alpha * self.beta / (n * n * (n + 1)))
 
     def update(self, was_correct: bool, recency_weight: float = 1.0) -> None:
         if was_correct:
@@ -253,31 +285,60 @@ class CalibrationBucket:
         return correction * certainty
 
 
-@dataclass
+# avg_brier is an exponentially weighted mean: newest score weight 1, each
+# older one x BRIER_DECAY. It is kept as running sums, so only the recent
+# BRIER_WINDOW scores (what a model swap keeps) are stored as a list.
+BRIER_DECAY = 0.95
+BRIER_WINDOW = 15
+
+
+@dataclass(slots=True)
 class MarketTypePerformance:
     market_type: str
     total_trades: int = 0
     total_pnl: float = 0.0
-    brier_scores: List[float] = field(default_factory=list)
+    brier_scores: List[float] = field(default_factory=list)  # last BRIER_WINDOW, oldest first
     total_observed: int = 0
     counterfactual_pnl: float = 0.0
+    brier_ew_sum: Optional[float] = None
+    brier_ew_weight: Optional[float] = None
+
+    def __post_init__(self):
+        # No running sums (new object or pre-v12 row): derive them from the list.
+        if self.brier_ew_sum is None or self.brier_ew_weight is None:
+            self.reset_brier(self.brier_scores)
+
+    def add_brier(self, score: float) -> None:
+        self.brier_ew_sum = self.brier_ew_sum * BRIER_DECAY + score
+        self.brier_ew_weight = self.brier_ew_weight * BRIER_DECAY + 1.0
+        self.brier_scores.append(score)
+        if len(self.brier_scores) > BRIER_WINDOW:
+            del self.brier_scores[0]
+
+    def reset_brier(self, scores: List[float]) -> None:
+        """Restart the weighted mean from just ``scores`` (oldest first)."""
+        self.brier_scores = []
+        self.brier_ew_sum = 0.0
+        self.brier_ew_weight = 0.0
+        for score in scores:
+            self.add_brier(score)
 
     @property
     def avg_brier(self) -> float:
-        if not self.brier_scores:
+        if not self.brier_ew_weight:
             return 0.25
-        weights = [0.95**i for i in range(len(self.brier_scores) - 1, -1, -1)]
-        return sum(b * w for b, w in zip(self.brier_scores, weights)) / sum(weights)
+        return self.brier_ew_sum / self.brier_ew_weight
 
     @property
     def edge_adjustment(self) -> float:
         if self.total_trades < 15:
             return 0.0
-        if self.avg_brier > 0.30:
+        avg = self.avg_brier
+        if avg > 0.30:
             return 0.05
-        elif self.avg_brier > 0.25:
+        elif avg > 0.25:
             return 0.03
-        elif self.avg_brier > 0.20:
+        elif avg > 0.20:
             return 0.01
         return 0.0
 
@@ -288,7 +349,7 @@ class MarketTypePerformance:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalTracker:
     source_tier: str  # S1-S6
     info_type: str  # I1-I6
@@ -313,7 +374,7 @@ class SignalTracker:
     @property
     def weight(self) -> float:
         raw = 1.0 + (self.lift - 1.0) * 0.3
-        return max(0.8, min(1.2, raw))
+        return 0.8 if raw < 0.8 else 1.2 if raw > 1.2 else raw
 
 
 # ---------------------------------------------------------------------------
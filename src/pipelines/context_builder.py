@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import heapq
 import re
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from itertools import chain
+from operator import attrgetter
+from typing import List, Optional, Tuple
 
 import structlog
 
@@ -10,17 +14,41 @@ from src.models import Market, Signal, OrderBook
 
 log = structlog.get_logger()
 
-# Cache keywords per market
-_keyword_cache: Dict[str, List[str]] = {}
+_credibility = attrgetter("credibility")
+
+# Cache keywords per market, least recently used evicted first. Bounded so a
+# long-running bot doesn't keep every market it has ever scanned.
+KEYWORD_CACHE_SIZE = 4096
+_keyword_cache: OrderedDict[str, List[str]] = OrderedDict()
 
 ENTITY_PATTERNS = [
     re.compile(r'\b[A-Z][a-z]+(?:\s[A-Z][a-z]+)+\b'),   # Multi-word: "Donald Trump", "Carolina Hurricanes"
     re.compile(r'\b[A-Z][a-z]+(?:-[A-Z][a-z]+)+\b'),    # Hyphenated: "Counter-Strike", "Real-Madrid"
-    re.compile(r'\b[A-Z][a-z]{5,}\b'),                   # Single-word ≥6 chars: "Hurricanes", "Avalanche", "Diamondbacks"
-    re.compile(r'\b[A-Z]{2,6}\b'),                        # Acronyms: "NHL", "GDP"
-    re.compile(r'\$[A-Z]{1,5}\b'),                        # Tickers: "$BTC"
+    # Single whole-word tokens. These never overlap each other, so one
+    # alternation finds the same matches as three separate scans.
+    re.compile(
+        r'\$[A-Z]{1,5}\b'              # Tickers: "$BTC"
+        r'|\b[A-Z]{2,6}\b'             # Acronyms: "NHL", "GDP"
+        r'|\b[A-Z][a-z]{5,}\b'         # Single-word ≥6 chars: "Hurricanes", "Avalanche", "Diamondbacks"
+    ),
 ]
 
+# Leading interrogative verbs caught by the multi-word regex
+_QUESTION_PREFIXES = ("Will ", "Can ", "Should ", "Does ", "Has ", "Have ", "Did ")
+
+_STOPWORDS = frozenset({
+    "THE", "AND", "FOR", "BUT", "NOT", "YES", "WILL", "BE", "BY", "IN", "ON", "AT", "TO",
+    "FC", "BO1", "BO3", "BO5", "VS", "VS.", "OU", "OVER", "UNDER",
+    "SPREAD", "TOTAL", "MONEYLINE", "PARLAY", "TEASER",
+    # Generic sports/esports words — too common in RSS headlines, cause false matches
+    "GAME", "WINNER", "MATCH", "SCORE", "PROMOTIONS", "HANDICAP", "GAMING",
+    "COUNTER", "STRIKE", "MAP", "ROUND", "PLAYOFFS", "CHAMPIONSHIP",
+    "QUARTERFINAL", "SEMIFINAL", "QUALIFIER", "QUALIFICATION",
+    "LEAGUE", "TOURNAMENT", "REGULAR", "SEASON", "SERIES",
+    # League acronyms — appear in every sports headline, useless for matching
+    "NHL", "NFL", "MLB", "NBA", "MLS", "UEFA", "ATP", "ITF", "WTA",
+})
+
 KEYWORD_SUPPLEMENTS = {
     "political": ["election", "vote", "polls"],
     "economic": ["economy", "market", "federal reserve"],
@@ -38,31 +66,20 @@ def extract_keywords(market_id: str, market_question: str, market_type: str) ->
     """Extract search keywords from market question.
     Uses regex first, LLM fallback only if <2 entities found.
     """
-    if market_id in _keyword_cache:
-        return _keyword_cache[market_id]
+    cached = _keyword_cache.get(market_id)
+    if cached is not None:
+        _keyword_cache.move_to_end(market_id)
+        return cached
 
     entities = set()
     for pattern in ENTITY_PATTERNS:
-        matches = pattern.findall(market_question)
-        for m in matches:
+        for m in pattern.findall(market_question):
             cleaned = m.strip().strip("$")
-            # Strip leading interrogative verbs caught by multi-word regex
-            for prefix in ("Will ", "Can ", "Should ", "Does ", "Has ", "Have ", "Did "):
+            for prefix in _QUESTION_PREFIXES:
                 if cleaned.startswith(prefix):
                     cleaned = cleaned[len(prefix):]
                     break
-            if len(cleaned) > 1 and cleaned.upper() not in {
-                "THE", "AND", "FOR", "BUT", "NOT", "YES", "WILL", "BE", "BY", "IN", "ON", "AT", "TO",
-                "FC", "BO1", "BO3", "BO5", "VS", "VS.", "OU", "OVER", "UNDER",
-                "SPREAD", "TOTAL", "MONEYLINE", "PARLAY", "TEASER",
-                # Generic sports/esports words — too common in RSS headlines, cause false matches
-                "GAME", "WINNER", "MATCH", "SCORE", "PROMOTIONS", "HANDICAP", "GAMING",
-                "COUNTER", "STRIKE", "MAP", "ROUND", "PLAYOFFS", "CHAMPIONSHIP",
-                "QUARTERFINAL", "SEMIFINAL", "QUALIFIER", "QUALIFICATION",
-                "LEAGUE", "TOURNAMENT", "REGULAR", "SEASON", "SERIES",
-                # League acronyms — appear in every sports headline, useless for matching
-                "NHL", "NFL", "MLB", "NBA", "MLS", "UEFA", "ATP", "ITF", "WTA",
-            }:
+            if len(cleaned) > 1 and cleaned.upper() not in _STOPWORDS:
                 entities.add(cleaned)
 
     # Add market type supplements
@@ -79,14 +96,35 @@ def extract_keywords(market_id: str, market_question: str, market_type: str) ->
         keywords = words[:5]
 
     _keyword_cache[market_id] = keywords
+    if len(_keyword_cache) > KEYWORD_CACHE_SIZE:
+        _keyword_cache.popitem(last=False)
     return keywords
 
 
-def _format_signal_age(signal: Signal) -> str:
-    """Format signal age as human-readable string."""
+def clear_keyword_cache() -> None:
+    """Drop all cached keyword lists."""
+    _keyword_cache.clear()
+
+
+def _depth_and_skew(orderbook: OrderBook) -> Tuple[float, float]:
+    """Orderbook depth and bid/ask skew in [-1, 1], one pass over each side."""
+    total_bids = sum(l.size for l in orderbook.bids)
+    total_asks = sum(l.size for l in orderbook.asks)
+    depth = total_bids + total_asks
+    return depth, ((total_bids - total_asks) / max(depth, 1) if depth > 0 else 0.0)
+
+
+def _format_signal_age(signal: Signal, now: Optional[datetime] = None) -> str:
+    """Format signal age as human-readable string.
+
+    Callers formatting several signals pass one ``now`` so the clock is read
+    once per prompt rather than once per signal.
+    """
     if not signal.timestamp:
         return "age unknown"
-    age_min = (datetime.now(timezone.utc) - signal.timestamp).total_seconds() / 60
+    if now is None:
+        now = datetime.now(timezone.utc)
+    age_min = (now - signal.timestamp).total_seconds() / 60
     if age_min < 0:
         return "future?"
     if age_min < 120:
@@ -101,31 +139,19 @@ def build_grok_context(
     orderbook: OrderBook,
 ) -> str:
     """Build the context prompt for Grok LLM call."""
-    # Merge and sort signals by credibility, take top 10
-    all_signals = sorted(
-        twitter_signals + rss_signals,
-        key=lambda s: s.credibility,
-        reverse=True,
-    )[:10]
-
-    # Orderbook depth and skew
-    total_bids = sum(l.size for l in orderbook.bids) if orderbook.bids else 0
-    total_asks = sum(l.size for l in orderbook.asks) if orderbook.asks else 0
-    ob_depth = total_bids + total_asks
-    ob_skew = (total_bids - total_asks) / max(ob_depth, 1) if ob_depth > 0 else 0
+    # Top 10 signals by credibility across both sources
+    all_signals = heapq.nlargest(10, chain(twitter_signals, rss_signals), key=_credibility)
+
+    ob_depth, ob_skew = _depth_and_skew(orderbook)
 
     # Build signal text with age
-    signal_lines = []
-    for i, s in enumerate(all_signals, 1):
-        source_label = f"[{s.source_tier}|{s.source}]"
-        age_str = _format_signal_age(s)
-        headline_tag = " [HEADLINE-ONLY]" if s.headline_only else ""
-        signal_lines.append(
-            f"  {i}. {source_label} {age_str} (cred={s.credibility:.2f}): "
-            f"{s.content[:200]}{headline_tag}"
-        )
-
-    signals_text = "\n".join(signal_lines) if signal_lines else "  No signals available."
+    now = datetime.now(timezone.utc)
+    signals_text = "\n".join([
+        f"  {i}. [{s.source_tier}|{s.source}] {_format_signal_age(s, now)} "
+        f"(cred={s.credibility:.2f}): {s.content[:200]}"
+        f"{' [HEADLINE-ONLY]' if s.headline_only else ''}"
+        for i, s in enumerate(all_signals, 1)
+    ]) or "  No signals available."
 
     try:
         spread_val = orderbook.spread
@@ -163,18 +189,15 @@ def build_prescreen_context(
     orderbook: OrderBook,
 ) -> str:
     """Build a lightweight context for pre-screen LLM call (no Twitter signals)."""
-    total_bids = sum(l.size for l in orderbook.bids) if orderbook.bids else 0
-    total_asks = sum(l.size for l in orderbook.asks) if orderbook.asks else 0
-    ob_depth = total_bids + total_asks
-    ob_skew = (total_bids - total_asks) / max(ob_depth, 1) if ob_depth > 0 else 0
+    ob_depth, ob_skew = _depth_and_skew(orderbook)
 
     # Top 5 RSS signals only
-    top_rss = sorted(rss_signals, key=lambda s: s.credibility, reverse=True)[:5]
-    signal_lines = []
-    for i, s in enumerate(top_rss, 1):
-        age_str = _format_signal_age(s)
-        signal_lines.append(f"  {i}. [{s.source_tier}|{s.source}] {age_str}: {s.content[:150]}")
-    signals_text = "\n".join(signal_lines) if signal_lines else "  No signals."
+    top_rss = heapq.nlargest(5, rss_signals, key=_credibility)
+    now = datetime.now(timezone.utc)
+    signals_text = "\n".join([
+        f"  {i}. [{s.source_tier}|{s.source}] {_format_signal_age(s, now)}: {s.content[:150]}"
+        for i, s in enumerate(top_rss, 1)
+    ]) or "  No signals."
 
     return f"""FAST SCREEN — independent probability estimate.
 
@@ -82,6 +82,13 @@ MARKET_TYPE_KEYWORDS: dict[str, list[str]] = {
 }
 
 
+# MARKET_TYPE_KEYWORDS flattened to (keyword, type) pairs in precedence order,
+# so classification is one loop of substring checks with no per-type generator.
+_KEYWORD_TABLE: tuple[tuple[str, str], ...] = tuple(
+    (kw, mtype) for mtype, keywords in MARKET_TYPE_KEYWORDS.items() for kw in keywords
+)
+
+
 def classify_market_type(question: str) -> str:
     """Classify a market question into one of the known market types.
 
@@ -91,9 +98,13 @@ def classify_market_type(question: str) -> str:
     system (MarketTypeManager, SignalTrackerManager) auto-creates entries
     for unknown types, and _DECAY_PARAMS falls back to _default.
     """
-    q_lower = question.lower()
-    for mtype, keywords in MARKET_TYPE_KEYWORDS.items():
-        if any(kw in q_lower for kw in keywords):
+    return classify_lowered_question(question.lower())
+
+
+def classify_lowered_question(q_lower: str) -> str:
+    """classify_market_type() for a question the caller has already lowercased."""
+    for kw, mtype in _KEYWORD_TABLE:
+        if kw in q_lower:
             return mtype
     return "unknown"
 
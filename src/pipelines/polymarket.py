@@ -1,12 +1,13 @@
 import json
 import httpx
+import orjson
 import structlog
 from typing import List, Optional
 from datetime import datetime, timezone
 
 from src.config import Settings
 from src.models import Market, OrderBook, OrderBookLevel
-from src.pipelines.market_classifier import classify_market_type
+from src.pipelines.market_classifier import classify_lowered_question
 
 # CLOB SDK — only required for live trading; imported at module level for testability.
 try:
@@ -17,16 +18,78 @@ except ImportError:  # pragma: no cover
     ApiCreds = None  # type: ignore[assignment]
     OrderArgs = None  # type: ignore[assignment]
 
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:  # pragma: no cover
+    _HTTP2 = False
+
 log = structlog.get_logger()
 
 GAMMA_API_BASE = "https://gamma-api.polymarket.com"
 CLOB_API_BASE = "https://clob.polymarket.com"
 
 
+def _loads(data):
+    """Decode JSON (str or bytes) with orjson, falling back to stdlib json.
+
+    orjson rejects integers wider than 64 bits, which json accepts; the
+    fallback keeps one such field from failing a whole page of markets.
+    Malformed input still raises json.JSONDecodeError as before.
+    """
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def _question_features(question: str) -> tuple[str, List[str]]:
+    """Market type and keywords for a question, lowercasing it once.
+
+    Keywords are the lowercased words longer than three characters.
+    """
+    q_lower = question.lower()
+    keywords = [w for w in q_lower.split() if len(w) > 3]
+    return classify_lowered_question(q_lower), keywords
+
+
 class PolymarketClient:
     def __init__(self, settings: Settings):
         self._settings = settings
         self._timeout = httpx.Timeout(15.0, connect=5.0)
+        self._gamma: httpx.AsyncClient | None = None
+        self._clob: httpx.AsyncClient | None = None
+
+    def _new_client(self, base_url: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=base_url,
+            timeout=self._timeout,
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60),
+        )
+
+    def _gamma_client(self) -> httpx.AsyncClient:
+        """Pooled client for the Gamma API, created on first use.
+
+        Market scans and resolution checks share its keep-alive connections
+        instead of paying a TLS handshake per request.
+        """
+        if self._gamma is None:
+            self._gamma = self._new_client(GAMMA_API_BASE)
+        return self._gamma
+
+    def _clob_client(self) -> httpx.AsyncClient:
+        """Pooled client for the CLOB REST API (orderbooks), created on first use."""
+        if self._clob is None:
+            self._clob = self._new_client(CLOB_API_BASE)
+        return self._clob
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients (called on bot shutdown)."""
+        for client in (self._gamma, self._clob):
+            if client is not None:
+                await client.aclose()
+        self._gamma = self._clob = None
 
     async def get_active_markets(self, tier: int, tier1_fee_rate: float = 0.0, tier2_fee_rate: float = 0.04) -> List[Market]:
         """Get active markets filtered by tier criteria.
@@ -40,26 +103,26 @@ class PolymarketClient:
         all_raw = []
         page_size = self._settings.MARKET_PAGE_SIZE
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                for page in range(self._settings.MARKET_FETCH_PAGES):
-                    params = {
-                        "active": "true",
-                        "closed": "false",
-                        "limit": page_size,
-                        "offset": page * page_size,
-                        "order": "volume24hr",
-                        "ascending": "false",
-                    }
-                    resp = await client.get(f"{GAMMA_API_BASE}/markets", params=params)
-                    if resp.status_code == 429:
-                        log.warning("polymarket_rate_limited", page=page)
-                        break  # Keep what we have so far instead of returning empty
-                    resp.raise_for_status()
-                    page_markets = resp.json()
-                    all_raw.extend(page_markets)
-                    log.debug("market_page_fetched", page=page, count=len(page_markets))
-                    if len(page_markets) < page_size:
-                        break  # No more pages
+            client = self._gamma_client()
+            for page in range(self._settings.MARKET_FETCH_PAGES):
+                params = {
+                    "active": "true",
+                    "closed": "false",
+                    "limit": page_size,
+                    "offset": page * page_size,
+                    "order": "volume24hr",
+                    "ascending": "false",
+                }
+                resp = await client.get("/markets", params=params)
+                if resp.status_code == 429:
+                    log.warning("polymarket_rate_limited", page=page)
+                    break  # Keep what we have so far instead of returning empty
+                resp.raise_for_status()
+                page_markets = _loads(resp.content)
+                all_raw.extend(page_markets)
+                log.debug("market_page_fetched", page=page, count=len(page_markets))
+                if len(page_markets) < page_size:
+                    break  # No more pages
         except httpx.TimeoutException:
             log.warning("polymarket_timeout")
             if not all_raw:
@@ -81,7 +144,7 @@ class PolymarketClient:
                 outcomes = m.get("outcomes", [])
                 outcomePrices = m.get("outcomePrices", "")
                 if isinstance(outcomePrices, str) and outcomePrices:
-                    prices = json.loads(outcomePrices)
+                    prices = _loads(outcomePrices)
                 elif isinstance(outcomePrices, list):
                     prices = outcomePrices
                 else:
@@ -102,14 +165,11 @@ class PolymarketClient:
                         pass
 
                 question = m.get("question", "")
-                market_type = classify_market_type(question)
+                market_type, keywords = _question_features(question)
 
                 volume_24h = float(m.get("volume24hr", 0) or 0)
                 liquidity = float(m.get("liquidity", 0) or 0)
 
-                # Parse keywords from question
-                keywords = [w.lower() for w in question.split() if len(w) > 3]
-
                 # Check if resolved
                 resolved = m.get("closed", False) or m.get("resolved", False)
                 resolution = None
@@ -118,7 +178,7 @@ class PolymarketClient:
                     op_raw_r = m.get("outcomePrices", "")
                     if isinstance(op_raw_r, str) and op_raw_r:
                         try:
-                            op_r = json.loads(op_raw_r)
+                            op_r = _loads(op_raw_r)
                         except (json.JSONDecodeError, ValueError):
                             op_r = None
                     elif isinstance(op_raw_r, list):
@@ -138,7 +198,7 @@ class PolymarketClient:
                 # Extract CLOB token IDs
                 clob_token_ids_raw = m.get("clobTokenIds", "[]")
                 if isinstance(clob_token_ids_raw, str):
-                    clob_tokens = json.loads(clob_token_ids_raw)
+                    clob_tokens = _loads(clob_token_ids_raw)
                 else:
                     clob_tokens = clob_token_ids_raw or []
                 clob_token_id_yes = str(clob_tokens[0]) if len(clob_tokens) > 0 else ""
@@ -206,20 +266,19 @@ class PolymarketClient:
             log.warning("orderbook_no_token_id", market_id=market_id)
             return OrderBook(market_id=market_id)
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.get(
-                    f"{CLOB_API_BASE}/book",
-                    params={"token_id": token_id},
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                raw_bids = sorted(data.get("bids", []), key=lambda b: float(b.get("price", 0)), reverse=True)
-                raw_asks = sorted(data.get("asks", []), key=lambda a: float(a.get("price", 0)))
-                bids = [OrderBookLevel(price=float(b.get("price", 0)), size=float(b.get("size", 0)))
-                        for b in raw_bids[:5]]
-                asks = [OrderBookLevel(price=float(a.get("price", 0)), size=float(a.get("size", 0)))
-                        for a in raw_asks[:5]]
-                return OrderBook(market_id=market_id, bids=bids, asks=asks, timestamp=datetime.now(timezone.utc))
+            resp = await self._clob_client().get(
+                "/book",
+                params={"token_id": token_id},
+            )
+            resp.raise_for_status()
+            data = _loads(resp.content)
+            raw_bids = sorted(data.get("bids", []), key=lambda b: float(b.get("price", 0)), reverse=True)
+            raw_asks = sorted(data.get("asks", []), key=lambda a: float(a.get("price", 0)))
+            bids = [OrderBookLevel(price=float(b.get("price", 0)), size=float(b.get("size", 0)))
+                    for b in raw_bids[:5]]
+            asks = [OrderBookLevel(price=float(a.get("price", 0)), size=float(a.get("size", 0)))
+                    for a in raw_asks[:5]]
+            return OrderBook(market_id=market_id, bids=bids, asks=asks, timestamp=datetime.now(timezone.utc))
         except Exception as e:
             log.warning("orderbook_fetch_failed", market_id=market_id, error=str(e))
             return OrderBook(market_id=market_id)
@@ -227,61 +286,61 @@ class PolymarketClient:
     async def get_market(self, market_id: str) -> Optional[Market]:
         """Get single market including resolution status."""
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.get(f"{GAMMA_API_BASE}/markets/{market_id}")
-                resp.raise_for_status()
-                m = resp.json()
-
-                outcomes = m.get("outcomes", [])
-                outcomePrices = m.get("outcomePrices", "")
-                if isinstance(outcomePrices, str) and outcomePrices:
-                    prices = json.loads(outcomePrices)
-                elif isinstance(outcomePrices, list):
-                    prices = outcomePrices
-                else:
-                    prices = [0.5, 0.5]
-
-                yes_price = float(prices[0]) if len(prices) > 0 else 0.5
-                no_price = float(prices[1]) if len(prices) > 1 else 1 - yes_price
-
-                resolved = m.get("closed", False) or m.get("resolved", False)
-                resolution = None
-                if resolved:
-                    # Gamma API uses outcomePrices (a JSON-encoded list like ["1","0"] or
-                    # ["0","1"]) — there is no resolutionPrices field (fixed in commit 65b8caa
-                    # for backtest data_ingestion; mirrored here).
-                    op_raw = m.get("outcomePrices", "")
-                    if isinstance(op_raw, str) and op_raw:
-                        try:
-                            op = json.loads(op_raw)
-                        except (json.JSONDecodeError, ValueError):
-                            op = None
-                    elif isinstance(op_raw, list):
-                        op = op_raw
-                    else:
+            resp = await self._gamma_client().get(f"/markets/{market_id}")
+            resp.raise_for_status()
+            m = _loads(resp.content)
+
+            outcomes = m.get("outcomes", [])
+            outcomePrices = m.get("outcomePrices", "")
+            if isinstance(outcomePrices, str) and outcomePrices:
+                prices = _loads(outcomePrices)
+            elif isinstance(outcomePrices, list):
+                prices = outcomePrices
+            else:
+                prices = [0.5, 0.5]
+
+            yes_price = float(prices[0]) if len(prices) > 0 else 0.5
+            no_price = float(prices[1]) if len(prices) > 1 else 1 - yes_price
+
+            resolved = m.get("closed", False) or m.get("resolved", False)
+            resolution = None
+            if resolved:
+                # Gamma API uses outcomePrices (a JSON-encoded list like ["1","0"] or
+                # ["0","1"]) — there is no resolutionPrices field (fixed in commit 65b8caa
+                # for backtest data_ingestion; mirrored here).
+                op_raw = m.get("outcomePrices", "")
+                if isinstance(op_raw, str) and op_raw:
+                    try:
+                        op = _loads(op_raw)
+                    except (json.JSONDecodeError, ValueError):
                         op = None
-                    if op and len(op) >= 2:
-                        try:
-                            yes_price_resolved = float(op[0])
-                            if yes_price_resolved > 0.5:
-                                resolution = "YES"
-                            elif yes_price_resolved < 0.5:
-                                resolution = "NO"
-                            # 0.5 = voided/cancelled, leave as None
-                        except (ValueError, TypeError):
-                            pass
+                elif isinstance(op_raw, list):
+                    op = op_raw
+                else:
+                    op = None
+                if op and len(op) >= 2:
+                    try:
+                        yes_price_resolved = float(op[0])
+                        if yes_price_resolved > 0.5:
+                            resolution = "YES"
+                        elif yes_price_resolved < 0.5:
+                            resolution = "NO"
+                        # 0.5 = voided/cancelled, leave as None
+                    except (ValueError, TypeError):
+                        pass
 
-                question = m.get("question", "")
-                return Market(
-                    market_id=str(m.get("id", m.get("condition_id", ""))),
-                    question=question,
-                    yes_price=yes_price,
-                    no_price=no_price,
-                    market_type=classify_market_type(question),
-                    resolved=resolved,
-                    resolution=resolution,
-                    keywords=[w.lower() for w in question.split() if len(w) > 3][:10],
-                )
+            question = m.get("question", "")
+            market_type, keywords = _question_features(question)
+            return Market(
+                market_id=str(m.get("id", m.get("condition_id", ""))),
+                question=question,
+                yes_price=yes_price,
+                no_price=no_price,
+                market_type=market_type,
+                resolved=resolved,
+                resolution=resolution,
+                keywords=keywords[:10],
+            )
         except Exception as e:
             log.error("market_get_failed", market_id=market_id, error=str(e))
             return None
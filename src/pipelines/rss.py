@@ -15,6 +15,10 @@ from src.pipelines.signal_classifier import classify_source_tier, classify_info_
 
 log = structlog.get_logger()
 
+# Feeds fetched at once per poll. Results are still processed in config order,
+# so headline dedup doesn't depend on which feed answered first.
+FEED_FETCH_CONCURRENCY = 16
+
 
 def _load_feed_config() -> dict:
     config_path = Path(__file__).resolve().parents[2] / "config" / "rss_feeds.yaml"
@@ -56,12 +60,55 @@ class RSSPipeline:
         self._feeds = _load_feed_config()
         self._cached_signals: List[Signal] = []
         self._lock = asyncio.Lock()
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for feed fetches, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": self.settings.RSS_USER_AGENT},
+                follow_redirects=True,
+                timeout=10.0,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (called on bot shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _fetch_feeds(self) -> list:
+        """Fetch and parse every feed concurrently.
+
+        Returns one parsed feed per configured feed, in config order; a failed
+        fetch or parse is returned as its exception.
+        """
+        client = self._get_client()
+        sem = asyncio.Semaphore(FEED_FETCH_CONCURRENCY)
+
+        async def fetch(cfg: dict):
+            async with sem:
+                resp = await client.get(cfg["url"])
+            resp.raise_for_status()
+            # feedparser is pure-Python CPU work; keep it off the event loop.
+            return await asyncio.to_thread(feedparser.parse, resp.content)
+
+        return await asyncio.gather(
+            *(fetch(cfg) for cfg in self._feeds.values()), return_exceptions=True,
+        )
 
     def _prune_old_headlines(self) -> None:
+        # Headlines are recorded once, stamped with the poll time, so the dict's
+        # insertion order is time order: expired entries are all at the front.
         cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
-        self.seen_headlines = {
-            h: ts for h, ts in self.seen_headlines.items() if ts > cutoff
-        }
+        expired = []
+        for h, ts in self.seen_headlines.items():
+            if ts > cutoff:
+                break
+            expired.append(h)
+        for h in expired:
+            del self.seen_headlines[h]
 
     async def poll_and_accumulate(self) -> None:
         """Poll RSS feeds and accumulate new signals for later consumption."""
@@ -88,16 +135,11 @@ class RSSPipeline:
         signals = []
         now = datetime.now(timezone.utc)
 
-        for feed_name, cfg in self._feeds.items():
+        feeds = await self._fetch_feeds()
+        for (feed_name, cfg), feed in zip(self._feeds.items(), feeds):
             try:
-                async with httpx.AsyncClient(
-                    headers={"User-Agent": self.settings.RSS_USER_AGENT},
-                    follow_redirects=True,
-                    timeout=10.0,
-                ) as client:
-                    resp = await client.get(cfg["url"])
-                    resp.raise_for_status()
-                    feed = feedparser.parse(resp.content)
+                if isinstance(feed, BaseException):
+                    raise feed
                 for entry in feed.entries[:self.settings.RSS_ENTRIES_PER_FEED]:
                     headline = entry.title.strip()
                     if headline in self.seen_headlines:
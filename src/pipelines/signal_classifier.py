@@ -16,7 +16,7 @@ Tier definitions
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Set
+from typing import Any, Dict, FrozenSet, Set
 
 import structlog
 import yaml
@@ -76,9 +76,9 @@ _INSTITUTIONAL_RSS: Set[str] = {
     d.lower() for d in _KNOWN.get("institutional_media", {}).get("rss_domains", [])
 }
 
-_EXPERT_BIO_KEYWORDS: Set[str] = {
+_EXPERT_BIO_KEYWORDS: FrozenSet[str] = frozenset(
     kw.lower() for kw in _KNOWN.get("expert_bio_keywords", [])
-}
+)
 
 # Minimum follower threshold for S4 (verified expert) classification.
 _S4_MIN_FOLLOWERS: int = 50_000
@@ -156,11 +156,13 @@ def classify_source_tier(signal: dict) -> str:
 
 def _normalise_domain(raw: str) -> str:
     """Strip protocol, ``www.`` prefix, and trailing slashes from a domain."""
-    domain = raw.lower().strip()
-    for prefix in ("https://", "http://", "www."):
-        if domain.startswith(prefix):
-            domain = domain[len(prefix):]
-    return domain.rstrip("/")
+    return (
+        raw.lower().strip()
+        .removeprefix("https://")
+        .removeprefix("http://")
+        .removeprefix("www.")
+        .rstrip("/")
+    )
 
 
 def _classify_rss(signal: dict) -> str:
@@ -224,5 +226,6 @@ def _bio_contains_expert_keyword(bio: str) -> bool:
     if not bio:
         return False
     # Split on common delimiters so "journalist/editor" is detected.
-    bio_tokens = set(bio.replace("/", " ").replace("|", " ").replace(",", " ").split())
-    return bool(bio_tokens & _EXPERT_BIO_KEYWORDS)
+    # isdisjoint() stops at the first hit without building a token set.
+    bio_tokens = bio.replace("/", " ").replace("|", " ").replace(",", " ").split()
+    return not _EXPERT_BIO_KEYWORDS.isdisjoint(bio_tokens)
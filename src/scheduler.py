@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import structlog
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -23,6 +22,7 @@ from src.engine.execution import execute_trade
 from src.engine.grok_client import LLMClient
 from src.engine.resolution import auto_resolve_trades, check_early_exits, update_unrealized_adverse_moves
 from src.engine.trade_decision import (
+    MonkModeCache,
     calculate_edge,
     calculate_spread_adjusted_edge,
     check_monk_mode,
@@ -32,12 +32,12 @@ from src.engine.trade_decision import (
     kelly_size_vwap,
 )
 from src.engine.trade_ranker import select_best_trades
-from src.learning.adjustment import adjust_prediction, on_trade_resolved
+from src.learning.adjustment import adjust_prediction, on_trades_resolved
 from src.learning.calibration import CalibrationManager
 from src.learning.experiments import get_current_experiment
 from src.learning.market_type import MarketTypeManager
 from src.learning.signal_tracker import SignalTrackerManager
-from src.models import Market, Signal, TradeCandidate, TradeRecord
+from src.models import Market, Signal, TradeCandidate, TradeRecord, new_record_id
 from src.pipelines.context_builder import build_grok_context, build_prescreen_context, extract_keywords
 from src.pipelines.market_classifier import get_fee_rate, get_min_edge
 from src.pipelines.polymarket import PolymarketClient
@@ -163,9 +163,9 @@ class Scheduler:
         try:
             await check_early_exits(self._db, self._polymarket, self._settings)
             newly_resolved = await auto_resolve_trades(self._db, self._polymarket)
-            for trade in newly_resolved:
-                await on_trade_resolved(
-                    record=trade,
+            if newly_resolved:
+                await on_trades_resolved(
+                    records=newly_resolved,
                     calibration_mgr=self._calibration_mgr,
                     market_type_mgr=self._market_type_mgr,
                     signal_tracker_mgr=self._signal_tracker_mgr,
@@ -247,7 +247,7 @@ class Scheduler:
                 self._observe_only_alert_date = today_str
 
             today_trades = await self._db.get_today_trades()
-            week_trades = await self._db.get_week_trades()
+            week_trades = await self._db.get_week_trades(fields=("pnl",))
             api_spend = await self._db.get_today_api_spend()
             portfolio = await self._db.load_portfolio()
             open_market_ids = await self._db.get_open_market_ids()
@@ -290,6 +290,7 @@ class Scheduler:
             # Process each market
             candidates: List[TradeCandidate] = []
             all_skips: List[TradeRecord] = []
+            weight_cache: Dict[Tuple[str, str, str], float] = {}
 
             for market in markets:
                 try:
@@ -306,6 +307,7 @@ class Scheduler:
                         recently_traded_ids=recently_traded_ids,
                         recently_evaluated_ids=recently_evaluated_ids,
                         recent_questions=recent_questions,
+                        weight_cache=weight_cache,
                     )
                 except Exception as e:
                     log.error("market_processing_error",
@@ -323,10 +325,11 @@ class Scheduler:
 
                 # Execute trades
                 monk_alerted_reasons: set = set()
+                monk_cache = MonkModeCache.build(today_trades, week_trades)
                 for candidate in to_execute:
                     allowed, reason = check_monk_mode(
                         self._monk_config, candidate, portfolio,
-                        today_trades, week_trades, api_spend,
+                        today_trades, week_trades, api_spend, cache=monk_cache,
                     )
                     if not allowed:
                         candidate.skip_reason = reason
@@ -347,13 +350,13 @@ class Scheduler:
                         if self.ws_exit_mgr is not None:
                             await self.ws_exit_mgr.add_position(record)
                         today_trades.append(record)
+                        monk_cache.add_trade(record)
                         await send_alert(
                             format_trade_alert(record), self._settings
                         )
 
                 # Record skips
-                for skip in to_skip:
-                    await self._record_skip(skip, experiment_run)
+                await self._record_skips(to_skip, experiment_run)
 
             self.last_scan_completed = Clock.utcnow()
             log.info("tier1_scan_complete",
@@ -372,7 +375,7 @@ class Scheduler:
         log.info("tier2_scan_start")
         try:
             today_trades = await self._db.get_today_trades()
-            week_trades = await self._db.get_week_trades()
+            week_trades = await self._db.get_week_trades(fields=("pnl",))
             api_spend = await self._db.get_today_api_spend()
             portfolio = await self._db.load_portfolio()
             open_market_ids = await self._db.get_open_market_ids()
@@ -396,6 +399,7 @@ class Scheduler:
 
             candidates: List[TradeCandidate] = []
             all_skips: List[TradeRecord] = []
+            weight_cache: Dict[Tuple[str, str, str], float] = {}
 
             for market in markets:
                 try:
@@ -412,6 +416,7 @@ class Scheduler:
                         recently_traded_ids=recently_traded_ids,
                         recently_evaluated_ids=recently_evaluated_ids,
                         recent_questions=recent_questions,
+                        weight_cache=weight_cache,
                     )
                 except Exception as e:
                     log.error("tier2_market_error",
@@ -427,10 +432,11 @@ class Scheduler:
                 )
 
                 monk_alerted_reasons: set = set()
+                monk_cache = MonkModeCache.build(today_trades, week_trades)
                 for candidate in to_execute:
                     allowed, reason = check_monk_mode(
                         self._monk_config, candidate, portfolio,
-                        today_trades, week_trades, api_spend,
+                        today_trades, week_trades, api_spend, cache=monk_cache,
                     )
                     if not allowed:
                         candidate.skip_reason = reason
@@ -451,12 +457,12 @@ class Scheduler:
                         if self.ws_exit_mgr is not None:
                             await self.ws_exit_mgr.add_position(record)
                         today_trades.append(record)
+                        monk_cache.add_trade(record)
                         await send_alert(
                             format_trade_alert(record), self._settings
                         )
 
-                for skip in to_skip:
-                    await self._record_skip(skip, experiment_run)
+                await self._record_skips(to_skip, experiment_run)
 
             # Check deactivation: no new crypto signals for 30 min
             now = Clock.utcnow()
@@ -489,6 +495,7 @@ class Scheduler:
         recently_traded_ids: set = frozenset(),
         recently_evaluated_ids: set = frozenset(),
         recent_questions: list = None,
+        weight_cache: Optional[dict] = None,
     ) -> None:
         # Skip if we already have an open position on this market
         if market.market_id in open_market_ids:
@@ -641,6 +648,7 @@ class Scheduler:
         adj_prob, adj_conf, extra_edge = adjust_prediction(
             grok_prob, grok_conf, market.market_type, signal_types,
             self._calibration_mgr, self._market_type_mgr, self._signal_tracker_mgr,
+            weight_cache=weight_cache,
         )
 
         # Calculate edge and side
@@ -752,7 +760,7 @@ class Scheduler:
         signal_types: list = None,
     ) -> TradeRecord:
         return TradeRecord(
-            record_id=str(uuid.uuid4()),
+            record_id=new_record_id(),
             experiment_run=experiment_run,
             timestamp=Clock.utcnow(),
             model_used=self._settings.LLM_MODEL,
@@ -774,9 +782,16 @@ class Scheduler:
             resolution_datetime=market.resolution_time,
         )
 
-    async def _record_skip(self, candidate: TradeCandidate, experiment_run: str) -> None:
-        record = TradeRecord(
-            record_id=str(uuid.uuid4()),
+    async def _record_skips(self, candidates: List[TradeCandidate], experiment_run: str) -> None:
+        """Persist ranked-out candidates as SKIP records in one batched insert."""
+        if candidates:
+            await self._db.save_trades([
+                self._build_ranked_out_record(c, experiment_run) for c in candidates
+            ])
+
+    def _build_ranked_out_record(self, candidate: TradeCandidate, experiment_run: str) -> TradeRecord:
+        return TradeRecord(
+            record_id=new_record_id(),
             experiment_run=experiment_run,
             timestamp=Clock.utcnow(),
             model_used=self._settings.LLM_MODEL,
@@ -807,7 +822,6 @@ class Scheduler:
             market_cluster_id=candidate.market_cluster_id,
             resolution_datetime=candidate.market.resolution_time,
         )
-        await self._db.save_trade(record)
 
     async def _activate_tier2(self) -> None:
         if self._tier2_active:
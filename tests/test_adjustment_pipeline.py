@@ -296,6 +296,31 @@ class TestSignalWeightAdjustments:
         # Expected: 0.80 + (1.15 - 1.0) * 0.1 = 0.815
         assert adj_conf == pytest.approx(0.815, abs=1e-9)
 
+    def test_weight_cache_reused_across_candidates(self):
+        """A shared weight_cache looks each (tier, type, market) weight up once."""
+        from unittest.mock import patch
+
+        cal, mkt, sig = _fresh_managers()
+        cache = {}
+        tags = [{"source_tier": "S2", "info_type": "I2"}, {"source_tier": "S2", "info_type": "I2"}]
+
+        with patch.object(sig, "get_signal_weight", return_value=1.15) as mock_weight:
+            for _ in range(3):
+                _, adj_conf, _ = adjust_prediction(
+                    grok_probability=0.72,
+                    grok_confidence=0.80,
+                    market_type="political",
+                    signal_tags=tags,
+                    calibration_mgr=cal,
+                    market_type_mgr=mkt,
+                    signal_tracker_mgr=sig,
+                    weight_cache=cache,
+                )
+                assert adj_conf == pytest.approx(0.815, abs=1e-9)
+
+        mock_weight.assert_called_once_with("S2", "I2", "political")
+        assert cache == {("S2", "I2", "political"): 1.15}
+
 
 # ---------------------------------------------------------------------------
 # Probability shrinkage
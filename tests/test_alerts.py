@@ -1,13 +1,19 @@
 """Tests for src/alerts.py."""
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
 import httpx
+import orjson
 import pytest
 
+import src.alerts as alerts_mod
 from src.alerts import (
     TELEGRAM_API,
+    close_client,
+    start_alert_drain,
+    stop_alert_drain,
     format_daily_summary,
     format_error_alert,
     format_lifecycle_alert,
@@ -26,6 +32,23 @@ from src.models import Portfolio, Position, TradeRecord
 # Helpers
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def reset_shared_client():
+    """Drop the module-level Telegram client so each test builds its own."""
+    alerts_mod._client = None
+    yield
+    alerts_mod._client = None
+    alerts_mod._queue = None
+    alerts_mod._drain_task = None
+
+
+def _mock_client(status_code: int = 200) -> AsyncMock:
+    """AsyncClient double whose post() returns a real httpx.Response."""
+    client = AsyncMock(spec=httpx.AsyncClient)
+    client.post.return_value = httpx.Response(status_code)
+    return client
+
+
 def _make_settings(token: str = "tok123", chat_id: str = "42") -> Settings:
     return Settings(
         XAI_API_KEY="t",
@@ -72,29 +95,28 @@ class TestSendAlert:
     async def test_sends_post_when_token_set(self):
         """With a valid token and chat_id, send_alert POSTs to the Telegram API."""
         settings = _make_settings(token="bot-token", chat_id="12345")
-        mock_response = MagicMock()
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_client.post.return_value = mock_response
+        mock_client = _mock_client()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=False)
 
         with patch("src.alerts.httpx.AsyncClient", return_value=mock_client):
             await send_alert("hello", settings)
 
-        mock_client.post.assert_awaited_once_with(
-            f"{TELEGRAM_API}/botbot-token/sendMessage",
-            json={
-                "chat_id": "12345",
-                "text": "hello",
-                "parse_mode": "HTML",
-            },
-        )
+        mock_client.post.assert_awaited_once()
+        args, kwargs = mock_client.post.await_args
+        assert args == (f"{TELEGRAM_API}/botbot-token/sendMessage",)
+        assert kwargs["headers"] == {"content-type": "application/json"}
+        assert orjson.loads(kwargs["content"]) == {
+            "chat_id": "12345",
+            "text": "hello",
+            "parse_mode": "HTML",
+        }
 
     @pytest.mark.asyncio
     async def test_noop_when_token_empty(self):
         """With empty token, send_alert returns immediately without making a request."""
         settings = _make_settings(token="", chat_id="12345")
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        mock_client = _mock_client()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=False)
 
@@ -107,7 +129,7 @@ class TestSendAlert:
     async def test_noop_when_chat_id_empty(self):
         """With empty chat_id, send_alert returns immediately without making a request."""
         settings = _make_settings(token="tok", chat_id="")
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        mock_client = _mock_client()
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=False)
 
@@ -116,19 +138,162 @@ class TestSendAlert:
 
         mock_client.post.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_programming_error_propagates(self):
+        """Only transport errors are swallowed; bugs surface to the caller."""
+        settings = _make_settings(token="tok", chat_id="42")
+        mock_client = _mock_client()
+        mock_client.post.side_effect = TypeError("bad call")
+
+        with patch("src.alerts.httpx.AsyncClient", return_value=mock_client):
+            with pytest.raises(TypeError):
+                await send_alert("hello", settings)
+
     @pytest.mark.asyncio
     async def test_telegram_api_error_no_exception(self):
         """When the Telegram API call raises, send_alert swallows the exception."""
         settings = _make_settings(token="tok", chat_id="42")
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        mock_client = _mock_client()
         mock_client.post.side_effect = httpx.ConnectError("connection refused")
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=False)
 
-        with patch("src.alerts.httpx.AsyncClient", return_value=mock_client):
+        with patch("src.alerts.httpx.AsyncClient", return_value=mock_client), \
+                patch("src.alerts._backoff_delay", return_value=0.0):
             # Should not raise
             await send_alert("hello", settings)
 
+        assert mock_client.post.await_count == alerts_mod.ALERT_MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_retries_server_error_then_succeeds(self):
+        """A 5xx is retried and the next 200 ends the loop."""
+        settings = _make_settings(token="tok", chat_id="42")
+        mock_client = _mock_client()
+        mock_client.post.side_effect = [httpx.Response(502), httpx.Response(200)]
+
+        with patch("src.alerts.httpx.AsyncClient", return_value=mock_client), \
+                patch("src.alerts._backoff_delay", return_value=0.0):
+            await send_alert("hello", settings)
+
+        assert mock_client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_429_honors_retry_after(self):
+        """A 429 sleeps for the Retry-After interval before retrying."""
+        settings = _make_settings(token="tok", chat_id="42")
+        mock_client = _mock_client()
+        mock_client.post.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "1.5"}),
+            httpx.Response(200),
+        ]
+
+        with patch("src.alerts.httpx.AsyncClient", return_value=mock_client), \
+                patch("src.alerts.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await send_alert("hello", settings)
+
+        mock_sleep.assert_awaited_once_with(1.5)
+        assert mock_client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self):
+        """A 4xx other than 429 (e.g. bad chat id) is not retried."""
+        settings = _make_settings(token="tok", chat_id="42")
+        mock_client = _mock_client(status_code=400)
+
+        with patch("src.alerts.httpx.AsyncClient", return_value=mock_client):
+            await send_alert("hello", settings)
+
+        assert mock_client.post.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_sends(self):
+        """Consecutive alerts share one AsyncClient instead of reconnecting."""
+        settings = _make_settings(token="tok", chat_id="42")
+        mock_client = _mock_client()
+
+        with patch("src.alerts.httpx.AsyncClient", return_value=mock_client) as ctor:
+            await send_alert("one", settings)
+            await send_alert("two", settings)
+
+        assert ctor.call_count == 1
+        assert mock_client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_client_releases_shared_client(self):
+        """close_client closes the shared client and allows a fresh one later."""
+        settings = _make_settings(token="tok", chat_id="42")
+        mock_client = _mock_client()
+
+        with patch("src.alerts.httpx.AsyncClient", return_value=mock_client):
+            await send_alert("one", settings)
+            await close_client()
+
+        mock_client.aclose.assert_awaited_once()
+        assert alerts_mod._client is None
+
+
+# ---------------------------------------------------------------------------
+# Coalescing drain queue
+# ---------------------------------------------------------------------------
+
+class TestAlertDrain:
+    @pytest.mark.asyncio
+    async def test_drain_survives_unexpected_error(self):
+        """A non-HTTP failure is logged and the drain keeps delivering."""
+        settings = _make_settings(token="tok", chat_id="42")
+        mock_client = _mock_client()
+        mock_client.post.side_effect = [RuntimeError("boom"), httpx.Response(200)]
+
+        with patch("src.alerts.httpx.AsyncClient", return_value=mock_client), \
+                patch.object(alerts_mod, "ALERT_COALESCE_WINDOW_SECONDS", 0):
+            start_alert_drain(settings)
+            await send_alert("first", settings)
+            while mock_client.post.await_count < 1:
+                await asyncio.sleep(0)
+            await send_alert("second", settings)
+            await stop_alert_drain()
+
+        assert mock_client.post.await_count == 2
+
+
+    @pytest.mark.asyncio
+    async def test_alerts_in_window_coalesce_into_one_post(self):
+        """Alerts queued within the coalesce window are sent as one message."""
+        settings = _make_settings(token="tok", chat_id="42")
+        mock_client = _mock_client()
+
+        with patch("src.alerts.httpx.AsyncClient", return_value=mock_client):
+            start_alert_drain(settings)
+            await send_alert("first", settings)
+            await send_alert("second", settings)
+            await stop_alert_drain()
+
+        mock_client.post.assert_awaited_once()
+        text = orjson.loads(mock_client.post.await_args.kwargs["content"])["text"]
+        assert text == "first\n\nsecond"
+
+    @pytest.mark.asyncio
+    async def test_oversized_batch_is_split(self):
+        """A batch that would exceed the Telegram length cap is flushed early."""
+        settings = _make_settings(token="tok", chat_id="42")
+        mock_client = _mock_client()
+        big = "x" * (alerts_mod.ALERT_MAX_BATCH_CHARS - 2)
+
+        with patch("src.alerts.httpx.AsyncClient", return_value=mock_client):
+            start_alert_drain(settings)
+            await send_alert(big, settings)
+            await send_alert("tail", settings)
+            await stop_alert_drain()
+
+        texts = [orjson.loads(c.kwargs["content"])["text"] for c in mock_client.post.await_args_list]
+        assert texts == [big, "tail"]
+
+    @pytest.mark.asyncio
+    async def test_stop_without_start_is_noop(self):
+        """stop_alert_drain is safe to call when the drain was never started."""
+        await stop_alert_drain()
+
 
 # ---------------------------------------------------------------------------
 # format_trade_alert
@@ -39,6 +39,14 @@ class TestFindBucket:
         assert bucket is not None
         assert bucket.bucket_range == (0.95, 1.00)
 
+    def test_find_bucket_edges(self):
+        """Lower edges are inclusive; out-of-range values clamp to the end buckets."""
+        mgr = CalibrationManager()
+        assert mgr.find_bucket(0.70).bucket_range == (0.70, 0.80)
+        assert mgr.find_bucket(0.6999).bucket_range == (0.60, 0.70)
+        assert mgr.find_bucket(0.30).bucket_range == (0.50, 0.60)
+        assert mgr.find_bucket(1.0).bucket_range == (0.95, 1.00)
+
 
 # ---------------------------------------------------------------------------
 # get_correction
@@ -287,6 +295,34 @@ class TestUpdateCalibrationBetaIncrement:
         assert bucket.beta > 1.0
 
 
+class TestUpdateCalibrationBatch:
+    """update_calibration_batch matches applying update_calibration record by record."""
+
+    def test_batch_matches_per_record(self, sample_trade_record):
+        now = datetime.now(timezone.utc)
+        records = []
+        for i, conf in enumerate([0.30, 0.55, 0.70, 0.75, 0.85, 0.97, 1.0]):
+            ts = now - timedelta(days=i * 3)
+            records.append(sample_trade_record(
+                grok_raw_confidence=conf,
+                grok_raw_probability=0.75 if i % 2 else 0.35,
+                actual_outcome=bool(i % 3),
+                timestamp=ts if i % 2 else ts.replace(tzinfo=None),
+                voided=False,
+            ))
+        records.append(sample_trade_record(grok_raw_confidence=0.75, actual_outcome=True, voided=True))
+        records.append(sample_trade_record(grok_raw_confidence=0.75, actual_outcome=None))
+
+        one_by_one, batched = CalibrationManager(), CalibrationManager()
+        for r in records:
+            one_by_one.update_calibration(r)
+        batched.update_calibration_batch(records)
+
+        for a, b in zip(one_by_one.buckets, batched.buckets):
+            assert b.alpha == pytest.approx(a.alpha, rel=1e-6)
+            assert b.beta == pytest.approx(a.beta, rel=1e-6)
+
+
 # ---------------------------------------------------------------------------
 # Test 14: After reset_to_priors, all get_correction() returns 0.0
 # ---------------------------------------------------------------------------
@@ -0,0 +1,76 @@
+"""Tests for AsyncCircuitBreaker state transitions."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.engine.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    AsyncCircuitBreaker,
+    OpenCircuitError,
+)
+
+
+async def _fail():
+    raise RuntimeError("boom")
+
+
+async def _ok():
+    return "ok"
+
+
+class TestAsyncCircuitBreaker:
+    @pytest.mark.asyncio
+    async def test_opens_after_threshold_and_short_circuits(self):
+        breaker = AsyncCircuitBreaker("p", failure_threshold=3, recovery_timeout=30.0)
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                await breaker.call(_fail)
+        assert breaker.state == OPEN
+
+        factory = AsyncMock()
+        with pytest.raises(OpenCircuitError):
+            await breaker.call(factory)
+        factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_success_resets_consecutive_failures(self):
+        breaker = AsyncCircuitBreaker("p", failure_threshold=2)
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+        assert await breaker.call(_ok) == "ok"
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+        assert breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_or_reopens(self):
+        breaker = AsyncCircuitBreaker("p", failure_threshold=1, recovery_timeout=30.0)
+        with patch("src.engine.circuit_breaker.time.monotonic", return_value=100.0):
+            with pytest.raises(RuntimeError):
+                await breaker.call(_fail)
+        with patch("src.engine.circuit_breaker.time.monotonic", return_value=131.0):
+            assert breaker.state == HALF_OPEN
+            with pytest.raises(RuntimeError):
+                await breaker.call(_fail)
+            assert breaker.state == OPEN
+        with patch("src.engine.circuit_breaker.time.monotonic", return_value=162.0):
+            assert await breaker.call(_ok) == "ok"
+        assert breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_ignored_exceptions_do_not_trip(self):
+        breaker = AsyncCircuitBreaker(
+            "p", failure_threshold=1, is_failure=lambda e: not isinstance(e, ValueError),
+        )
+
+        async def _bad_request():
+            raise ValueError("400")
+
+        with pytest.raises(ValueError):
+            await breaker.call(_bad_request)
+        assert breaker.state == CLOSED
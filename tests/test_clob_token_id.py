@@ -46,7 +46,7 @@ class TestClobTokenIdExtraction:
 
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = [_make_gamma_market()]
+        mock_resp.content = json.dumps([_make_gamma_market()]).encode()
         mock_resp.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_cls:
@@ -77,7 +77,7 @@ class TestClobTokenIdExtraction:
 
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = [_make_gamma_market(clobTokenIds=None)]
+        mock_resp.content = json.dumps([_make_gamma_market(clobTokenIds=None)]).encode()
         mock_resp.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_cls:
@@ -108,7 +108,7 @@ class TestGetOrderbookTokenId:
 
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = {"bids": [], "asks": []}
+        mock_resp.content = json.dumps({"bids": [], "asks": []}).encode()
         mock_resp.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_cls:
@@ -1,5 +1,7 @@
 import pytest
-from src.config import Settings, MonkModeConfig
+from pydantic import ValidationError
+
+from src.config import Settings, MonkModeConfig, get_settings
 
 
 class TestSettings:
@@ -58,6 +60,19 @@ class TestSettings:
         s = Settings(XAI_API_KEY="t", TWITTER_API_KEY="t")
         assert s.PRESCREEN_MIN_CONFIDENCE == 0.25
 
+    def test_settings_are_frozen(self):
+        s = Settings(XAI_API_KEY="t", TWITTER_API_KEY="t")
+        with pytest.raises(ValidationError):
+            s.TIER1_MIN_EDGE = 0.5
+        assert s.model_copy(update={"TIER1_MIN_EDGE": 0.5}).TIER1_MIN_EDGE == 0.5
+
+    def test_get_settings_is_cached(self):
+        get_settings.cache_clear()
+        try:
+            assert get_settings() is get_settings()
+        finally:
+            get_settings.cache_clear()
+
 
 class TestMonkModeConfig:
     def test_from_settings(self):
@@ -73,3 +88,15 @@ class TestMonkModeConfig:
         assert m.max_position_pct == 0.016
         assert m.max_total_exposure_pct == 0.30
         assert m.kelly_fraction == 0.25
+
+    def test_from_settings_is_memoized_per_instance(self):
+        s = Settings(XAI_API_KEY="t", TWITTER_API_KEY="t")
+        assert MonkModeConfig.from_settings(s) is MonkModeConfig.from_settings(s)
+        other = s.model_copy(update={"TIER1_DAILY_CAP": 7})
+        assert MonkModeConfig.from_settings(other).tier1_daily_trade_cap == 7
+
+    def test_is_frozen_and_slotted(self):
+        m = MonkModeConfig()
+        assert not hasattr(m, "__dict__")
+        with pytest.raises(AttributeError):
+            m.kelly_fraction = 0.5
@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 import pytest
 
 from src.models import Market, Signal, OrderBook, OrderBookLevel
+from src.pipelines import context_builder
 from src.pipelines.context_builder import (
     extract_keywords,
     build_grok_context,
@@ -134,6 +135,15 @@ class TestExtractKeywords:
         second = extract_keywords("cached-1", "Completely different question", "economic")
         assert second == ["CACHED_VALUE"]
 
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """Cache is bounded; a hit refreshes an entry so the oldest unused one goes first."""
+        monkeypatch.setattr(context_builder, "KEYWORD_CACHE_SIZE", 2)
+        extract_keywords("lru-1", "Will Donald Trump run?", "political")
+        extract_keywords("lru-2", "Will Joe Biden run?", "political")
+        extract_keywords("lru-1", "Will Donald Trump run?", "political")
+        extract_keywords("lru-3", "Will Kamala Harris run?", "political")
+        assert list(_keyword_cache) == ["lru-1", "lru-3"]
+
     def test_supplements_added_when_few_regex_matches(self):
         """When regex finds < 2 entities, market type supplements are added."""
         # A question with no clear named entities or acronyms
@@ -304,6 +314,18 @@ class TestBuildGrokContext:
         pos_tw_low = ctx.index("unique_tw_low")
         assert pos_tw_top < pos_rss_mid < pos_tw_low
 
+    def test_credibility_ties_keep_twitter_then_rss_order(self):
+        """Equal-credibility signals keep input order (Twitter first), and the cut at 10 respects it."""
+        market = _make_market()
+        twitter_signals = [_make_signal(content=f"tie unique_tw_{i}", author=f"tw{i}", credibility=0.5) for i in range(6)]
+        rss_signals = [_make_signal(content=f"tie unique_rss_{i}", author=f"rss{i}", credibility=0.5, source="rss") for i in range(6)]
+        ctx = build_grok_context(market, twitter_signals, rss_signals, _make_orderbook())
+
+        kept = [f"unique_tw_{i}" for i in range(6)] + [f"unique_rss_{i}" for i in range(4)]
+        positions = [ctx.index(k) for k in kept]
+        assert positions == sorted(positions)
+        assert "unique_rss_4" not in ctx and "unique_rss_5" not in ctx
+
     def test_output_contains_resolution_time(self):
         """#37 — Output string contains resolution time (hours_to_resolution)."""
         market = _make_market(hours_to_resolution=36.5)
@@ -426,6 +448,13 @@ class TestFormatSignalAge:
         result = _format_signal_age(sig)
         assert "h ago" in result
 
+    def test_uses_given_now(self):
+        from datetime import timedelta
+        sig = _make_signal()
+        now = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        sig.timestamp = now - timedelta(minutes=45)
+        assert _format_signal_age(sig, now) == "45min ago"
+
 
 # ---------------------------------------------------------------------------
 # build_prescreen_context
@@ -1,3 +1,5 @@
+import asyncio
+import json
 import pytest
 import pytest_asyncio
 from datetime import datetime, timedelta, timezone
@@ -42,6 +44,21 @@ class TestSchema:
         # Running again should not error
         await run_migrations(db)
 
+    async def test_init_applies_tuned_pragmas(self, tmp_path):
+        database = await Database.init(str(tmp_path / "pragma.db"))
+        try:
+            async def pragma(name):
+                cursor = await database._conn.execute(f"PRAGMA {name}")
+                return (await cursor.fetchone())[0]
+
+            assert await pragma("journal_mode") == "wal"
+            assert await pragma("foreign_keys") == 1
+            assert await pragma("synchronous") == 1  # NORMAL
+            assert await pragma("temp_store") == 2  # MEMORY
+            assert await pragma("busy_timeout") == 30000
+        finally:
+            await database.close()
+
 
 @pytest.mark.asyncio
 class TestTradeRecordCRUD:
@@ -55,6 +72,32 @@ class TestTradeRecordCRUD:
         assert loaded.grok_raw_probability == record.grok_raw_probability
         assert loaded.action == record.action
 
+    async def test_save_trades_batch(self, db, sample_trade_record):
+        records = [
+            sample_trade_record(action="SKIP", skip_reason="ranked_out", grok_signal_types=[{"type": "x"}])
+            for _ in range(3)
+        ]
+        await db.save_trades(records)
+        await db.save_trades([])
+        for r in records:
+            loaded = await db.get_trade(r.record_id)
+            assert loaded.skip_reason == "ranked_out"
+            assert loaded.grok_signal_types == [{"type": "x"}]
+
+    async def test_update_trades_bulk(self, db, sample_trade_record):
+        records = [sample_trade_record(action="BUY_YES") for _ in range(3)]
+        await db.save_trades(records)
+        for i, r in enumerate(records):
+            r.actual_outcome = True
+            r.pnl = float(i)
+            r.brier_score_adjusted = 0.1
+        await db.update_trades_bulk(records)
+        for i, r in enumerate(records):
+            loaded = await db.get_trade(r.record_id)
+            assert loaded.actual_outcome == 1
+            assert loaded.pnl == float(i)
+            assert loaded.brier_score_adjusted == 0.1
+
     async def test_get_open_trades_excludes_resolved(self, db, sample_trade_record):
         open_trade = sample_trade_record(action="BUY_YES")
         resolved_trade = sample_trade_record(action="BUY_YES", actual_outcome=True, pnl=50.0)
@@ -96,6 +139,16 @@ class TestTradeRecordCRUD:
         count = await db.count_today_trades()
         assert count == 2  # SKIPs excluded
 
+    async def test_today_range_excludes_yesterday(self, db, sample_trade_record):
+        now = datetime.now(timezone.utc)
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        await db.save_trade(sample_trade_record(record_id="today", timestamp=midnight))
+        await db.save_trade(sample_trade_record(
+            record_id="yesterday", timestamp=midnight - timedelta(microseconds=1),
+        ))
+        assert [t.record_id for t in await db.get_today_trades()] == ["today"]
+        assert await db.count_today_trades() == 1
+
     async def test_count_open_trades(self, db, sample_trade_record):
         await db.save_trade(sample_trade_record(action="BUY_YES"))
         await db.save_trade(sample_trade_record(action="BUY_YES", actual_outcome=True))
@@ -120,6 +173,71 @@ class TestTradeRecordCRUD:
         result = await db.get_open_market_ids()
         assert result == set()
 
+    async def test_get_week_trades_projected_fields(self, db, sample_trade_record):
+        await db.save_trade(sample_trade_record(action="BUY_YES", pnl=-12.5))
+        await db.save_trade(sample_trade_record(action="SKIP"))
+        rows = await db.get_week_trades(fields=("pnl", "action"))
+        assert sorted((r.action, r.pnl) for r in rows) == [("BUY_YES", -12.5), ("SKIP", None)]
+
+    async def test_get_week_trades_rejects_unknown_field(self, db):
+        with pytest.raises(ValueError):
+            await db.get_week_trades(fields=("pnl; DROP TABLE trade_records",))
+
+    async def test_count_resolved_trades(self, db, sample_trade_record):
+        await db.save_trade(sample_trade_record(action="BUY_YES", actual_outcome=True, pnl=5.0))
+        await db.save_trade(sample_trade_record(action="BUY_YES", actual_outcome=False, voided=True, void_reason="x"))
+        await db.save_trade(sample_trade_record(action="BUY_YES"))
+        assert await db.count_resolved_trades() == 1
+        assert await db.count_resolved_trades(include_voided=True) == 2
+
+    async def test_iter_resolved_trades_streams_in_chunks(self, db, sample_trade_record):
+        base = datetime.now(timezone.utc)
+        for i in range(5):
+            await db.save_trade(sample_trade_record(
+                record_id=f"r{i}", timestamp=base + timedelta(seconds=i),
+                actual_outcome=True, pnl=1.0,
+            ))
+        await db.save_trade(sample_trade_record(record_id="open"))
+        ids = [t.record_id async for t in db.iter_resolved_trades(chunk=2)]
+        assert ids == ["r0", "r1", "r2", "r3", "r4"]
+
+    async def test_get_resolved_stats(self, db, sample_trade_record):
+        await db.save_trade(sample_trade_record(
+            action="BUY_YES", market_type="political", actual_outcome=True, pnl=40.0,
+            brier_score_raw=0.1, brier_score_adjusted=0.2,
+            trade_profitable=1, pnl_brier_raw=0.3, pnl_brier_adjusted=0.4,
+        ))
+        await db.save_trade(sample_trade_record(
+            action="BUY_NO", market_type="crypto", actual_outcome=True, pnl=-10.0,
+            brier_score_raw=0.5, brier_score_adjusted=0.6,
+            trade_profitable=0, pnl_brier_raw=0.7, pnl_brier_adjusted=0.8,
+        ))
+        await db.save_trade(sample_trade_record(action="BUY_YES"))
+        await db.save_trade(sample_trade_record(action="SKIP", skip_reason="low_edge"))
+
+        stats = await db.get_resolved_stats()
+        assert stats["trade_count"] == 3
+        assert stats["skip_count"] == 1
+        assert stats["resolved_count"] == 2
+        assert stats["wins"] == 1
+        assert stats["total_pnl"] == pytest.approx(30.0)
+        assert stats["avg_brier_raw"] == pytest.approx(0.3)
+        assert stats["avg_brier_adjusted"] == pytest.approx(0.4)
+        assert stats["pnl_labeled_count"] == 2
+        assert stats["pnl_wins"] == 1
+        assert stats["avg_pnl_brier_raw"] == pytest.approx(0.5)
+
+        by_type = await db.get_resolved_stats_by_market_type()
+        assert by_type["political"] == {"trades": 1, "pnl": 40.0, "brier_sum": 0.1, "wins": 1}
+        assert by_type["crypto"]["wins"] == 0
+
+    async def test_get_resolved_stats_empty(self, db):
+        stats = await db.get_resolved_stats()
+        assert stats["resolved_count"] == 0
+        assert stats["total_pnl"] == 0.0
+        assert stats["avg_brier_raw"] is None
+        assert await db.get_resolved_stats_by_market_type() == {}
+
 
 @pytest.mark.asyncio
 class TestCalibrationPersistence:
@@ -142,13 +260,29 @@ class TestMarketTypePersistence:
         mgr = MarketTypeManager()
         mgr._ensure("political")
         mgr.performances["political"].total_trades = 10
-        mgr.performances["political"].brier_scores = [0.1, 0.2, 0.3]
+        mgr.performances["political"].reset_brier([0.1, 0.2, 0.3])
         await mgr.save(db)
         mgr2 = MarketTypeManager()
         await mgr2.load(db)
         assert "political" in mgr2.performances
         assert mgr2.performances["political"].total_trades == 10
         assert mgr2.performances["political"].brier_scores == [0.1, 0.2, 0.3]
+        assert mgr2.performances["political"].avg_brier == pytest.approx(
+            mgr.performances["political"].avg_brier
+        )
+
+    async def test_load_legacy_row_rebuilds_running_sums(self, db):
+        """Rows saved before the running sums existed are rebuilt from the stored list."""
+        await db._conn.execute(
+            "INSERT INTO market_type_performance (market_type, total_trades, total_pnl, brier_scores, "
+            "total_observed, counterfactual_pnl, updated_at) VALUES (?, 0, 0, ?, 0, 0, '')",
+            ("political", json.dumps([0.2] * 20)),
+        )
+        await db._conn.commit()
+        perfs = await db.load_market_type_performance()
+        perf = perfs["political"]
+        assert len(perf.brier_scores) == 15
+        assert perf.avg_brier == pytest.approx(0.2)
 
 
 @pytest.mark.asyncio
@@ -163,6 +297,7 @@ class TestSignalTrackerPersistence:
         await mgr2.load(db)
         assert ("S2", "I2", "political") in mgr2.trackers
         assert mgr2.trackers[("S2", "I2", "political")].present_in_winning_trades == 8
+        assert mgr2.get_all_observed_combos("political") == {("S2", "I2")}
 
 
 @pytest.mark.asyncio
@@ -278,6 +413,62 @@ class TestSaveTradeWithPortfolio:
         assert m["delta"] == pytest.approx(-200.0)
 
 
+@pytest.mark.asyncio
+class TestTransaction:
+    async def test_commits_grouped_writes(self, db, sample_trade_record):
+        record = sample_trade_record(record_id="txn-commit")
+        async with db.transaction():
+            await db.save_trade(record, commit=False)
+            await db.save_portfolio(Portfolio(cash_balance=4321.0), commit=False)
+            assert db._conn.in_transaction
+        assert not db._conn.in_transaction
+        assert await db.get_trade("txn-commit") is not None
+        assert (await db.load_portfolio()).cash_balance == 4321.0
+
+    async def test_rolls_back_on_exception(self, db, sample_trade_record):
+        record = sample_trade_record(record_id="txn-rollback")
+        with pytest.raises(RuntimeError):
+            async with db.transaction():
+                await db.save_trade(record, commit=False)
+                raise RuntimeError("boom")
+        assert not db._conn.in_transaction
+        assert await db.get_trade("txn-rollback") is None
+
+    async def test_nested_joins_outer(self, db):
+        async with db.transaction():
+            await db.save_portfolio(Portfolio(cash_balance=1.0), commit=False)
+            async with db.transaction():
+                await db.save_portfolio(Portfolio(cash_balance=2.0), commit=False)
+            assert db._conn.in_transaction
+        assert (await db.load_portfolio()).cash_balance == 2.0
+
+    async def test_autocommit_write_waits_for_other_tasks_transaction(self, db, sample_trade_record):
+        """A commit=True write from another task must not commit an open transaction."""
+        record = sample_trade_record(record_id="txn-other-task")
+        opened = asyncio.Event()
+        release = asyncio.Event()
+
+        async def owner():
+            async with db.transaction():
+                await db.save_trade(record, commit=False)
+                opened.set()
+                await release.wait()
+                raise RuntimeError("abort")
+
+        owner_task = asyncio.create_task(owner())
+        await opened.wait()
+        writer = asyncio.create_task(db.save_portfolio(Portfolio(cash_balance=7.0)))
+        await asyncio.sleep(0.05)
+        assert not writer.done()
+
+        release.set()
+        with pytest.raises(RuntimeError):
+            await owner_task
+        await writer
+        assert await db.get_trade("txn-other-task") is None
+        assert (await db.load_portfolio()).cash_balance == 7.0
+
+
 @pytest.mark.asyncio
 class TestAPICosts:
     async def test_increment_new(self, db):
@@ -290,7 +481,69 @@ class TestAPICosts:
         await db.increment_api_cost("minimax", tokens_in=1000)
         spend = await db.get_today_api_spend()
         # Should have accumulated two calls
-        assert spend > 0
+        assert spend == pytest.approx(0.002)
+
+    async def test_pricing_per_service(self, db):
+        await db.increment_api_cost("twitter")
+        await db.increment_api_cost("mimo", tokens_in=5000, tokens_out=5000)
+        assert await db.get_today_api_spend() == pytest.approx(0.0075)
+
+    async def test_writes_are_buffered_until_flush(self, db):
+        await db.increment_api_cost("twitter")
+        await db.increment_api_cost("twitter")
+        await db.record_parse_failure("m-1")
+        cursor = await db._conn.execute("SELECT COUNT(*) FROM api_costs")
+        assert (await cursor.fetchone())[0] == 0
+
+        await db.flush_buffers()
+        cursor = await db._conn.execute("SELECT calls, cost_usd FROM api_costs")
+        calls, cost = await cursor.fetchone()
+        assert calls == 2
+        assert cost == pytest.approx(0.015)
+        cursor = await db._conn.execute("SELECT market_id FROM parse_failures")
+        assert [r[0] for r in await cursor.fetchall()] == ["m-1"]
+
+    async def test_buffer_flushes_after_delay(self, db, monkeypatch):
+        import asyncio
+        import src.db.sqlite as sqlite_mod
+        monkeypatch.setattr(sqlite_mod, "BUFFER_FLUSH_SECONDS", 0.01)
+        await db.record_parse_failure("m-2")
+        await asyncio.sleep(0.05)
+        cursor = await db._conn.execute("SELECT COUNT(*) FROM parse_failures")
+        assert (await cursor.fetchone())[0] == 1
+
+    async def test_close_flushes_buffer(self, tmp_path):
+        path = str(tmp_path / "buffered.db")
+        database = await Database.init(path)
+        await run_migrations(database)
+        await database.record_parse_failure("m-3")
+        await database.close()
+
+        reopened = await Database.init(path)
+        try:
+            cursor = await reopened._conn.execute("SELECT market_id FROM parse_failures")
+            assert [r[0] for r in await cursor.fetchall()] == ["m-3"]
+        finally:
+            await reopened.close()
+
+    async def test_close_waits_for_inflight_timer_flush(self, tmp_path, monkeypatch):
+        import src.db.sqlite as sqlite_mod
+        monkeypatch.setattr(sqlite_mod, "BUFFER_FLUSH_SECONDS", 0)
+        path = str(tmp_path / "inflight.db")
+        database = await Database.init(path)
+        await run_migrations(database)
+        for _ in range(5):
+            await database.increment_api_cost("twitter")
+        while not database._inflight_flushes:
+            await asyncio.sleep(0)
+        await database.close()
+
+        reopened = await Database.init(path)
+        try:
+            cursor = await reopened._conn.execute("SELECT calls FROM api_costs")
+            assert [r[0] for r in await cursor.fetchall()] == [5]
+        finally:
+            await reopened.close()
 
 
 @pytest.mark.asyncio
@@ -299,3 +299,43 @@ class TestCheckEarlyExits:
         await check_early_exits(mock_db, mock_poly, settings)
 
         mock_db.update_trade.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_does_not_block_other_exits(self):
+        """Markets are fetched up front; one failed fetch only skips its own trade."""
+        broken = _make_trade(action="BUY_YES", entry_price=0.50, size=100)
+        broken.record_id, broken.market_id = "test-002", "market-002"
+        trade = _make_trade(action="BUY_YES", entry_price=0.50, size=100)
+        exited = _make_trade(action="BUY_YES", entry_price=0.50, size=100)
+        exited.record_id, exited.market_id, exited.exit_type = "test-003", "market-003", "stop_loss"
+
+        mock_market = MagicMock()
+        mock_market.resolved = False
+        mock_market.yes_price = 0.65
+
+        async def _get_market(market_id):
+            if market_id == "market-002":
+                raise RuntimeError("boom")
+            return mock_market
+
+        mock_db = AsyncMock()
+        mock_db.get_open_trades = AsyncMock(return_value=[broken, trade, exited])
+        mock_db.load_portfolio = AsyncMock(return_value=MagicMock(
+            total_pnl=0, cash_balance=9900, open_positions=[], total_equity=10000,
+            peak_equity=10000, max_drawdown=0))
+        mock_db.update_trade = AsyncMock()
+        mock_db.save_portfolio = AsyncMock()
+
+        mock_poly = AsyncMock()
+        mock_poly.get_market = AsyncMock(side_effect=_get_market)
+
+        settings = MagicMock()
+        settings.EARLY_EXIT_ENABLED = True
+        settings.TAKE_PROFIT_ROI = 0.20
+        settings.STOP_LOSS_ROI = -0.15
+
+        await check_early_exits(mock_db, mock_poly, settings)
+
+        assert sorted(c.args[0] for c in mock_poly.get_market.await_args_list) == ["market-001", "market-002"]
+        mock_db.update_trade.assert_called_once()
+        assert mock_db.update_trade.call_args[0][0].record_id == "test-001"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -16,6 +17,8 @@ from src.engine.grok_client import (
     _validate_llm_response,
     REQUIRED_FIELDS,
     MAX_RETRIES,
+    BASE_BACKOFF,
+    MAX_BACKOFF,
     SYSTEM_PROMPT,
     PRESCREEN_SYSTEM_PROMPT,
 )
@@ -54,6 +57,7 @@ def _mock_settings():
     s.MINIMAX_API_KEY = ""
     s.LLM_MODEL = "mimo-v2.5-pro"
     s.LLM_BASE_URL = "https://api.xiaomimimo.com/v1"
+    s.LLM_MAX_CONCURRENCY = 8
     s.PRESCREEN_MAX_TOKENS = 500
     s.PRESCREEN_ANCHORING_MODE = "independent"
     return s
@@ -130,12 +134,17 @@ class TestParseJsonSafe:
 
     def test_json_with_trailing_comma(self):
         """#10 — Trailing comma (common LLM error) -> attempt parse, may return None."""
-        # Standard json.loads rejects trailing commas; verify graceful handling
+        # Strict JSON parsers reject trailing commas; verify graceful handling
         raw = '{"estimated_probability": 0.5, "confidence": 0.7, "reasoning": "test", "signal_info_types": [],}'
         result = parse_json_safe(raw)
-        # Python stdlib json rejects trailing commas, so expect None
+        # orjson rejects trailing commas, so expect None
         assert result is None
 
+    def test_think_block_then_fenced_json(self):
+        """Braces inside <think> are ignored; fenced JSON after it is parsed."""
+        raw = '<think>maybe {"estimated_probability": 0.1}</think>\n```json\n{"estimated_probability": 0.4}\n```'
+        assert parse_json_safe(raw) == {"estimated_probability": 0.4}
+
 
 # ---------------------------------------------------------------------------
 # _validate_llm_response  --  field validation
@@ -155,6 +164,14 @@ class TestValidateGrokResponse:
         result = _validate_llm_response(data)
         assert result is None
 
+    def test_non_object_json_returns_none(self):
+        assert _validate_llm_response([0.5, 0.7]) is None
+
+    def test_integer_probability_coerced_to_float(self):
+        result = _validate_llm_response(_valid_grok_dict(estimated_probability=1, confidence=0))
+        assert type(result["estimated_probability"]) is float
+        assert type(result["confidence"]) is float
+
     def test_probability_as_string_coerced_to_float(self):
         data = _valid_grok_dict(estimated_probability="0.75", confidence="0.80")
         result = _validate_llm_response(data)
@@ -476,7 +493,7 @@ class TestCallGrokWithRetry:
 
     @pytest.mark.asyncio
     async def test_linear_backoff_sleep_durations(self):
-        """#24 — Linear backoff: asyncio.sleep called with 1.0 then 2.0 seconds."""
+        """#24 — Parse failures keep linear backoff: sleep 1.0 then 2.0 seconds."""
         db = _mock_db()
         settings = _mock_settings()
         grok = GrokClient(settings, db)
@@ -508,6 +525,76 @@ class TestCallGrokWithRetry:
         assert calls == [1.0, 2.0]
 
 
+    @staticmethod
+    def _http_error_client(status: int, headers: dict | None = None) -> AsyncMock:
+        resp = httpx.Response(status, headers=headers, request=httpx.Request("POST", "https://x"))
+        client = AsyncMock()
+        client.post = AsyncMock(return_value=resp)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_auth_error_fails_fast(self):
+        """401 is not retried: one POST, no sleep, failure still recorded."""
+        db = _mock_db()
+        grok = GrokClient(_mock_settings(), db)
+        mock_client = self._http_error_client(401)
+
+        with patch("src.engine.grok_client.httpx.AsyncClient", return_value=mock_client), \
+             patch("src.engine.grok_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await grok.call_grok_with_retry("ctx", "market-401")
+
+        assert result is None
+        assert mock_client.post.await_count == 1
+        mock_sleep.assert_not_awaited()
+        db.record_parse_failure.assert_awaited_once_with("market-401")
+
+    @pytest.mark.asyncio
+    async def test_server_error_uses_jittered_exponential_backoff(self):
+        """5xx retries sleep U(0, BASE_BACKOFF * 2^attempt)."""
+        grok = GrokClient(_mock_settings(), _mock_db())
+        mock_client = self._http_error_client(503)
+
+        with patch("src.engine.grok_client.httpx.AsyncClient", return_value=mock_client), \
+             patch("src.engine.grok_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await grok.call_grok_with_retry("ctx", "market-503")
+
+        assert mock_client.post.await_count == MAX_RETRIES + 1
+        delays = [c.args[0] for c in mock_sleep.await_args_list]
+        assert len(delays) == MAX_RETRIES
+        for attempt, d in enumerate(delays):
+            assert 0.0 <= d <= min(MAX_BACKOFF, BASE_BACKOFF * 2 ** attempt)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_honours_retry_after(self):
+        grok = GrokClient(_mock_settings(), _mock_db())
+        mock_client = self._http_error_client(429, headers={"Retry-After": "3"})
+
+        with patch("src.engine.grok_client.httpx.AsyncClient", return_value=mock_client), \
+             patch("src.engine.grok_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await grok.call_grok_with_retry("ctx", "market-429")
+
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [3.0, 3.0]
+
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_network_and_retries(self):
+        """Once the provider breaker trips, calls return None without POSTing."""
+        db = _mock_db()
+        grok = GrokClient(_mock_settings(), db)
+        mock_client = self._http_error_client(503)
+
+        with patch("src.engine.grok_client.httpx.AsyncClient", return_value=mock_client), \
+             patch("src.engine.grok_client.asyncio.sleep", new_callable=AsyncMock):
+            for i in range(2):
+                await grok.call_grok_with_retry("ctx", f"market-{i}")
+            posts = mock_client.post.await_count
+            result = await grok.call_grok_with_retry("ctx", "market-open")
+
+        assert posts == grok._breaker.failure_threshold
+        assert result is None
+        assert mock_client.post.await_count == posts
+
+
 # ---------------------------------------------------------------------------
 # System prompt
 # ---------------------------------------------------------------------------
@@ -547,6 +634,59 @@ class TestSystemPrompt:
         assert messages[1]["content"] == "test prompt"
 
 
+    @pytest.mark.asyncio
+    async def test_complete_reuses_one_http_client(self):
+        """Consecutive calls share one pooled AsyncClient; aclose releases it."""
+        db = _mock_db()
+        grok = LLMClient(_mock_settings(), db)
+
+        mock_http_resp = MagicMock(spec=httpx.Response)
+        mock_http_resp.json.return_value = _make_xai_response(json.dumps(_valid_grok_dict()))
+        mock_http_resp.raise_for_status = MagicMock()
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=mock_http_resp)
+
+        with patch("src.engine.grok_client.httpx.AsyncClient", return_value=mock_client) as ctor:
+            await grok.complete("one")
+            await grok.complete("two")
+            await grok.aclose()
+
+        ctor.assert_called_once()
+        assert ctor.call_args.kwargs["headers"]["Authorization"] == "Bearer test-mimo-key"
+        assert mock_client.post.await_count == 2
+        mock_client.aclose.assert_awaited_once()
+
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_bounded_by_bulkhead(self):
+        """No more than LLM_MAX_CONCURRENCY requests are in flight at once."""
+        settings = _mock_settings()
+        settings.LLM_MAX_CONCURRENCY = 2
+        grok = LLMClient(settings, _mock_db())
+
+        in_flight = peak = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            resp = MagicMock(spec=httpx.Response)
+            resp.json.return_value = _make_xai_response("{}")
+            resp.raise_for_status = MagicMock()
+            return resp
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(side_effect=slow_post)
+
+        with patch("src.engine.grok_client.httpx.AsyncClient", return_value=mock_client):
+            await asyncio.gather(*(grok.complete(f"p{i}") for i in range(6)))
+
+        assert mock_client.post.await_count == 6
+        assert peak == 2
+
+
 # ---------------------------------------------------------------------------
 # call_prescreen
 # ---------------------------------------------------------------------------
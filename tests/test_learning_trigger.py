@@ -113,7 +113,7 @@ class TestAutoResolveReturnsNewlyResolved:
 
 
 class TestSchedulerAutoResolveCallsLearning:
-    """_auto_resolve() must call on_trade_resolved() for each resolved trade."""
+    """_auto_resolve() must call on_trades_resolved() once with the resolved batch."""
 
     @pytest.mark.asyncio
     async def test_on_trade_resolved_called_for_resolved_trade(self):
@@ -135,11 +135,11 @@ class TestSchedulerAutoResolveCallsLearning:
 
         with patch("src.scheduler.check_early_exits", new=AsyncMock()):
             with patch("src.scheduler.auto_resolve_trades", new=AsyncMock(return_value=[trade])) as mock_resolve:
-                with patch("src.scheduler.on_trade_resolved", new=AsyncMock()) as mock_learn:
+                with patch("src.scheduler.on_trades_resolved", new=AsyncMock()) as mock_learn:
                     await scheduler._auto_resolve()
 
         mock_learn.assert_awaited_once_with(
-            record=trade,
+            records=[trade],
             calibration_mgr=scheduler._calibration_mgr,
             market_type_mgr=scheduler._market_type_mgr,
             signal_tracker_mgr=scheduler._signal_tracker_mgr,
@@ -163,7 +163,7 @@ class TestSchedulerAutoResolveCallsLearning:
 
         with patch("src.scheduler.check_early_exits", new=AsyncMock()):
             with patch("src.scheduler.auto_resolve_trades", new=AsyncMock(return_value=[])):
-                with patch("src.scheduler.on_trade_resolved", new=AsyncMock()) as mock_learn:
+                with patch("src.scheduler.on_trades_resolved", new=AsyncMock()) as mock_learn:
                     await scheduler._auto_resolve()
 
         mock_learn.assert_not_awaited()
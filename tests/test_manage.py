@@ -104,3 +104,32 @@ class TestMainRecalculateLearning:
             main()
         recalc_fn.assert_awaited_once_with(db, cal, mt, st)
         db.close.assert_awaited_once()
+        # Recalculation rebuilds from trades, so stored learning isn't loaded first
+        init.assert_awaited_once_with(load_learning=False)
+
+
+class TestInitDeps:
+    @pytest.mark.asyncio
+    async def test_loads_learning_state_from_shared_db(self, tmp_path):
+        """_init_deps loads all three managers from the Database it opened."""
+        from src.manage import _init_deps
+
+        settings = MagicMock(DB_PATH=str(tmp_path / "manage.db"))
+        with patch("src.config.get_settings", return_value=settings):
+            db, cal, mt, st = await _init_deps()
+            try:
+                mt._ensure("political").total_trades = 7
+                st._ensure("S2", "I2", "political")
+                await mt.save(db)
+                await st.save(db)
+
+                db2, cal2, mt2, st2 = await _init_deps()
+                await db2.close()
+                assert mt2.performances["political"].total_trades == 7
+                assert ("S2", "I2", "political") in st2.trackers
+
+                db3, _, mt3, st3 = await _init_deps(load_learning=False)
+                await db3.close()
+                assert mt3.performances == {} and st3.trackers == {}
+            finally:
+                await db.close()
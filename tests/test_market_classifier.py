@@ -6,7 +6,7 @@ cases, case insensitivity, and real backtest miss cases.
 from __future__ import annotations
 
 import pytest
-from src.pipelines.market_classifier import classify_market_type, MARKET_TYPE_KEYWORDS, get_min_edge
+from src.pipelines.market_classifier import classify_market_type, classify_lowered_question, MARKET_TYPE_KEYWORDS, get_min_edge, _KEYWORD_TABLE
 
 
 # ---------------------------------------------------------------------------
@@ -172,6 +172,13 @@ def test_iteration_order() -> None:
     assert keys.index("crypto_15m") < keys.index("political"), "crypto_15m must come before political"
 
 
+def test_keyword_table_follows_type_order() -> None:
+    """The flattened lookup table lists every keyword, grouped in MARKET_TYPE_KEYWORDS order."""
+    assert list(_KEYWORD_TABLE) == [
+        (kw, mtype) for mtype, kws in MARKET_TYPE_KEYWORDS.items() for kw in kws
+    ]
+
+
 # ---------------------------------------------------------------------------
 # get_min_edge
 # ---------------------------------------------------------------------------
@@ -226,3 +233,8 @@ def test_rain_market_still_weather() -> None:
 def test_ukraine_still_geopolitical() -> None:
     """Regression: ukraine-substring protection still works (geopolitical before weather AND sports)."""
     assert classify_market_type("Will Ukraine ceasefire by June 1?") == "geopolitical"
+
+
+def test_classify_lowered_question_matches_classify_market_type() -> None:
+    for question in ("BITCOIN above $100k?", "Will it rain in London on Friday?", "Who wins?"):
+        assert classify_lowered_question(question.lower()) == classify_market_type(question)
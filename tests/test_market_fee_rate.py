@@ -1,6 +1,7 @@
 """Tests for market fee_rate from config and per-type fee schedule."""
 from __future__ import annotations
 
+import json
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -42,7 +43,7 @@ class TestMarketFeeRate:
 
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = [_make_gamma_market()]
+        mock_resp.content = json.dumps([_make_gamma_market()]).encode()
         mock_resp.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_cls:
@@ -72,10 +73,10 @@ class TestMarketFeeRate:
         # Use a crypto market for tier 2
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = [_make_gamma_market(
+        mock_resp.content = json.dumps([_make_gamma_market(
             question="Will Bitcoin hit $100k?",
             endDate=(datetime.now(timezone.utc) + timedelta(days=2)).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        )]
+        )]).encode()
         mock_resp.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_cls:
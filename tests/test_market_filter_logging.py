@@ -1,6 +1,7 @@
 """Tests for market filter logging."""
 from __future__ import annotations
 
+import json
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -51,7 +52,7 @@ class TestMarketFilterLogging:
 
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = markets_data
+        mock_resp.content = json.dumps(markets_data).encode()
         mock_resp.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_cls:
@@ -3,6 +3,7 @@
 import pytest
 
 from src.learning.market_type import MarketTypeManager
+from src.models import MarketTypePerformance
 
 
 # ---------------------------------------------------------------------------
@@ -123,13 +124,36 @@ class TestDampenOnSwap:
             mgr.update_market_type(record)
 
         perf = mgr.performances["political"]
-        assert len(perf.brier_scores) == 30
+        # Only the recent window is stored; older scores live on in the running mean.
+        assert len(perf.brier_scores) == 15
+        avg_before = perf.avg_brier
 
         mgr.dampen_on_swap()
 
         assert len(perf.brier_scores) == 15
         # Should keep the LAST 15: values 15.0 through 29.0
         assert perf.brier_scores == [float(i) for i in range(15, 30)]
+        # ...and the weighted mean forgets the dropped 0.0-14.0 scores
+        assert perf.avg_brier > avg_before
+        assert perf.avg_brier == pytest.approx(
+            MarketTypePerformance(market_type="x", brier_scores=[float(i) for i in range(15, 30)]).avg_brier
+        )
+
+    def test_running_avg_matches_full_history(self, sample_trade_record):
+        """The running weighted mean equals the one over every score, not just the stored window."""
+        mgr = MarketTypeManager()
+        scores = [((i * 7) % 11) / 20.0 for i in range(40)]
+        for i, b in enumerate(scores):
+            mgr.update_market_type(sample_trade_record(
+                record_id=f"rec-{i}", market_type="political", action="BUY_YES",
+                actual_outcome=True, brier_score_adjusted=b, voided=False,
+            ))
+
+        weights = [0.95 ** i for i in range(len(scores))]
+        expected = sum(b * w for b, w in zip(reversed(scores), weights)) / sum(weights)
+        perf = mgr.performances["political"]
+        assert len(perf.brier_scores) == 15
+        assert perf.avg_brier == pytest.approx(expected)
 
 
 # ---------------------------------------------------------------------------
@@ -20,10 +20,10 @@ async def _apply_migrations_up_to(conn: aiosqlite.Connection, max_version: int)
     """Apply all migrations up to and including max_version."""
     conn.row_factory = aiosqlite.Row
     await conn.execute("PRAGMA foreign_keys = ON")
-    for version in sorted(MIGRATIONS.keys()):
+    for version, statements in MIGRATIONS:
         if version > max_version:
             break
-        for stmt in MIGRATIONS[version]:
+        for stmt in statements:
             await conn.execute(stmt)
         await conn.execute(
             "INSERT OR IGNORE INTO schema_version (version) VALUES (?)", (version,)
@@ -36,9 +36,16 @@ async def _apply_migrations_up_to(conn: aiosqlite.Connection, max_version: int)
 # ---------------------------------------------------------------------------
 
 
-def test_schema_version_is_9():
-    """SCHEMA_VERSION must be 9 after drift_history migration."""
-    assert SCHEMA_VERSION == 9
+def test_schema_version_is_12():
+    """SCHEMA_VERSION must be 12 after the running Brier sums migration."""
+    assert SCHEMA_VERSION == 12
+
+
+def test_migrations_are_strictly_ordered():
+    """MIGRATIONS is applied in tuple order, so versions must ascend to SCHEMA_VERSION."""
+    versions = [v for v, _ in MIGRATIONS]
+    assert versions == sorted(set(versions))
+    assert versions[-1] == SCHEMA_VERSION
 
 
 # ---------------------------------------------------------------------------
@@ -87,7 +94,7 @@ async def test_v7_backfill_sets_trade_profitable():
         await conn.commit()
 
         # Now apply v7 migration (columns + backfill)
-        for stmt in MIGRATIONS[7]:
+        for stmt in dict(MIGRATIONS)[7]:
             await conn.execute(stmt)
         await conn.commit()
 
@@ -132,7 +139,7 @@ async def test_v7_backfill_ignores_skip_records():
         )
         await conn.commit()
 
-        for stmt in MIGRATIONS[7]:
+        for stmt in dict(MIGRATIONS)[7]:
             await conn.execute(stmt)
         await conn.commit()
 
@@ -253,3 +260,118 @@ async def test_migration_v9_creates_drift_history_table():
         idx_rows = await cursor.fetchall()
         idx_names = {r[0] for r in idx_rows}
         assert "idx_drift_history_ts" in idx_names
+
+
+@pytest.mark.asyncio
+async def test_failed_migration_batch_rolls_back(monkeypatch):
+    """A failing statement aborts the whole pending batch, not just its version."""
+    db = await Database.init(":memory:")
+    try:
+        patched = MIGRATIONS + (
+            (SCHEMA_VERSION + 1, ("CREATE TABLE probe_ok (id INTEGER)",)),
+            (SCHEMA_VERSION + 2, ("THIS IS NOT SQL",)),
+        )
+        monkeypatch.setattr("src.db.migrations.MIGRATIONS", patched)
+
+        with pytest.raises(Exception):
+            await run_migrations(db)
+
+        cursor = await db._conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name='schema_version'")
+        assert (await cursor.fetchone())[0] == 0
+        cursor = await db._conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name='probe_ok'")
+        assert (await cursor.fetchone())[0] == 0
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_migration_v10_replaces_single_column_indexes():
+    """Migration 10 adds compound trade indexes and drops the ones they supersede."""
+    async with aiosqlite.connect(":memory:") as conn:
+        await _apply_migrations_up_to(conn, 10)
+
+        cursor = await conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='trade_records'"
+        )
+        idx_names = {r[0] for r in await cursor.fetchall()}
+        assert "idx_trades_run_ts" in idx_names
+        assert "idx_trades_unresolved_mtype" in idx_names
+        assert "idx_trades_experiment" not in idx_names
+        assert "idx_trades_unresolved" not in idx_names
+
+
+@pytest.mark.asyncio
+async def test_migration_v11_open_trades_index_covers_count():
+    """Migration 11 adds a covering partial index used by the open-trade count."""
+    async with aiosqlite.connect(":memory:") as conn:
+        await _apply_migrations_up_to(conn, 11)
+
+        cursor = await conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM trade_records "
+            "WHERE actual_outcome IS NULL AND voided = FALSE AND action != 'SKIP' AND exit_type IS NULL"
+        )
+        plan = " ".join(str(r[-1]) for r in await cursor.fetchall())
+        assert "idx_trades_open" in plan
+
+
+@pytest.mark.asyncio
+async def test_warm_start_skips_version_query(tmp_path, monkeypatch):
+    """Once user_version is current, run_migrations never queries schema_version."""
+    db_path = str(tmp_path / "warm.db")
+    db = await Database.init(db_path)
+    try:
+        await run_migrations(db)
+        cursor = await db._conn.execute("PRAGMA user_version")
+        assert (await cursor.fetchone())[0] == SCHEMA_VERSION
+
+        async def _boom(conn):
+            raise AssertionError("schema_version should not be queried on warm start")
+
+        monkeypatch.setattr("src.db.migrations.get_current_version", _boom)
+        await run_migrations(db)
+    finally:
+        await db.close()
+    assert not (tmp_path / "warm.db.ver").exists()
+
+
+@pytest.mark.asyncio
+async def test_db_restored_over_live_file_is_migrated(tmp_path):
+    """An older DB copied over the live file carries its own user_version."""
+    live_path = tmp_path / "live.db"
+    db = await Database.init(str(live_path))
+    await run_migrations(db)
+    await db.close()
+
+    old_path = tmp_path / "old.db"
+    async with aiosqlite.connect(str(old_path)) as conn:
+        await _apply_migrations_up_to(conn, 5)
+
+    for suffix in ("-wal", "-shm"):
+        (tmp_path / f"live.db{suffix}").unlink(missing_ok=True)
+    live_path.write_bytes(old_path.read_bytes())
+
+    db = await Database.init(str(live_path))
+    try:
+        await run_migrations(db)
+        cursor = await db._conn.execute("SELECT MAX(version) FROM schema_version")
+        assert (await cursor.fetchone())[0] == SCHEMA_VERSION
+        cursor = await db._conn.execute("PRAGMA user_version")
+        assert (await cursor.fetchone())[0] == SCHEMA_VERSION
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_current_db_without_user_version_is_stamped():
+    """A DB migrated before user_version was stamped is checked once, then stamped."""
+    db = await Database.init(":memory:")
+    try:
+        await run_migrations(db)
+        await db._conn.execute("PRAGMA user_version = 0")
+        await run_migrations(db)
+        cursor = await db._conn.execute("PRAGMA user_version")
+        assert (await cursor.fetchone())[0] == SCHEMA_VERSION
+        cursor = await db._conn.execute("SELECT COUNT(*) FROM schema_version")
+        assert (await cursor.fetchone())[0] == len(MIGRATIONS)
+    finally:
+        await db.close()
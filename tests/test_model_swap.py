@@ -128,7 +128,8 @@ class TestHandleModelSwap:
             mkt.update_market_type(record)
             await db.save_trade(record)
 
-        assert len(mkt.performances["political"].brier_scores) == 25
+        # Stored window is capped at 15 even before the swap
+        assert len(mkt.performances["political"].brier_scores) == 15
 
         db.save_model_swap = AsyncMock()
 
@@ -209,6 +210,59 @@ class TestVoidTrade:
         assert updated is not None
         assert updated.voided is True
 
+    @pytest.mark.asyncio
+    async def test_void_trade_matches_full_replay(self, db, sample_trade_record):
+        """After a void every layer equals a rebuild from the remaining trades."""
+        cal = CalibrationManager()
+        mkt = MarketTypeManager()
+        sig = SignalTrackerManager()
+        await _seed_learning(db, sample_trade_record, cal, mkt, sig)
+        for i, brier in enumerate((0.09, 0.30, 0.12)):
+            other = sample_trade_record(
+                record_id=f"other-{i}",
+                market_type="political",
+                grok_raw_probability=0.80,
+                grok_raw_confidence=0.75,
+                final_adjusted_probability=0.78,
+                grok_signal_types=[{"source_tier": "S3", "info_type": "I2"}],
+                action="BUY_YES",
+                actual_outcome=i != 1,
+                brier_score_adjusted=brier,
+            )
+            await db.save_trade(other)
+            cal.update_calibration(other)
+            mkt.update_market_type(other)
+            sig.update_signal_trackers(other)
+
+        await void_trade("seed-001", "test void", db, cal, mkt, sig)
+
+        ref_cal, ref_mkt, ref_sig = CalibrationManager(), MarketTypeManager(), SignalTrackerManager()
+        await recalculate_learning_from_scratch(db, ref_cal, ref_mkt, ref_sig)
+        assert [v for b in cal.buckets for v in (b.alpha, b.beta)] == pytest.approx(
+            [v for b in ref_cal.buckets for v in (b.alpha, b.beta)]
+        )
+        perf, ref_perf = mkt.performances["political"], ref_mkt.performances["political"]
+        assert perf.total_trades == ref_perf.total_trades == 3
+        assert perf.brier_scores == ref_perf.brier_scores
+        assert perf.avg_brier == pytest.approx(ref_perf.avg_brier)
+        assert sig.trackers == ref_sig.trackers
+        assert ("S2", "I2", "political") not in sig.trackers
+
+    @pytest.mark.asyncio
+    async def test_void_trade_twice_is_noop(self, db, sample_trade_record):
+        """A second void of the same trade neither rewrites it nor replays learning."""
+        cal = CalibrationManager()
+        mkt = MarketTypeManager()
+        sig = SignalTrackerManager()
+        await _seed_learning(db, sample_trade_record, cal, mkt, sig)
+
+        await void_trade("seed-001", "first", db, cal, mkt, sig)
+        with patch("src.learning.model_swap.recalculate_learning_from_scratch") as recalc:
+            await void_trade("seed-001", "second", db, cal, mkt, sig)
+        recalc.assert_not_called()
+
+        assert (await db.get_trade("seed-001")).void_reason == "first"
+
     @pytest.mark.asyncio
     async def test_on_trade_resolved_skips_voided(self, db, sample_trade_record):
         """Test 31: on_trade_resolved skips voided trades entirely."""
@@ -321,6 +375,33 @@ class TestHandleModelSwapDBInteractions:
         assert event.reason == "upgrade available"
         assert event.experiment_run_started.startswith("exp_grok-3-v2_")
 
+    @pytest.mark.asyncio
+    async def test_model_swap_is_atomic(self, db):
+        """A failure partway through the swap leaves no experiment or swap row behind."""
+        cal = CalibrationManager()
+        mkt = MarketTypeManager()
+
+        async def _counts():
+            out = []
+            for table in ("experiment_runs", "model_swaps"):
+                cursor = await db._conn.execute(f"SELECT COUNT(*) FROM {table}")
+                out.append((await cursor.fetchone())[0])
+            return out
+
+        before = await _counts()
+        with patch.object(mkt, "save", new_callable=AsyncMock, side_effect=RuntimeError("disk full")):
+            with pytest.raises(RuntimeError):
+                await handle_model_swap(
+                    old_model="grok-3-fast",
+                    new_model="grok-3-v2",
+                    reason="test swap",
+                    calibration_mgr=cal,
+                    market_type_mgr=mkt,
+                    db=db,
+                )
+
+        assert await _counts() == before
+
 
 # ---------------------------------------------------------------------------
 # recalculate_learning_from_scratch
@@ -399,6 +480,31 @@ class TestRecalculateLearning:
         # Signal trackers: only S2/I2 combo from non-voided trade
         assert ("S2", "I2", "political") in sig.trackers
 
+    @pytest.mark.asyncio
+    async def test_recalculate_persists_layers_in_one_commit(self, db, sample_trade_record):
+        """The three layer saves share one transaction: a single commit, all rows written."""
+        await db.save_trade(sample_trade_record(
+            record_id="good-002", market_type="political", action="BUY_YES",
+            grok_signal_types=[{"source_tier": "S2", "info_type": "I2"}],
+            actual_outcome=True, brier_score_adjusted=0.05, voided=False,
+        ))
+        cal, mkt, sig = CalibrationManager(), MarketTypeManager(), SignalTrackerManager()
+
+        commits = 0
+        real_commit = db._conn.commit
+
+        async def _counting_commit():
+            nonlocal commits
+            commits += 1
+            await real_commit()
+
+        with patch.object(db._conn, "commit", _counting_commit):
+            await recalculate_learning_from_scratch(db, cal, mkt, sig)
+
+        assert commits == 1
+        assert "political" in await db.load_market_type_performance()
+        assert ("S2", "I2", "political") in await db.load_signal_trackers()
+
 
 # ---------------------------------------------------------------------------
 # on_trade_resolved - Brier scores and layer updates
@@ -651,7 +757,7 @@ class TestOnTradeResolved:
         with patch.object(cal, "save", new_callable=AsyncMock) as mock_cal_save, \
              patch.object(mkt, "save", new_callable=AsyncMock) as mock_mkt_save, \
              patch.object(sig, "save", new_callable=AsyncMock) as mock_sig_save, \
-             patch.object(db, "update_trade", new_callable=AsyncMock) as mock_update_trade:
+             patch.object(db, "update_trades_bulk", new_callable=AsyncMock) as mock_update_trades:
             await on_trade_resolved(
                 record=record,
                 calibration_mgr=cal,
@@ -666,4 +772,4 @@ class TestOnTradeResolved:
         mock_sig_save.assert_called_once_with(db)
 
         # Trade record should have been updated in DB
-        mock_update_trade.assert_called_once_with(record)
+        mock_update_trades.assert_called_once_with([record])
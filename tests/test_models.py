@@ -1,7 +1,7 @@
 import pytest
 from src.models import (
     CalibrationBucket, MarketTypePerformance, SignalTracker,
-    TradeRecord, SOURCE_TIER_CREDIBILITY, CALIBRATION_BUCKET_RANGES,
+    TradeRecord, SOURCE_TIER_CREDIBILITY, CALIBRATION_BUCKET_RANGES, new_record_id,
 )
 from datetime import datetime, timezone
 
@@ -54,9 +54,13 @@ class TestCalibrationBucket:
         assert b.sample_count >= 10
         assert b.get_correction() < 0.0
 
-    def test_uncertainty_uses_scipy(self):
+    def test_uncertainty_closed_form(self):
         b = CalibrationBucket((0.50, 0.60), alpha=10, beta=10)
         assert b.uncertainty > 0
+        # Normal approximation tracks the exact Beta(10, 10) 95% interval width (~0.423)
+        assert b.uncertainty == pytest.approx(0.423, rel=0.05)
+        # More evidence -> narrower interval
+        assert CalibrationBucket((0.50, 0.60), alpha=40, beta=40).uncertainty < b.uncertainty
 
 
 class TestMarketTypePerformance:
@@ -140,6 +144,21 @@ class TestSignalTracker:
         assert t.weight == 1.0
 
 
+class TestTradeRecordSignalCombos:
+    def test_pairs_deduplicated_and_incomplete_dropped(self, sample_trade_record):
+        r = sample_trade_record(grok_signal_types=[
+            {"source_tier": "S2", "info_type": "I2"},
+            {"source_tier": "S2", "info_type": "I2", "timestamp": "2026-01-01T00:00:00Z"},
+            {"source_tier": "S3"},
+            {"info_type": "I1"},
+        ])
+        assert r.signal_combos == frozenset({("S2", "I2")})
+
+    def test_no_tags(self, sample_trade_record):
+        assert sample_trade_record(grok_signal_types=[]).signal_combos == frozenset()
+        assert sample_trade_record(grok_signal_types=None).signal_combos == frozenset()
+
+
 class TestSourceTierCredibility:
     def test_all_tiers(self):
         assert SOURCE_TIER_CREDIBILITY["S1"] == 0.95
@@ -153,3 +172,17 @@ class TestSourceTierCredibility:
         assert len(CALIBRATION_BUCKET_RANGES) == 6
         assert CALIBRATION_BUCKET_RANGES[0] == (0.50, 0.60)
         assert CALIBRATION_BUCKET_RANGES[-1] == (0.95, 1.00)
+
+
+class TestNewRecordId:
+    def test_is_uuid_v7(self):
+        import uuid
+        u = uuid.UUID(new_record_id())
+        assert u.version == 7
+        assert u.variant == uuid.RFC_4122
+
+    def test_time_ordered_across_milliseconds(self):
+        import time
+        first = new_record_id()
+        time.sleep(0.002)
+        assert new_record_id() > first
@@ -11,7 +11,7 @@ import pytest
 
 from src.config import Settings
 from src.models import Market, OrderBook, OrderBookLevel
-from src.pipelines.polymarket import PolymarketClient
+from src.pipelines.polymarket import CLOB_API_BASE, GAMMA_API_BASE, PolymarketClient, _loads
 
 
 # ---------------------------------------------------------------------------
@@ -72,7 +72,7 @@ def _make_settings(**overrides) -> Settings:
 def _mock_response(status_code: int = 200, json_data=None) -> MagicMock:
     resp = MagicMock(spec=httpx.Response)
     resp.status_code = status_code
-    resp.json.return_value = json_data if json_data is not None else []
+    resp.content = json.dumps(json_data if json_data is not None else []).encode()
     resp.raise_for_status = MagicMock()
     if status_code >= 400:
         resp.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -380,6 +380,25 @@ class TestGetMarket:
         assert m.resolution == "YES"
         assert m.yes_price == pytest.approx(1.0)
 
+    @pytest.mark.asyncio
+    async def test_reuses_pooled_clients_per_api(self, client):
+        """Gamma calls share one pooled client, CLOB gets its own; aclose releases both."""
+        gamma = AsyncMock()
+        gamma.get = AsyncMock(return_value=_mock_response(json_data={"id": "m1", "question": "Q?"}))
+        clob = AsyncMock()
+        clob.get = AsyncMock(return_value=_mock_response(json_data={"bids": [], "asks": []}))
+
+        with patch("src.pipelines.polymarket.httpx.AsyncClient", side_effect=[gamma, clob]) as ctor:
+            await client.get_market("m1")
+            await client.get_market("m1")
+            await client.get_orderbook("tok-1", market_id="m1")
+            await client.aclose()
+
+        assert [c.kwargs["base_url"] for c in ctor.call_args_list] == [GAMMA_API_BASE, CLOB_API_BASE]
+        assert gamma.get.await_count == 2
+        gamma.aclose.assert_awaited_once()
+        clob.aclose.assert_awaited_once()
+
 
 # ---------------------------------------------------------------------------
 # Error handling
@@ -405,7 +424,7 @@ class TestErrorHandling:
         """HTTP 429 rate limit returns empty list."""
         mock_resp = MagicMock(spec=httpx.Response)
         mock_resp.status_code = 429
-        mock_resp.json.return_value = []
+        mock_resp.content = json.dumps([]).encode()
         # raise_for_status should NOT be called when 429 is detected early
         mock_resp.raise_for_status = MagicMock()
 
@@ -420,6 +439,26 @@ class TestErrorHandling:
         assert result == []
 
 
+# ---------------------------------------------------------------------------
+# _loads  --  JSON decoding
+# ---------------------------------------------------------------------------
+
+
+class TestLoads:
+    def test_decodes_bytes_and_str(self):
+        assert _loads(b'["0.6", "0.4"]') == ["0.6", "0.4"]
+        assert _loads('{"a": 1.5}') == {"a": 1.5}
+
+    def test_integer_beyond_64_bits_falls_back_to_stdlib(self):
+        """orjson rejects >64-bit integers; the stdlib fallback still decodes them."""
+        big = 2 ** 80
+        assert _loads(f"[{big}, 2]".encode()) == [big, 2]
+
+    def test_malformed_input_raises_json_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            _loads("[not json")
+
+
 # ---------------------------------------------------------------------------
 # place_order  --  paper mode
 # ---------------------------------------------------------------------------
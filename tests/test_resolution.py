@@ -287,6 +287,32 @@ class TestBrierScoreCalculation:
         assert abs(trade.brier_score_adjusted - expected_brier_adjusted) < 1e-9
         mock_db.update_trade.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_equity_tracks_remaining_positions_across_resolutions(self):
+        """Each resolution removes only its own position's value from equity."""
+        t1 = _make_record(market_id="m1", action="BUY_NO", position_size_usd=100.0)
+        t2 = _make_record(market_id="m2", action="BUY_NO", position_size_usd=200.0)
+        portfolio = Portfolio(
+            cash_balance=1000.0, total_equity=1600.0, peak_equity=1600.0,
+            open_positions=[
+                Position(market_id=m, side="BUY_NO", entry_price=0.6, size_usd=v, current_value=v)
+                for m, v in (("m1", 100.0), ("m2", 200.0), ("m3", 300.0))
+            ],
+        )
+        mock_db = AsyncMock()
+        mock_db.get_open_trades.return_value = [t1, t2]
+        mock_db.load_portfolio.return_value = portfolio
+        saved_equity = []
+        mock_db.save_portfolio.side_effect = lambda p, *a, **kw: saved_equity.append(p.total_equity)
+        mock_client = AsyncMock()
+        mock_client.get_market.return_value = SimpleNamespace(resolved=True, resolution="YES", yes_price=1.0)
+
+        await auto_resolve_trades(mock_db, mock_client)
+
+        # Both BUY_NO lose their stake: cash unchanged, positions drop out one by one.
+        assert saved_equity == [pytest.approx(1500.0), pytest.approx(1300.0)]
+        assert [p.market_id for p in portfolio.open_positions] == ["m3"]
+
 
 # ---------------------------------------------------------------------------
 # Test 23: Voided trade excluded from auto_resolve_trades
@@ -345,6 +371,31 @@ class TestUpdateUnrealizedAdverseMoves:
         assert abs(trade.unrealized_adverse_move - 0.12) < 1e-9
         mock_db.update_trade.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_markets_fetched_once_each_and_failures_isolated(self):
+        """Distinct markets are fetched once; a failed fetch skips only its trades."""
+        trades = [
+            _make_record(market_id="ok", action="BUY_YES", market_price_at_decision=0.60),
+            _make_record(market_id="ok", action="BUY_YES", market_price_at_decision=0.60),
+            _make_record(market_id="down", action="BUY_YES", market_price_at_decision=0.60),
+        ]
+        mock_db = AsyncMock()
+        mock_db.get_open_trades.return_value = trades
+
+        async def get_market(market_id):
+            if market_id == "down":
+                raise RuntimeError("timeout")
+            return SimpleNamespace(yes_price=0.40)
+
+        mock_client = AsyncMock()
+        mock_client.get_market.side_effect = get_market
+
+        await update_unrealized_adverse_moves(mock_db, mock_client)
+
+        assert sorted(c.args[0] for c in mock_client.get_market.await_args_list) == ["down", "ok"]
+        assert mock_db.update_trade.await_count == 2
+        assert trades[2].unrealized_adverse_move is None
+
     @pytest.mark.asyncio
     async def test_buy_yes_favorable_move(self):
         """Test 26: BUY_YES at 0.60, current price 0.65 -> adverse_move = 0 (favorable)."""
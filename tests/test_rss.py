@@ -7,6 +7,7 @@ entry limits, and the signal accumulator (poll_and_accumulate / consume_signals)
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
@@ -309,6 +310,20 @@ class TestPruneOldHeadlines:
 
         assert len(pipeline.seen_headlines) == 2
 
+    def test_prune_evicts_in_place_from_oldest(self):
+        """Pruning deletes the expired prefix from the existing dict rather than rebuilding it."""
+        pipeline = _build_pipeline()
+        now = datetime.now(timezone.utc)
+        seen = pipeline.seen_headlines
+        for i in range(3):
+            seen[f"Old {i}"] = now - timedelta(hours=30 - i)
+        seen["Recent"] = now - timedelta(hours=1)
+
+        pipeline._prune_old_headlines()
+
+        assert pipeline.seen_headlines is seen
+        assert list(seen) == ["Recent"]
+
     def test_prune_empty_dict(self):
         """Pruning an empty dict does not error."""
         pipeline = _build_pipeline()
@@ -434,6 +449,45 @@ class TestFeedParseFailure:
         assert "Good headline" in contents
 
 
+class TestConcurrentFetch:
+    @pytest.mark.asyncio
+    async def test_feeds_fetched_concurrently_on_one_client(self):
+        """Feeds are fetched at once over one pooled client; results keep config order."""
+        feeds = {f"feed{i}": {"url": f"https://f{i}.example.com/rss", "domain": "example.com"} for i in range(4)}
+        pipeline = _build_pipeline(feeds)
+        now_iso = datetime.now(timezone.utc).isoformat()
+
+        in_flight = peak = 0
+
+        async def slow_get(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            resp = MagicMock()
+            resp.content = url.encode()
+            return resp
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=slow_get)
+
+        def parse(content):
+            return _make_feed([_make_entry(f"Headline from {content.decode()}", now_iso)])
+
+        with patch("src.pipelines.rss.httpx.AsyncClient", return_value=mock_client) as ctor:
+            with patch("feedparser.parse", side_effect=parse):
+                with patch("src.pipelines.rss.classify_source_tier", return_value="S3"):
+                    signals = await pipeline.get_breaking_news()
+                    await pipeline.get_breaking_news()
+                    await pipeline.aclose()
+
+        assert peak == 4
+        assert [s.author for s in signals] == list(feeds)
+        ctor.assert_called_once()
+        mock_client.aclose.assert_awaited_once()
+
+
 # ---------------------------------------------------------------------------
 # Test: Each feed processes up to 10 entries
 # ---------------------------------------------------------------------------
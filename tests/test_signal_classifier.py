@@ -152,6 +152,16 @@ class TestS4Classification:
         }
         assert classify_source_tier(sig) == "S4"
 
+    def test_verified_expert_bio_with_pipe_and_comma_delimiters(self):
+        sig = {
+            "source_type": "twitter",
+            "account_handle": "@PipeBio",
+            "is_verified": True,
+            "follower_count": 100_000,
+            "bio": "writer|journalist,author",
+        }
+        assert classify_source_tier(sig) == "S4"
+
 
 class TestS4FailCases:
     """Situations that look like S4 but should fall to S6."""
@@ -279,6 +289,10 @@ class TestEdgeCases:
         sig = {"source_type": "rss", "domain": "https://bbc.com"}
         assert classify_source_tier(sig) == "S3"
 
+    def test_rss_domain_with_scheme_www_and_trailing_slash(self):
+        sig = {"source_type": "rss", "domain": " HTTPS://www.Reuters.com/ "}
+        assert classify_source_tier(sig) == "S2"
+
     def test_rss_domain_with_trailing_slash(self):
         sig = {"source_type": "rss", "domain": "reuters.com/"}
         assert classify_source_tier(sig) == "S2"
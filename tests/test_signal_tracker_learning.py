@@ -66,6 +66,52 @@ class TestUpdateSignalTrackers:
         assert tracker.present_in_winning_trades == 1
         assert tracker.present_in_losing_trades == 0
 
+    def test_previously_observed_combo_counted_as_absent(self, sample_trade_record):
+        """Combos seen earlier for the market type get absent_* updates; other types are untouched."""
+        mgr = SignalTrackerManager()
+        for mtype, tag in (("political", ("S2", "I2")), ("political", ("S3", "I3")), ("sports", ("S2", "I2"))):
+            mgr.update_signal_trackers(sample_trade_record(
+                market_type=mtype,
+                grok_signal_types=[{"source_tier": tag[0], "info_type": tag[1]}],
+                final_adjusted_probability=0.80,
+                actual_outcome=True,
+                voided=False,
+            ))
+
+        assert mgr.get_all_observed_combos("political") == {("S2", "I2"), ("S3", "I3")}
+        assert mgr.trackers[("S2", "I2", "political")].absent_in_winning_trades == 1
+        assert mgr.trackers[("S2", "I2", "sports")].absent_in_winning_trades == 0
+        assert mgr.get_all_observed_combos("crypto_15m") == set()
+
+        mgr.reset()
+        assert mgr.get_all_observed_combos("political") == set()
+
+    def test_losing_trade_updates_present_and_absent_losing(self, sample_trade_record):
+        """An incorrect trade counts its own combo as present-losing and the rest as absent-losing."""
+        mgr = SignalTrackerManager()
+        for tag, outcome in ((("S2", "I2"), True), (("S3", "I3"), False)):
+            mgr.update_signal_trackers(sample_trade_record(
+                market_type="political",
+                grok_signal_types=[{"source_tier": tag[0], "info_type": tag[1]}],
+                final_adjusted_probability=0.80,
+                actual_outcome=outcome,
+                voided=False,
+            ))
+
+        s3 = mgr.trackers[("S3", "I3", "political")]
+        s2 = mgr.trackers[("S2", "I2", "political")]
+        assert (s3.present_in_losing_trades, s3.present_in_winning_trades) == (1, 0)
+        assert (s2.present_in_winning_trades, s2.absent_in_losing_trades, s2.absent_in_winning_trades) == (1, 1, 0)
+
+    def test_untagged_trade_in_unseen_market_type_is_noop(self, sample_trade_record):
+        """No tags and no prior trackers for the market type -> nothing created."""
+        mgr = SignalTrackerManager()
+        mgr.update_signal_trackers(sample_trade_record(
+            market_type="weather", grok_signal_types=[], actual_outcome=True, voided=False,
+        ))
+        assert mgr.trackers == {}
+        assert "weather" not in mgr._by_market
+
 
 # ---------------------------------------------------------------------------
 # get_signal_weight
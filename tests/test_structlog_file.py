@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import logging
+import logging.handlers
+import queue
+
 import pytest
 
 # Import src.main to trigger module-level structlog and handler configuration.
@@ -19,8 +22,66 @@ class TestStructlogConfig:
         assert "stdlib" in type(factory).__module__ or "stdlib" in str(type(factory))
 
     def test_root_logger_has_file_handler(self):
-        """Verify root logger has a FileHandler for bot.log."""
+        """Verify the root logger's queue feeds a FileHandler for bot.log."""
         root = logging.getLogger()
-        file_handlers = [h for h in root.handlers if isinstance(h, logging.FileHandler)]
-        assert len(file_handlers) >= 1, "No FileHandler found on root logger"
+        assert any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers)
+        file_handlers = [h for h in src.main._log_listener.handlers if isinstance(h, logging.FileHandler)]
+        assert len(file_handlers) >= 1, "No FileHandler behind the log queue"
         assert any("bot.log" in str(h.baseFilename) for h in file_handlers)
+
+    def test_queued_record_renders_structlog_event(self):
+        """Records cross the queue unflattened, so the JSON keeps structlog's keys."""
+        import io
+        import json
+        import structlog
+
+        buf = io.StringIO()
+        handler = logging.StreamHandler(buf)
+        handler.setFormatter(src.main._formatter)
+        q = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(q, handler)
+        logger = logging.getLogger("test_queue_render")
+        logger.addHandler(src.main._LocalQueueHandler(q))
+        logger.propagate = False
+        listener.start()
+        try:
+            structlog.wrap_logger(logger, processors=src.main._shared_processors,
+                                  wrapper_class=structlog.stdlib.BoundLogger).info("queued_event", n=3)
+        finally:
+            listener.stop()
+            logger.handlers.clear()
+
+        out = json.loads(buf.getvalue())
+        assert out["event"] == "queued_event"
+        assert out["n"] == 3
+
+    def test_exception_still_rendered_on_caller_thread(self):
+        """Events with exc_info get a formatted traceback; plain events are untouched."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            import sys
+            rendered = src.main._render_exc_and_stack(None, "error", {"event": "x", "exc_info": sys.exc_info()})
+        assert "ValueError: boom" in rendered["exception"]
+        assert "exc_info" not in rendered
+
+        plain = {"event": "y"}
+        assert src.main._render_exc_and_stack(None, "info", plain) == {"event": "y"}
+
+    def test_listener_stop_and_restart_keeps_records(self, monkeypatch):
+        """After stop, records go to the handlers directly; start re-routes via the queue."""
+        root = logging.getLogger()
+        emitted = []
+        monkeypatch.setattr(src.main._file_handler, "emit", emitted.append)
+        monkeypatch.setattr(src.main._stream_handler, "emit", lambda record: None)
+        src.main._stop_log_listener()
+        try:
+            src.main._stop_log_listener()  # second stop is a no-op
+            assert not any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers)
+            logging.getLogger("after_stop").warning("late record")
+            assert [r.getMessage() for r in emitted] == ["late record"]
+        finally:
+            src.main._start_log_listener()
+        src.main._start_log_listener()  # second start is a no-op
+        assert root.handlers.count(src.main._log_queue_handler) == 1
+        assert src.main._file_handler not in root.handlers
@@ -19,6 +19,7 @@ from src.engine.trade_decision import (
     kelly_size_vwap,
     check_monk_mode,
     get_scan_mode,
+    MonkModeCache,
 )
 
 
@@ -291,6 +292,16 @@ class TestCheckMonkMode:
         assert allowed is False
         assert reason == "api_budget_exceeded"
 
+    def test_api_budget_checked_before_trade_aggregates(self):
+        """An exhausted budget blocks before today's/week's trades are scanned."""
+        from unittest.mock import patch
+        config = _monk_config(daily_api_budget_usd=8.0)
+        signal = _candidate(tier=1, position_size=100.0)
+        with patch("src.engine.trade_decision.MonkModeCache.build") as mock_build:
+            allowed, reason = check_monk_mode(config, signal, _portfolio(), [], [], 8.0)
+        assert (allowed, reason) == (False, "api_budget_exceeded")
+        mock_build.assert_not_called()
+
     def test_all_checks_pass(self):
         """All constraints satisfied -> allowed."""
         config = _monk_config()
@@ -300,6 +311,23 @@ class TestCheckMonkMode:
         assert allowed is True
         assert reason is None
 
+    def test_cache_tracks_trades_added_during_pass(self):
+        """A shared cache sees trades executed mid-pass via add_trade."""
+        config = _monk_config()
+        signal = _candidate(tier=1, position_size=100.0)
+        portfolio = _portfolio(total_equity=5000.0)
+        today = [_trade_record(tier=1, action="BUY_YES") for _ in range(4)]
+        today.append(_trade_record(tier=1, action="SKIP"))
+        cache = MonkModeCache.build(today, [_trade_record(pnl=-50.0), _trade_record(pnl=None)])
+        assert cache.tier_counts == {1: 4}
+        assert cache.week_pnl == -50.0
+
+        assert check_monk_mode(config, signal, portfolio, today, [], 0.0, cache=cache) == (True, None)
+        cache.add_trade(_trade_record(tier=1, action="BUY_NO"))
+        allowed, reason = check_monk_mode(config, signal, portfolio, today, [], 0.0, cache=cache)
+        assert allowed is False
+        assert reason == "tier1_daily_cap_reached"
+
 
 # ---------------------------------------------------------------------------
 # 6. get_scan_mode
@@ -10,6 +10,7 @@ import pytest
 
 from src.models import Market, TradeCandidate, Position
 from src.engine.trade_ranker import (
+    _jaccard_ge,
     _keyword_overlap,
     check_cluster_exposure,
     detect_market_clusters,
@@ -191,6 +192,16 @@ class TestClusterDetection:
         clusters = detect_market_clusters([c1, c2])
         assert clusters[c1.market.market_id] != clusters[c2.market.market_id]
 
+    def test_window_measured_from_cluster_seed(self):
+        """A chain 0h -> 0.9h -> 1.8h does not transitively merge: the 1h window
+        is measured from the earliest (seed) market of the cluster."""
+        cs = [_candidate(resolution_hours=h, market_overrides={"keywords": ["fed", "rates"]})
+              for h in (1.8, 0.0, 0.9)]
+        clusters = detect_market_clusters(cs)
+        late, seed, mid = (clusters[c.market.market_id] for c in cs)
+        assert seed == mid
+        assert late != seed
+
 
 # ---------------------------------------------------------------------------
 # 4. Keyword overlap (Jaccard)
@@ -209,6 +220,19 @@ class TestKeywordOverlap:
         assert _keyword_overlap(["trump"], []) == 0.0
         assert _keyword_overlap([], []) == 0.0
 
+    def test_jaccard_ge_matches_overlap(self):
+        """_jaccard_ge agrees with the float Jaccard, including the exact threshold."""
+        pairs = [
+            (["a", "b"], ["a", "c"]),            # 1/3
+            (["a", "b"], ["a", "b", "c"]),       # 2/3
+            (["a", "b", "c", "d"], ["a", "b"]),  # exactly 0.5
+            (["a"], ["a", "b", "c"]),            # size ratio rules it out
+            (["a"], []),
+        ]
+        for kw1, kw2 in pairs:
+            expected = _keyword_overlap(kw1, kw2) >= 0.5
+            assert _jaccard_ge(frozenset(kw1), frozenset(kw2), 0.5) is expected
+
 
 # ---------------------------------------------------------------------------
 # 5. Edge cases